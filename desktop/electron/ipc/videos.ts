@@ -1,4 +1,4 @@
-import { ipcMain, dialog } from 'electron'
+import { ipcMain, dialog, type IpcMainInvokeEvent } from 'electron'
 import axios from 'axios'
 import FormData from 'form-data'
 import fs from 'fs'
@@ -29,39 +29,43 @@ export function registerVideoHandlers() {
     }
   })
 
-  // Upload video with progress
+  // Add video to the library
+  // The backend runs on this machine, so it ingests the file by path
+  // (hardlink/reflink/reference) instead of receiving a multipart upload
   ipcMain.handle('videos:upload', async (event, filePath: string, title: string) => {
     try {
-      const formData = new FormData()
-
-      // Read file from path
-      const fileBuffer = fs.readFileSync(filePath)
-      const fileName = filePath.split('/').pop() || 'video.mp4'
-      formData.append('file', fileBuffer, fileName)
-      formData.append('title', title)
-
-      const response = await axios.post(`${API_BASE_URL}/videos/upload`, formData, {
-        headers: formData.getHeaders(),
-        maxContentLength: Infinity,
-        maxBodyLength: Infinity,
-        timeout: LONG_OPERATION_TIMEOUT, // 5 minutes for large uploads
-        onUploadProgress: (progressEvent) => {
-          const progress = progressEvent.total
-            ? Math.round((progressEvent.loaded * 100) / progressEvent.total)
-            : 0
-
-          // Send progress to renderer
-          event.sender.send('videos:upload-progress', { progress })
-        }
+      const response = await axios.post(`${API_BASE_URL}/videos/ingest`, {
+        video_path: filePath,
+        title
+      }, {
+        timeout: LONG_OPERATION_TIMEOUT // Hashing multi-GB files takes a while
       })
 
+      event.sender.send('videos:upload-progress', { progress: 100 })
+
       return response.data
     } catch (error) {
+      const detail = axios.isAxiosError(error) ? error.response?.data?.detail : undefined
+      if (typeof detail === 'string' && detail.startsWith('File not found')) {
+        // Backend cannot see this path (e.g. remote backend); fall back to uploading
+        return uploadVideoFile(event, filePath, title)
+      }
       console.error('Failed to upload video:', error)
       throw new Error(`Failed to upload video: ${error}`)
     }
   })
 
+  // Get ingest job status
+  ipcMain.handle('videos:get-job', async (_, jobId: string) => {
+    try {
+      const response = await axios.get(`${API_BASE_URL}/jobs/${jobId}`)
+      return response.data
+    } catch (error) {
+      console.error('Failed to fetch job:', error)
+      throw new Error(`Failed to fetch job: ${error}`)
+    }
+  })
+
   // Delete video
   ipcMain.handle('videos:delete', async (_, videoId: string) => {
     try {
@@ -100,3 +104,35 @@ export function registerVideoHandlers() {
     return result.filePaths[0]
   })
 }
+
+// Multipart upload for backends that cannot read the local file
+async function uploadVideoFile(event: IpcMainInvokeEvent, filePath: string, title: string) {
+  try {
+    const formData = new FormData()
+
+    // Stream the file instead of reading it into memory
+    const fileName = filePath.split('/').pop() || 'video.mp4'
+    formData.append('file', fs.createReadStream(filePath), fileName)
+    formData.append('title', title)
+
+    const response = await axios.post(`${API_BASE_URL}/videos/upload`, formData, {
+      headers: formData.getHeaders(),
+      maxContentLength: Infinity,
+      maxBodyLength: Infinity,
+      timeout: LONG_OPERATION_TIMEOUT, // 5 minutes for large uploads
+      onUploadProgress: (progressEvent) => {
+        const progress = progressEvent.total
+          ? Math.round((progressEvent.loaded * 100) / progressEvent.total)
+          : 0
+
+        // Send progress to renderer
+        event.sender.send('videos:upload-progress', { progress })
+      }
+    })
+
+    return response.data
+  } catch (error) {
+    console.error('Failed to upload video:', error)
+    throw new Error(`Failed to upload video: ${error}`)
+  }
+}
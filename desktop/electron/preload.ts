@@ -1,7 +1,7 @@
 import { contextBridge, ipcRenderer } from 'electron'
 import type { AppSettings } from '../src/types/settings'
 import type { HealthCheckResponse } from '../src/types/backend'
-import type { Video, VideoChunk, VideoUploadRequest } from '../src/types/video'
+import type { Video, VideoChunk, VideoUploadRequest, IngestJob } from '../src/types/video'
 import type { SearchOptions, SearchResult } from '../src/types/search'
 import type { ChatRequest } from '../src/types/chat'
 
@@ -27,6 +27,7 @@ contextBridge.exposeInMainWorld('electron', {
     upload: (filePath: string, title: string) => ipcRenderer.invoke('videos:upload', filePath, title) as Promise<Video>,
     delete: (videoId: string) => ipcRenderer.invoke('videos:delete', videoId) as Promise<void>,
     getChunks: (videoId: string) => ipcRenderer.invoke('videos:get-chunks', videoId) as Promise<{video_id: string, num_chunks: number, chunks: VideoChunk[]}>,
+    getJob: (jobId: string) => ipcRenderer.invoke('videos:get-job', jobId) as Promise<IngestJob>,
     onUploadProgress: (callback: (data: { progress: number }) => void) => {
       ipcRenderer.on('videos:upload-progress', (_, data) => callback(data))
     }
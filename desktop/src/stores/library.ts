@@ -134,7 +134,11 @@ export const useLibraryStore = defineStore('library', () => {
 
       // Replace placeholder with actual video
       const idx = videos.value.findIndex(v => v.video_id === tempId)
-      if (idx >= 0) {
+      const alreadyInLibrary = videos.value.some(v => v.video_id === response.video_id)
+      if (idx >= 0 && alreadyInLibrary) {
+        // Identical content was uploaded before; the backend returned that video
+        videos.value.splice(idx, 1)
+      } else if (idx >= 0) {
         videos.value[idx] = {
           ...response,
           status: 'processing',
@@ -144,6 +148,12 @@ export const useLibraryStore = defineStore('library', () => {
 
       delete uploadProgress.value[tempId]
 
+      // Processing runs as a background job on the backend
+      const jobId = (response as { job_id?: string | null }).job_id
+      if (jobId && !alreadyInLibrary) {
+        watchJob(response.video_id, jobId)
+      }
+
       return response.video_id
     } catch (err) {
       // Mark as failed
@@ -157,6 +167,37 @@ export const useLibraryStore = defineStore('library', () => {
     }
   }
 
+  function watchJob(videoId: string, jobId: string, intervalMs = 2000) {
+    const poll = async () => {
+      try {
+        const job = await window.electron.videos.getJob(jobId)
+        const idx = videos.value.findIndex(v => v.video_id === videoId)
+        if (idx < 0) return  // Video was removed from the library
+
+        if (job.status === 'completed') {
+          const video = await window.electron.videos.get(videoId)
+          videos.value[idx] = { ...video, status: determineStatus(video) }
+          delete uploadProgress.value[videoId]
+          return
+        }
+
+        if (job.status === 'failed') {
+          videos.value[idx].status = 'failed'
+          videos.value[idx].error = job.error || 'Processing failed'
+          delete uploadProgress.value[videoId]
+          return
+        }
+
+        uploadProgress.value[videoId] = job.progress.percent ?? 0
+      } catch (err) {
+        console.error('Error polling job:', err)
+      }
+      setTimeout(poll, intervalMs)
+    }
+
+    poll()
+  }
+
   async function deleteVideo(videoId: string) {
     try {
       await window.electron.videos.delete(videoId)
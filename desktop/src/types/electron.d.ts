@@ -1,6 +1,6 @@
 import type { AppSettings } from './settings'
 import type { HealthCheckResponse } from './backend'
-import type { Video, VideoChunk } from './video'
+import type { Video, VideoChunk, IngestJob } from './video'
 import type { SearchResult } from './search'
 import type { ChatRequest } from './chat'
 
@@ -28,6 +28,7 @@ declare global {
         upload: (filePath: string, title: string) => Promise<Video>
         delete: (videoId: string) => Promise<void>
         getChunks: (videoId: string) => Promise<{video_id: string, num_chunks: number, chunks: VideoChunk[]}>
+        getJob: (jobId: string) => Promise<IngestJob>
         onUploadProgress: (callback: (data: { progress: number }) => void) => void
       }
       search: {
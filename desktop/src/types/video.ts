@@ -65,6 +65,25 @@ export interface ProcessingStatus {
   message?: string
 }
 
+/**
+ * Background ingest job (GET /jobs/{job_id})
+ */
+export interface IngestJob {
+  job_id: string
+  video_id: string
+  kind: 'process' | 'resume'
+  status: 'queued' | 'running' | 'completed' | 'failed'
+  progress: {
+    stage?: string
+    chunk_id?: string | null
+    stages?: Record<string, { completed: number, total: number }>
+    percent?: number
+  }
+  error: string | null
+  created_at: string
+  updated_at: string
+}
+
 /**
  * A time-based segment of a video with extracted content
  */
@@ -220,6 +239,12 @@ export function getThumbnailUrl(framePath: string | undefined): string | undefin
 
   const API_BASE_URL = 'http://localhost:8000'
 
+  // Packed frames ("data/frames/vid_123/frames.pack#1500") are served by timestamp
+  const packed = framePath.match(/([^/\\]+)[/\\]frames\.pack#(\d+)$/)
+  if (packed) {
+    return `${API_BASE_URL}/videos/${packed[1]}/frames/${packed[2]}`
+  }
+
   // Remove leading "data/" if present
   let cleanPath = framePath.replace(/^data\//, '')
 
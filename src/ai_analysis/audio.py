@@ -0,0 +1,128 @@
+"""
+Audio Track
+Whole-video audio extracted once and sliced per chunk in memory
+"""
+import subprocess
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+from src.core.exceptions import AIAnalysisError
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000  # 16kHz sample rate (Whisper requirement)
+
+
+class AudioTrack:
+    """
+    16kHz mono float32 PCM for a whole video, memory-mapped from disk
+
+    The samples are stored in the exact layout faster-whisper consumes, so
+    slicing a chunk yields a NumPy view with no decode or copy.
+    """
+
+    def __init__(self, pcm_path: Path):
+        self.pcm_path = Path(pcm_path)
+
+        if self.pcm_path.stat().st_size == 0:
+            # np.memmap cannot map an empty file (e.g. a silent/no-audio source)
+            self.samples = np.zeros(0, dtype=np.float32)
+        else:
+            self.samples = np.memmap(self.pcm_path, dtype=np.float32, mode="r")
+
+        self._speech_regions: Optional[list[tuple[float, float]]] = None
+
+    @classmethod
+    def extract(cls, video_path: str, output_path: Path) -> "AudioTrack":
+        """
+        Extract the full audio track with one ffmpeg invocation
+        Returns AudioTrack backed by a raw float32 PCM file
+        """
+        cmd = [
+            "ffmpeg",
+            "-i",
+            video_path,
+            "-vn",  # No video
+            "-f",
+            "f32le",  # Raw little-endian float32 PCM, memory-mappable as-is
+            "-acodec",
+            "pcm_f32le",
+            "-ar",
+            str(SAMPLE_RATE),
+            "-ac",
+            "1",  # Mono
+            "-y",  # Overwrite output file
+            str(output_path),
+        ]
+
+        try:
+            subprocess.run(cmd, check=True, capture_output=True)
+            logger.debug(f"Extracted audio track: {output_path}")
+            return cls(output_path)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"ffmpeg error: {e.stderr.decode()}")
+            raise AIAnalysisError(f"Audio track extraction failed: {e}")
+
+    @property
+    def duration(self) -> float:
+        """Track duration in seconds"""
+        return len(self.samples) / SAMPLE_RATE
+
+    def slice(self, start_time: float, end_time: float) -> np.ndarray:
+        """Samples between start_time and end_time (a view, not a copy)"""
+        start = max(0, int(start_time * SAMPLE_RATE))
+        end = min(len(self.samples), int(end_time * SAMPLE_RATE))
+        return self.samples[start:max(start, end)]
+
+    def speech_regions(self) -> list[tuple[float, float]]:
+        """
+        Speech regions of the whole track as (start, end) seconds
+        Computed once with the Silero VAD bundled with faster-whisper, which is far
+        cheaper than a Whisper decode
+        """
+        if self._speech_regions is None:
+            if len(self.samples) == 0:
+                self._speech_regions = []
+            else:
+                try:
+                    timestamps = get_speech_timestamps(
+                        self.samples, VadOptions(), sampling_rate=SAMPLE_RATE
+                    )
+                except Exception as e:
+                    # Never drop transcripts because the pre-pass failed
+                    logger.warning(f"Speech pre-pass failed, assuming speech: {e}")
+                    timestamps = [{"start": 0, "end": len(self.samples)}]
+
+                self._speech_regions = [
+                    (ts["start"] / SAMPLE_RATE, ts["end"] / SAMPLE_RATE)
+                    for ts in timestamps
+                ]
+                speech_seconds = sum(end - start for start, end in self._speech_regions)
+                logger.info(
+                    f"Speech pre-pass: {speech_seconds:.1f}s of speech "
+                    f"in {self.duration:.1f}s of audio"
+                )
+
+        return self._speech_regions
+
+    def has_speech(
+        self, start_time: float, end_time: float, min_speech_seconds: float = 0.0
+    ) -> bool:
+        """Check whether [start_time, end_time) has more than min_speech_seconds of speech"""
+        speech_seconds = 0.0
+        for region_start, region_end in self.speech_regions():
+            overlap = min(end_time, region_end) - max(start_time, region_start)
+            if overlap > 0:
+                speech_seconds += overlap
+                if speech_seconds > min_speech_seconds:
+                    return True
+        return False
+
+    def close(self):
+        """Drop the memory map so the backing file can be removed"""
+        # The map is unmapped once no slice references it any more
+        self.samples = np.zeros(0, dtype=np.float32)
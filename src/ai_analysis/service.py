@@ -2,20 +2,28 @@
 AI Analysis Service
 Handles audio transcription and visual scene description
 """
+import asyncio
+import json
 import subprocess
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Coroutine, Optional, TypeVar, Union
 
-from faster_whisper import WhisperModel
+import numpy as np
 from google import genai
 from google.genai import types
 
 from src.core.config import settings
 from src.core.exceptions import AIAnalysisError
+from src.ai_analysis.audio import AudioTrack
+from src.ai_analysis.whisper_pool import get_whisper_model, get_batched_pipeline
+from src.video_processing.frame_store import read_frame
+from src.utils.concurrency import run_sync
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class AIAnalyzer:
     """Handles AI-powered analysis of video chunks"""
@@ -25,19 +33,46 @@ class AIAnalyzer:
         self.gcp_location = settings.GCP_LOCATION
         self.gemini_model = settings.GEMINI_MODEL
 
-        # Initialize Gemini client with Vertex AI
-        self.gemini_client = genai.Client(
-            vertexai=True,
-            project=self.gcp_project_id,
-            location=self.gcp_location,
-        )
+        # Whisper model for transcription, shared process-wide (loaded once)
+        # Size, compute type and threading come from settings (WHISPER_*)
+        self.whisper_model = get_whisper_model()
+
+        # Gemini clients (Vertex AI), one per event loop (see _aio_models)
+        # Synchronous entry points run the async methods through _run_sync
+        self._aio_clients: dict[asyncio.AbstractEventLoop, genai.Client] = {}
+
+    @property
+    def _aio_models(self):
+        """Async Gemini models API bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._aio_clients.get(loop)
+        if client is None:
+            # The async HTTP session must not outlive the loop it was used on;
+            # aclose() releases it before the loop ends
+            client = genai.Client(
+                vertexai=True,
+                project=self.gcp_project_id,
+                location=self.gcp_location,
+            )
+            self._aio_clients[loop] = client
+        return client.aio.models
+
+    async def aclose(self):
+        """Close the Gemini client opened on the running event loop, if any"""
+        client = self._aio_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aio.aclose()
+
+    def _run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run an async method from synchronous code, closing its Gemini client after"""
+
+        async def run() -> T:
+            try:
+                return await coro
+            finally:
+                await self.aclose()
 
-        # Initialize Whisper model for transcription
-        # Using base model for balance between speed and accuracy
-        # Options: tiny, base, small, medium, large-v2, large-v3
-        logger.info("Loading Whisper model...")
-        self.whisper_model = WhisperModel("base", device="cpu", compute_type="int8")
-        logger.info("Whisper model loaded!")
+        return run_sync(run())
 
     def extract_audio_from_chunk(
         self, video_path: str, start_time: float, end_time: float, output_path: str
@@ -74,24 +109,42 @@ class AIAnalyzer:
             logger.error(f"ffmpeg error: {e.stderr.decode()}")
             raise AIAnalysisError(f"Audio extraction failed: {e}")
 
-    def transcribe_audio(self, audio_path: str) -> str:
+    def extract_audio_track(
+        self, video_path: str, output_path: Path
+    ) -> Optional[AudioTrack]:
+        """
+        Extract the whole video's audio once for in-memory slicing per chunk
+        Returns AudioTrack, or None if the video has no usable audio
+        """
+        try:
+            return AudioTrack.extract(video_path, output_path)
+        except AIAnalysisError as e:
+            logger.warning(f"No audio track available: {e}")
+            return None
+
+    def transcribe_audio(self, audio: Union[str, np.ndarray]) -> str:
         """
         Transcribe audio using faster-whisper with enhanced conversation context
+        Accepts a WAV path or 16kHz mono float32 samples
         Returns formatted transcript with speaker changes, pauses, and sound descriptions
         """
-        if not Path(audio_path).exists():
-            logger.warning(f"Audio file not found: {audio_path}")
+        return self._run_sync(self._finalize_transcript(self.transcribe_audio_raw(audio)))
+
+    def transcribe_audio_raw(self, audio: Union[str, np.ndarray]) -> str:
+        """
+        Transcribe audio using faster-whisper without Gemini enhancement
+        Returns raw transcript with [pause] markers ("" on silence or error)
+        """
+        if isinstance(audio, str) and not Path(audio).exists():
+            logger.warning(f"Audio file not found: {audio}")
+            return ""
+
+        if isinstance(audio, np.ndarray) and audio.size == 0:
+            logger.debug("Empty audio slice")
             return ""
 
         try:
-            # Transcribe with faster-whisper
-            segments, info = self.whisper_model.transcribe(
-                audio_path,
-                beam_size=5,
-                language="en",  # Set to None for auto-detection
-                vad_filter=True,  # Voice activity detection
-                word_timestamps=True,  # Get word-level timestamps
-            )
+            segments = self._run_whisper(audio)
 
             # Build enhanced transcript with conversation context
             transcript_parts = []
@@ -99,40 +152,167 @@ class AIAnalyzer:
 
             for segment in segments:
                 # Detect pauses (gaps > 1 second indicate speaker change or pause)
-                if segment.start - prev_end_time > 1.0:
+                if segment["start"] - prev_end_time > 1.0:
                     transcript_parts.append("[pause]")
 
                 # Add the segment text
-                text = segment.text.strip()
+                text = segment["text"].strip()
                 if text:
                     transcript_parts.append(text)
 
-                prev_end_time = segment.end
+                prev_end_time = segment["end"]
 
             # Combine transcript
-            raw_transcript = " ".join(transcript_parts)
+            return " ".join(transcript_parts)
 
-            if not raw_transcript or raw_transcript.strip() == "":
-                logger.debug("No speech detected in audio")
-                return ""
+        except Exception as e:
+            logger.error(f"Transcription error: {e}")
+            return ""
 
-            # Enhance with Gemini to add conversation/sound context
-            enhanced_transcript = self._enhance_transcript_with_context(raw_transcript)
+    def transcribe_video(self, audio_track: AudioTrack) -> Optional[list[dict]]:
+        """
+        Transcribe a whole video's audio track in a single Whisper run
+        Chunk transcripts are then assembled with build_chunk_transcript, so
+        overlaps are not transcribed twice and sentences are not cut at chunk
+        boundaries
+
+        Returns list of segment dicts (absolute times in seconds), or None if
+        transcription failed and chunks should be transcribed individually:
+            {"start", "end", "text", "words": [{"start", "end", "word"}]}
+        """
+        if audio_track.duration == 0:
+            return []
 
-            logger.debug(f"Transcription complete: {len(enhanced_transcript)} chars")
-            return enhanced_transcript
+        if settings.SPEECH_PREPASS_ENABLED and not audio_track.speech_regions():
+            logger.info("No speech in audio track - skipping transcription")
+            return []
 
+        try:
+            segments = self._run_whisper(audio_track.samples)
+            logger.info(
+                f"Transcribed {audio_track.duration:.1f}s of audio "
+                f"into {len(segments)} segments"
+            )
+            return segments
         except Exception as e:
-            logger.error(f"Transcription error: {e}")
+            logger.error(f"Video transcription error: {e}")
+            return None
+
+    def build_chunk_transcript(
+        self, segments: list[dict], start_time: float, end_time: float
+    ) -> str:
+        """
+        Build a chunk's raw transcript from video-level segments
+        A word belongs to the chunk when its midpoint falls in [start_time, end_time);
+        segments without word timings are assigned by their own midpoint
+        """
+        transcript_parts = []
+        prev_end_time = start_time
+
+        for segment in segments:
+            if segment["end"] <= start_time:
+                continue
+            if segment["start"] >= end_time:
+                break
+
+            words = [
+                word
+                for word in segment["words"]
+                if start_time <= (word["start"] + word["end"]) / 2 < end_time
+            ]
+
+            if words:
+                text = "".join(word["word"] for word in words).strip()
+                segment_start, segment_end = words[0]["start"], words[-1]["end"]
+            elif not segment["words"] and (
+                start_time <= (segment["start"] + segment["end"]) / 2 < end_time
+            ):
+                text = segment["text"].strip()
+                segment_start, segment_end = segment["start"], segment["end"]
+            else:
+                continue
+
+            # Detect pauses (gaps > 1 second indicate speaker change or pause)
+            if segment_start - prev_end_time > 1.0:
+                transcript_parts.append("[pause]")
+
+            if text:
+                transcript_parts.append(text)
+
+            prev_end_time = segment_end
+
+        return " ".join(transcript_parts)
+
+    def _run_whisper(self, audio: Union[str, np.ndarray]) -> list[dict]:
+        """
+        Run faster-whisper and materialize its segments with word timestamps
+        Returns list of segment dicts with times relative to the audio start
+        """
+        transcribe_options = {
+            "beam_size": 5,
+            "language": "en",  # Set to None for auto-detection
+            "vad_filter": True,  # Voice activity detection
+            "word_timestamps": True,  # Get word-level timestamps
+        }
+
+        # Transcribe with faster-whisper
+        if settings.WHISPER_BATCH_SIZE > 0:
+            # Batched inference decodes several speech segments per forward pass
+            segments, info = get_batched_pipeline().transcribe(
+                audio, batch_size=settings.WHISPER_BATCH_SIZE, **transcribe_options
+            )
+        else:
+            segments, info = self.whisper_model.transcribe(audio, **transcribe_options)
+
+        return [
+            {
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "words": [
+                    {"start": word.start, "end": word.end, "word": word.word}
+                    for word in (segment.words or [])
+                ],
+            }
+            for segment in segments
+        ]
+
+    async def _finalize_transcript(self, raw_transcript: str) -> str:
+        """Enhance a non-empty raw transcript with conversation context"""
+        if not raw_transcript or raw_transcript.strip() == "":
+            logger.debug("No speech detected in audio")
             return ""
 
-    def _enhance_transcript_with_context(self, raw_transcript: str) -> str:
+        enhanced_transcript = await self._enhance_transcript_with_context(raw_transcript)
+
+        logger.debug(f"Transcription complete: {len(enhanced_transcript)} chars")
+        return enhanced_transcript
+
+    async def _enhance_transcript_with_context(self, raw_transcript: str) -> str:
         """
         Enhance transcript with conversation context using Gemini
         Adds speaker identification, conversation flow, and sound descriptions
         """
         try:
-            prompt = f"""Analyze this audio transcript and enhance it with conversation context.
+            response = await self._aio_models.generate_content(
+                model=self.gemini_model,
+                contents=self._enhancement_prompt(raw_transcript),
+                config=self._enhancement_config(),
+            )
+
+            enhanced = response.text.strip()
+
+            # Combine raw transcript with enhanced context
+            return f"{enhanced} Transcript: {raw_transcript}"
+
+        except Exception as e:
+            logger.warning(f"Transcript enhancement error: {e}")
+            # Return raw transcript if enhancement fails
+            return raw_transcript
+
+    def _enhancement_prompt(self, raw_transcript: str) -> str:
+        """Prompt for enhancing a raw transcript with conversation context"""
+        return f"""Analyze this audio transcript and enhance it with conversation context.
 
 Raw transcript:
 {raw_transcript}
@@ -149,26 +329,18 @@ Example output format:
 "A casual conversation between two people. Person A asks about a watch, Person B explains it was a gift from their grandfather. The tone is nostalgic and friendly."
 """
 
-            response = self.gemini_client.models.generate_content(
-                model=self.gemini_model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.3,
-                    max_output_tokens=200,
-                ),
-            )
-
-            enhanced = response.text.strip()
-
-            # Combine raw transcript with enhanced context
-            return f"{enhanced} Transcript: {raw_transcript}"
-
-        except Exception as e:
-            logger.warning(f"Transcript enhancement error: {e}")
-            # Return raw transcript if enhancement fails
-            return raw_transcript
+    def _enhancement_config(self) -> types.GenerateContentConfig:
+        """Generation config for transcript enhancement"""
+        return types.GenerateContentConfig(
+            temperature=0.3,
+            max_output_tokens=200,
+        )
 
     def describe_frames(self, frame_paths: list[str], chunk_info: dict) -> str:
+        """Synchronous wrapper around adescribe_frames"""
+        return self._run_sync(self.adescribe_frames(frame_paths, chunk_info))
+
+    async def adescribe_frames(self, frame_paths: list[str], chunk_info: dict) -> str:
         """
         Generate visual description of video chunk using Gemini
         Samples frames from the chunk and describes what's happening
@@ -178,36 +350,31 @@ Example output format:
             return ""
 
         try:
-            # Sample frames evenly across the chunk (max 10 frames for API limits)
-            max_frames = 10
-            if len(frame_paths) > max_frames:
-                step = len(frame_paths) // max_frames
-                sampled_frames = frame_paths[::step][:max_frames]
-            else:
-                sampled_frames = frame_paths
-
-            # Read and encode frames
-            frame_parts = []
-            for frame_path in sampled_frames:
-                if not Path(frame_path).exists():
-                    logger.warning(f"Frame not found: {frame_path}")
-                    continue
-
-                # Read image
-                with open(frame_path, "rb") as f:
-                    image_data = f.read()
-
-                # Create image part for Gemini
-                frame_parts.append(
-                    types.Part.from_bytes(data=image_data, mime_type="image/jpeg")
-                )
+            # Reading frames is blocking file I/O
+            frame_parts = await asyncio.to_thread(
+                self._load_frame_parts, frame_paths, 10
+            )
 
             if not frame_parts:
                 logger.error("No valid frames found for description")
                 return ""
 
-            # Create prompt for visual description
-            prompt = f"""Analyze these frames from a video clip (duration: {chunk_info['duration']:.1f}s, from {chunk_info['start_time']:.1f}s to {chunk_info['end_time']:.1f}s).
+            response = await self._aio_models.generate_content(
+                model=self.gemini_model,
+                contents=[self._description_prompt(chunk_info)] + frame_parts,
+            )
+
+            description = response.text.strip()
+            logger.debug(f"Visual description generated: {len(description)} chars")
+            return description
+
+        except Exception as e:
+            logger.error(f"Frame description error: {e}")
+            return ""
+
+    def _description_prompt(self, chunk_info: dict) -> str:
+        """Prompt for describing a chunk's frames"""
+        return f"""Analyze these frames from a video clip (duration: {chunk_info['duration']:.1f}s, from {chunk_info['start_time']:.1f}s to {chunk_info['end_time']:.1f}s).
 
 Provide a concise description (2-3 sentences) covering:
 1. What is happening in the scene
@@ -216,18 +383,34 @@ Provide a concise description (2-3 sentences) covering:
 
 Be specific and descriptive but concise."""
 
-            # Generate description with Gemini
-            response = self.gemini_client.models.generate_content(
-                model=self.gemini_model, contents=[prompt] + frame_parts
+    def _load_frame_parts(
+        self, frame_paths: list[str], max_frames: int
+    ) -> list[types.Part]:
+        """
+        Sample up to max_frames frames evenly and load them as Gemini image parts
+        Missing frames are skipped
+        """
+        if len(frame_paths) > max_frames:
+            step = len(frame_paths) // max_frames
+            sampled_frames = frame_paths[::step][:max_frames]
+        else:
+            sampled_frames = frame_paths
+
+        # Read and encode frames
+        frame_parts = []
+        for frame_path in sampled_frames:
+            # Read image (loose file or packed frame)
+            image_data = read_frame(frame_path)
+            if image_data is None:
+                logger.warning(f"Frame not found: {frame_path}")
+                continue
+
+            # Create image part for Gemini
+            frame_parts.append(
+                types.Part.from_bytes(data=image_data, mime_type="image/jpeg")
             )
 
-            description = response.text.strip()
-            logger.debug(f"Visual description generated: {len(description)} chars")
-            return description
-
-        except Exception as e:
-            logger.error(f"Frame description error: {e}")
-            return ""
+        return frame_parts
 
     def analyze_chunk(
         self,
@@ -235,46 +418,250 @@ Be specific and descriptive but concise."""
         chunk_info: dict,
         frame_paths: list[str],
         temp_dir: Path,
+        audio_track: Optional[AudioTrack] = None,
+        transcript_segments: Optional[list[dict]] = None,
     ) -> dict:
         """
         Perform complete AI analysis on a video chunk
+        Chunks without speech (per the audio_track VAD pre-pass) skip
+        transcription and enhancement entirely.
+        When transcript_segments (from transcribe_video) are given, the chunk's
+        transcript is assembled from them without running Whisper again.
+        Otherwise, when audio_track is given, the chunk's samples are sliced from
+        it in memory instead of extracting a WAV per chunk
         Returns dict with transcript and visual_description
         """
+        logger.info(f"AI Analysis for {chunk_info['chunk_id']}...")
+
+        # 1. Extract and transcribe audio
+        raw_transcript = self.get_raw_transcript(
+            video_path, chunk_info, temp_dir, audio_track, transcript_segments
+        )
+
+        # 2. Enhance the transcript and describe visual content (concurrently)
+        return self._run_sync(self.adescribe_chunk(chunk_info, frame_paths, raw_transcript))
+
+    async def adescribe_chunk(
+        self, chunk_info: dict, frame_paths: list[str], raw_transcript: str
+    ) -> dict:
+        """
+        Gemini half of analyze_chunk for an already transcribed chunk
+        Transcript enhancement and frame description run concurrently
+        Returns dict with transcript and visual_description
+        """
+        transcript, visual_description = await asyncio.gather(
+            self._finalize_transcript(raw_transcript),
+            self.adescribe_frames(frame_paths, chunk_info),
+        )
+
+        return {
+            "audio_transcript": transcript,
+            "visual_description": visual_description,
+        }
+
+    async def adescribe_chunks_batch(
+        self, chunks: list[tuple[dict, list[str]]], raw_transcripts: list[str]
+    ) -> list[dict]:
+        """
+        Analyze several already transcribed chunks with a single Gemini request
+        Transcript enhancement and frame description for all chunks are
+        requested together as a JSON array with one entry per chunk. Chunks
+        whose entry is missing or unparseable fall back to the per-chunk calls.
+
+        Args:
+            chunks: List of (chunk_info, frame_paths) tuples
+            raw_transcripts: Raw transcript of each chunk (see get_raw_transcript)
+
+        Returns:
+            List of dicts with transcript and visual_description, in input order
+        """
+        batch_results = await self._request_batch_analysis(chunks, raw_transcripts)
+
+        async def resolve(chunk_info, frame_paths, raw_transcript) -> dict:
+            entry = batch_results.get(chunk_info["chunk_id"])
+
+            if entry and entry.get("visual_description") and frame_paths:
+                visual_description = entry["visual_description"].strip()
+            else:
+                logger.debug(f"Batch entry missing for {chunk_info['chunk_id']}")
+                visual_description = await self.adescribe_frames(
+                    frame_paths, chunk_info
+                )
+
+            if not raw_transcript.strip():
+                transcript = ""
+            elif entry and entry.get("transcript_context"):
+                # Same shape as _enhance_transcript_with_context
+                transcript = (
+                    f"{entry['transcript_context'].strip()} Transcript: {raw_transcript}"
+                )
+            else:
+                transcript = await self._finalize_transcript(raw_transcript)
+
+            return {
+                "audio_transcript": transcript,
+                "visual_description": visual_description,
+            }
+
+        return list(
+            await asyncio.gather(
+                *(
+                    resolve(chunk_info, frame_paths, raw_transcript)
+                    for (chunk_info, frame_paths), raw_transcript in zip(
+                        chunks, raw_transcripts
+                    )
+                )
+            )
+        )
+
+    async def _request_batch_analysis(
+        self, chunks: list[tuple[dict, list[str]]], raw_transcripts: list[str]
+    ) -> dict[str, dict]:
+        """
+        Send one Gemini request covering several chunks
+        Returns dict mapping chunk_id -> {"visual_description", "transcript_context"}
+        (empty if the response could not be parsed)
+        """
+        try:
+            contents = await asyncio.to_thread(
+                self._batch_analysis_contents, chunks, raw_transcripts
+            )
+            response = await self._aio_models.generate_content(
+                model=self.gemini_model,
+                contents=contents,
+                config=self._batch_analysis_config(),
+            )
+            return self._parse_batch_response(response.text, len(chunks))
+
+        except Exception as e:
+            logger.warning(f"Batch analysis failed, falling back to per-chunk calls: {e}")
+            return {}
+
+    def _batch_analysis_contents(
+        self, chunks: list[tuple[dict, list[str]]], raw_transcripts: list[str]
+    ) -> list:
+        """Prompt parts (text headers + frames) for a batched analysis request"""
+        contents = [
+            f"""You will analyze {len(chunks)} consecutive clips from the same video.
+Each clip is introduced by a header with its chunk_id, followed by its raw audio transcript and a few frames."""
+        ]
+
+        for (chunk_info, frame_paths), raw_transcript in zip(chunks, raw_transcripts):
+            contents.append(
+                f"""
+=== chunk_id: {chunk_info['chunk_id']} ===
+Time range: {chunk_info['start_time']:.1f}s - {chunk_info['end_time']:.1f}s (duration: {chunk_info['duration']:.1f}s)
+Raw transcript: {raw_transcript if raw_transcript.strip() else "(no speech)"}"""
+            )
+            contents.extend(
+                self._load_frame_parts(
+                    frame_paths, max_frames=settings.ANALYSIS_BATCH_FRAMES_PER_CHUNK
+                )
+            )
+
+        contents.append(
+            """For EACH clip provide:
+- "visual_description": a concise description (2-3 sentences) of what is happening in the scene, key objects, people or actions visible, and the setting/environment. Be specific and descriptive but concise.
+- "transcript_context": if the clip has speech, 2-3 sentences describing likely speaker changes (e.g., "Person A says:", "Person B responds:"), the conversation style, emotional tones and background sounds suggested by pauses, written as a natural description suitable for search. Use "" if the clip has no speech.
+
+Output ONLY a JSON array with one object per clip, in the same order. Format:
+[
+  {"chunk_id": "...", "visual_description": "...", "transcript_context": "..."},
+  ...
+]"""
+        )
+
+        return contents
+
+    def _batch_analysis_config(self) -> types.GenerateContentConfig:
+        """Generation config for batched analysis"""
+        return types.GenerateContentConfig(
+            temperature=0.3,
+            response_mime_type="application/json",
+        )
+
+    def _parse_batch_response(
+        self, response_text: str, num_chunks: int
+    ) -> dict[str, dict]:
+        """Parse a batched analysis JSON array into chunk_id -> entry"""
+        entries = json.loads(response_text)
+        if not isinstance(entries, list):
+            raise ValueError("Batch response is not a JSON array")
+
+        batch_results = {
+            entry["chunk_id"]: entry
+            for entry in entries
+            if isinstance(entry, dict) and entry.get("chunk_id")
+        }
+        logger.debug(f"Batch analysis returned {len(batch_results)}/{num_chunks} entries")
+        return batch_results
+
+    def get_raw_transcript(
+        self,
+        video_path: str,
+        chunk_info: dict,
+        temp_dir: Path,
+        audio_track: Optional[AudioTrack] = None,
+        transcript_segments: Optional[list[dict]] = None,
+    ) -> str:
+        """
+        Get a chunk's raw (unenhanced) transcript using the cheapest available source
+        Returns "" for silent chunks or on failure
+        """
         chunk_id = chunk_info["chunk_id"]
         start_time = chunk_info["start_time"]
         end_time = chunk_info["end_time"]
 
-        logger.info(f"AI Analysis for {chunk_id}...")
+        try:
+            if (
+                audio_track is not None
+                and settings.SPEECH_PREPASS_ENABLED
+                and not audio_track.has_speech(
+                    start_time, end_time, settings.SPEECH_MIN_SECONDS
+                )
+            ):
+                # Silent chunk: skip Whisper and the Gemini enhancement call
+                logger.debug("No speech in chunk - skipping transcription")
+                return ""
+
+            if transcript_segments is not None:
+                logger.debug("Assembling transcript from video-level segments...")
+                return self.build_chunk_transcript(
+                    transcript_segments, start_time, end_time
+                )
 
-        # 1. Extract and transcribe audio
-        logger.debug("Extracting audio...")
-        audio_path = temp_dir / f"{chunk_id}_audio.wav"
+            if audio_track is not None:
+                logger.debug("Transcribing audio slice...")
+                return self.transcribe_audio_raw(
+                    audio_track.slice(start_time, end_time)
+                )
+
+            return self._transcribe_chunk_from_file(
+                video_path, start_time, end_time, temp_dir / f"{chunk_id}_audio.wav"
+            )
+
+        except Exception as e:
+            logger.error(f"Audio transcription failed: {e}")
+            return ""
 
+    def _transcribe_chunk_from_file(
+        self, video_path: str, start_time: float, end_time: float, audio_path: Path
+    ) -> str:
+        """Extract a chunk's audio to a WAV file, transcribe it, then remove it"""
+        logger.debug("Extracting audio...")
         try:
             self.extract_audio_from_chunk(
                 video_path, start_time, end_time, str(audio_path)
             )
 
             logger.debug("Transcribing audio...")
-            transcript = self.transcribe_audio(str(audio_path))
+            return self.transcribe_audio_raw(str(audio_path))
 
+        finally:
             # Clean up audio file
             if audio_path.exists():
                 audio_path.unlink()
 
-        except Exception as e:
-            logger.error(f"Audio transcription failed: {e}")
-            transcript = ""
-
-        # 2. Describe visual content
-        logger.debug("Describing visual content...")
-        visual_description = self.describe_frames(frame_paths, chunk_info)
-
-        return {
-            "audio_transcript": transcript,
-            "visual_description": visual_description,
-        }
-
 
 # Standalone function for easy import
 def analyze_video_chunk(
@@ -0,0 +1,95 @@
+"""
+Whisper Model Pool
+Process-wide registry so each Whisper model is loaded once and shared
+"""
+import threading
+import logging
+from typing import Optional
+
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_models: dict[tuple, WhisperModel] = {}
+_pipelines: dict[tuple, BatchedInferencePipeline] = {}
+_lock = threading.Lock()
+
+
+def _model_key(
+    model_size: Optional[str] = None,
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+) -> tuple:
+    """Registry key for a model configuration, filled in from settings"""
+    return (
+        model_size or settings.WHISPER_MODEL_SIZE,
+        device or settings.WHISPER_DEVICE,
+        compute_type or settings.WHISPER_COMPUTE_TYPE,
+        settings.WHISPER_CPU_THREADS,
+        settings.WHISPER_NUM_WORKERS,
+    )
+
+
+def get_whisper_model(
+    model_size: Optional[str] = None,
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+) -> WhisperModel:
+    """
+    Get the shared WhisperModel for a configuration, loading it on first use
+
+    Args:
+        model_size: tiny, base, small, medium, large-v2, large-v3 (default: settings)
+        device: cpu, cuda or auto (default: settings)
+        compute_type: int8, float16, ... (default: settings)
+
+    Returns:
+        WhisperModel shared by every caller in this process. With
+        WHISPER_NUM_WORKERS > 1 it can serve that many transcriptions concurrently.
+    """
+    key = _model_key(model_size, device, compute_type)
+
+    with _lock:
+        model = _models.get(key)
+        if model is None:
+            size, device, compute_type, cpu_threads, num_workers = key
+            logger.info(
+                f"Loading Whisper model '{size}' ({device}, {compute_type}, "
+                f"cpu_threads={cpu_threads}, num_workers={num_workers})..."
+            )
+            model = WhisperModel(
+                size,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=num_workers,
+            )
+            _models[key] = model
+            logger.info("Whisper model loaded!")
+
+        return model
+
+
+def get_batched_pipeline(
+    model_size: Optional[str] = None,
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+) -> BatchedInferencePipeline:
+    """
+    Get the shared batched inference pipeline wrapping the pooled model
+
+    The pipeline splits audio on voice activity and decodes up to
+    WHISPER_BATCH_SIZE speech segments per forward pass.
+    """
+    model = get_whisper_model(model_size, device, compute_type)
+    key = _model_key(model_size, device, compute_type)
+
+    with _lock:
+        pipeline = _pipelines.get(key)
+        if pipeline is None:
+            pipeline = BatchedInferencePipeline(model=model)
+            _pipelines[key] = pipeline
+
+        return pipeline
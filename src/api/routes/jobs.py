@@ -0,0 +1,78 @@
+"""
+Jobs Routes
+Ingest job status and progress stream
+"""
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from src.jobs.store import JobStore, TERMINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+# Seconds between job polls while streaming progress
+EVENTS_POLL_INTERVAL = 1.0
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """
+    Get the status and progress of an ingest job
+
+    Args:
+        job_id: Job identifier returned by upload/resume
+
+    Returns:
+        Job with status (queued, running, completed, failed), per-stage
+        progress, and the processing summary once completed
+    """
+    job = await asyncio.to_thread(JobStore().get, job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    return job
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """
+    Stream job progress as Server-Sent Events
+
+    Sends a "progress" event whenever the job changes and a final "done"
+    event when it completes or fails, then closes the stream.
+    """
+    store = JobStore()
+    job = await asyncio.to_thread(store.get, job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    async def events():
+        last_update = None
+
+        while True:
+            job = await asyncio.to_thread(store.get, job_id)
+            if job is None:
+                return
+
+            if job["updated_at"] != last_update:
+                last_update = job["updated_at"]
+                event = "done" if job["status"] in TERMINAL_STATUSES else "progress"
+                yield f"event: {event}\ndata: {json.dumps(job)}\n\n"
+
+                if event == "done":
+                    return
+
+            await asyncio.sleep(EVENTS_POLL_INTERVAL)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
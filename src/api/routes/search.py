@@ -6,6 +6,7 @@ import logging
 
 from fastapi import APIRouter, HTTPException
 
+from src.embeddings.query_cache import get_query_cache
 from src.models.search import SearchQueryRequest, SearchResult
 from src.search.service import search_videos
 
@@ -80,3 +81,9 @@ async def search(request: SearchQueryRequest):
     except Exception as e:
         logger.error(f"Search failed: {e}")
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+
+
+@router.get("/cache/stats", response_model=dict)
+async def query_cache_stats():
+    """Hit/miss counters of the query embedding cache"""
+    return get_query_cache().stats()
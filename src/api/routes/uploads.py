@@ -0,0 +1,182 @@
+"""
+Uploads Routes
+Resumable chunked uploads using tus-style offsets
+"""
+import base64
+import binascii
+import logging
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from src.core.constants import MAX_VIDEO_SIZE_MB
+from src.core.exceptions import UnsupportedVideoFormatError, ValidationError
+from src.uploads.service import UploadStore, UploadOffsetMismatch
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/uploads", tags=["uploads"])
+
+TUS_VERSION = "1.0.0"
+TUS_HEADERS = {"Tus-Resumable": TUS_VERSION}
+
+
+def parse_upload_metadata(header: str) -> dict:
+    """Parse an Upload-Metadata header ("key base64value, key base64value")"""
+    metadata = {}
+    for pair in filter(None, (p.strip() for p in header.split(","))):
+        key, _, value = pair.partition(" ")
+        try:
+            metadata[key] = base64.b64decode(value).decode("utf-8") if value else ""
+        except (binascii.Error, UnicodeDecodeError):
+            raise HTTPException(status_code=400, detail=f"Invalid Upload-Metadata value for '{key}'")
+    return metadata
+
+
+def upload_headers(upload: dict) -> dict:
+    """Offset/length headers for an upload, plus the video once it is complete"""
+    headers = {
+        **TUS_HEADERS,
+        "Upload-Offset": str(upload["offset"]),
+        "Upload-Length": str(upload["length"]),
+        "Cache-Control": "no-store",
+    }
+    if upload["video_id"]:
+        headers["Video-Id"] = upload["video_id"]
+    if upload["job_id"]:
+        headers["Job-Id"] = upload["job_id"]
+    return headers
+
+
+@router.options("")
+async def upload_options():
+    """Advertise supported protocol version, size limit, and extensions"""
+    return Response(
+        status_code=204,
+        headers={
+            **TUS_HEADERS,
+            "Tus-Version": TUS_VERSION,
+            "Tus-Max-Size": str(int(MAX_VIDEO_SIZE_MB * 1024 * 1024)),
+            "Tus-Extension": "creation,termination",
+        },
+    )
+
+
+@router.post("", status_code=201)
+async def create_upload(request: Request):
+    """
+    Create a resumable upload
+
+    Headers:
+        Upload-Length: Total size of the video in bytes
+        Upload-Metadata: base64 encoded "filename" (required) and "title"
+
+    Returns:
+        201 with the upload URL in Location; oversize or unsupported
+        videos are rejected before any bytes are sent
+    """
+    try:
+        length = int(request.headers["Upload-Length"])
+    except (KeyError, ValueError):
+        raise HTTPException(status_code=400, detail="Upload-Length header is required")
+
+    metadata = parse_upload_metadata(request.headers.get("Upload-Metadata", ""))
+    filename = metadata.get("filename")
+    if not filename:
+        raise HTTPException(status_code=400, detail="Upload-Metadata must include a filename")
+
+    try:
+        upload = UploadStore().create(length, filename, metadata.get("title") or filename)
+    except UnsupportedVideoFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    return Response(
+        status_code=201,
+        headers={
+            **upload_headers(upload),
+            "Location": str(request.url_for("get_upload", upload_id=upload["upload_id"])),
+        },
+    )
+
+
+@router.head("/{upload_id}")
+async def head_upload(upload_id: str):
+    """Current offset of an upload, used by clients to resume"""
+    upload = UploadStore().get(upload_id)
+    if upload is None:
+        raise HTTPException(status_code=404, detail=f"Upload not found: {upload_id}")
+
+    return Response(status_code=200, headers=upload_headers(upload))
+
+
+@router.patch("/{upload_id}")
+async def append_upload(upload_id: str, request: Request):
+    """
+    Append bytes to an upload
+
+    Headers:
+        Upload-Offset: Offset the body starts at (must equal the current offset)
+        Content-Type: application/offset+octet-stream
+
+    Returns:
+        204 with the new Upload-Offset; once the last byte arrives the video
+        is registered and Video-Id/Job-Id are included
+    """
+    if request.headers.get("Content-Type") != "application/offset+octet-stream":
+        raise HTTPException(
+            status_code=415, detail="Content-Type must be application/offset+octet-stream"
+        )
+    try:
+        offset = int(request.headers["Upload-Offset"])
+    except (KeyError, ValueError):
+        raise HTTPException(status_code=400, detail="Upload-Offset header is required")
+
+    content_length = request.headers.get("Content-Length")
+
+    store = UploadStore()
+    try:
+        upload = await store.append(
+            upload_id,
+            offset,
+            request.stream(),
+            int(content_length) if content_length and content_length.isdigit() else None,
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Upload not found: {upload_id}")
+    except UploadOffsetMismatch as e:
+        raise HTTPException(
+            status_code=409,
+            detail=str(e),
+            headers={**TUS_HEADERS, "Upload-Offset": str(e.offset)},
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    if upload["video_id"]:
+        logger.info(f"Upload {upload_id} finished as {upload['video_id']}")
+
+    return Response(status_code=204, headers=upload_headers(upload))
+
+
+@router.get("/{upload_id}")
+async def get_upload(upload_id: str):
+    """
+    Get upload progress as JSON
+
+    Returns:
+        Offset, length, and the video/job once the upload completed
+    """
+    upload = UploadStore().get(upload_id)
+    if upload is None:
+        raise HTTPException(status_code=404, detail=f"Upload not found: {upload_id}")
+
+    return upload
+
+
+@router.delete("/{upload_id}", status_code=204)
+async def delete_upload(upload_id: str):
+    """Abort an upload and discard the bytes received so far"""
+    if not UploadStore().delete(upload_id):
+        raise HTTPException(status_code=404, detail=f"Upload not found: {upload_id}")
+
+    return Response(status_code=204, headers=TUS_HEADERS)
@@ -1,19 +1,31 @@
 """
 Videos Routes
-Video upload, list, get, and delete operations
+Video upload, ingest, list, get, frames, and delete operations
 """
+import asyncio
 import logging
 import json
 import shutil
 from pathlib import Path
-from datetime import datetime
 
 from fastapi import APIRouter, File, UploadFile, Form, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from src.core.config import settings
-from src.video_processing.service import VideoProcessor
+from src.core.constants import MAX_VIDEO_SIZE_MB
+from src.core.exceptions import UnsupportedVideoFormatError, ValidationError
+from src.models.search import IngestVideoRequest, IngestVideoResponse
+from src.jobs.store import JobStore, JOB_QUEUED, JOB_RUNNING
+from src.video_processing.content_index import ContentIndex
+from src.video_processing.frame_store import find_frame
+from src.video_processing.library import (
+    check_video_format,
+    new_video_id,
+    register_video,
+)
 from src.search.vector_db import VideoVectorDB
+from src.utils.hashing import copy_and_hash, hash_file
+from src.utils.files import link_or_reference
 
 logger = logging.getLogger(__name__)
 
@@ -25,91 +37,218 @@ async def upload_video(file: UploadFile = File(...), title: str = Form(...)):
     """
     Upload a video file to the library
 
-    Automatically processes the video:
+    Queues an ingest job and returns its job_id right away; follow progress
+    with GET /jobs/{job_id} or its /events stream. The job processes the video:
     - Chunks into segments
     - Extracts frames
     - Generates AI analysis (transcription + visual descriptions)
     - Generates embeddings
     - Indexes in Qdrant
 
+    A file whose content (SHA-256) is already in the library is not stored or
+    processed again; the response points at the existing video instead.
+
     Args:
         file: Video file to upload
         title: Video title
 
     Returns:
-        Upload and processing summary
+        Upload summary with the video_id and job_id
     """
+    # Reject unsupported or oversize files before writing anything
+    file_extension = Path(file.filename).suffix.lower()
+    try:
+        check_video_format(file_extension)
+    except UnsupportedVideoFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+
+    max_bytes = int(MAX_VIDEO_SIZE_MB * 1024 * 1024)
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Video exceeds the maximum size of {MAX_VIDEO_SIZE_MB:.0f} MB",
+        )
+
     try:
-        # Generate video ID from timestamp
-        video_id = f"vid_{int(datetime.utcnow().timestamp())}"
+        video_id = new_video_id()
 
-        # Get file extension
-        file_extension = Path(file.filename).suffix
         video_filename = f"{video_id}{file_extension}"
         video_path = settings.VIDEOS_DIR / video_filename
 
         logger.info(f"Uploading video: {video_id} ({title})")
 
-        # Save uploaded file
-        with open(video_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        # Get file stats
-        file_stats = video_path.stat()
-        file_size_mb = file_stats.st_size / (1024 * 1024)
+        # Save uploaded file, hashing it as it is written
+        try:
+            content_sha256 = await asyncio.to_thread(
+                copy_and_hash, file.file, video_path, max_bytes
+            )
+        except ValidationError:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Video exceeds the maximum size of {MAX_VIDEO_SIZE_MB:.0f} MB",
+            )
 
-        # Create basic metadata
-        metadata = {
-            "video_id": video_id,
-            "title": title,
-            "file_path": str(video_path),
-            "duration_seconds": 0.0,  # Will be populated by processor
-            "fps": 0.0,  # Will be populated by processor
-            "resolution": [0, 0],  # Will be populated by processor
-            "file_size_mb": file_size_mb,
-            "uploaded_at": datetime.utcnow().isoformat(),
-            "indexed_at": None,  # Will be set when full processing completes
-            "original_filename": file.filename,
-        }
+        # Identical content was uploaded before: reuse its processed artifacts
+        existing_video_id = ContentIndex().lookup(content_sha256)
+        if existing_video_id:
+            video_path.unlink()
+            logger.info(
+                f"Upload of '{title}' matches existing video {existing_video_id}, "
+                f"skipping processing"
+            )
+            return duplicate_upload_response(existing_video_id)
 
-        # Save initial metadata
-        metadata_path = settings.METADATA_DIR / f"{video_id}.json"
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
-
-        # Process video (chunk + extract frames + AI analysis + indexing)
-        logger.info(f"Starting video processing for {video_id}...")
-        processor = VideoProcessor(enable_ai_analysis=True, enable_indexing=True)
-        processing_result = processor.process_video(video_id, str(video_path), title)
-
-        logger.info(
-            f"✅ Video {video_id} uploaded and processed successfully "
-            f"({processing_result['num_chunks']} chunks, "
-            f"{processing_result['total_frames']} frames)"
+        # Save metadata and queue processing
+        metadata_path, job = register_video(
+            video_id, title, video_path, file.filename, content_sha256
         )
+        file_size_mb = video_path.stat().st_size / (1024 * 1024)
+
+        logger.info(f"✅ Video {video_id} uploaded, processing queued as {job['job_id']}")
 
         return JSONResponse(
-            status_code=200,
+            status_code=202,
             content={
                 "video_id": video_id,
-                "message": "Video uploaded and processed successfully",
+                "job_id": job["job_id"],
+                "message": "Video uploaded, processing queued",
                 "file_path": str(video_path),
                 "file_size_mb": round(file_size_mb, 2),
                 "metadata_path": str(metadata_path),
                 "processing": {
-                    "num_chunks": processing_result["num_chunks"],
-                    "total_frames": processing_result["total_frames"],
-                    "status": processing_result["status"],
-                    "indexing": processing_result.get("indexing"),
+                    "status": JOB_QUEUED,
+                    "job_id": job["job_id"],
                 },
             },
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Upload failed: {e}")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+@router.post("/ingest", response_model=IngestVideoResponse)
+async def ingest_video(request: IngestVideoRequest):
+    """
+    Add a video that is already on the backend's filesystem
+
+    For clients on the same machine (the desktop app): the file is hardlinked
+    or reflinked into the library, or referenced in place when neither is
+    possible, instead of being uploaded and copied. Processing is queued as
+    for uploads.
+
+    Args:
+        request: Local video path and title
+
+    Returns:
+        Video ID, job ID and how the file was placed
+    """
+    source_path = Path(request.video_path).expanduser().resolve()
+
+    if not source_path.is_file():
+        raise HTTPException(status_code=404, detail=f"File not found: {request.video_path}")
+
+    file_extension = source_path.suffix.lower()
+    try:
+        check_video_format(file_extension)
+    except UnsupportedVideoFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+
+    try:
+        # Hashing reads the file once; nothing is copied
+        content_sha256 = await asyncio.to_thread(hash_file, source_path)
+
+        existing_video_id = ContentIndex().lookup(content_sha256)
+        if existing_video_id:
+            logger.info(
+                f"Ingest of {source_path} matches existing video {existing_video_id}, "
+                f"skipping processing"
+            )
+            return existing_ingest_response(existing_video_id)
+
+        video_id = new_video_id()
+
+        video_path, storage = await asyncio.to_thread(
+            link_or_reference,
+            source_path,
+            settings.VIDEOS_DIR / f"{video_id}{file_extension}",
+        )
+        logger.info(f"Ingesting video: {video_id} ({request.title}) via {storage}")
+
+        _, job = register_video(
+            video_id,
+            request.title,
+            video_path,
+            source_path.name,
+            content_sha256,
+            storage=storage,
+        )
+
+        return IngestVideoResponse(video_id=video_id, job_id=job["job_id"], storage=storage)
+
+    except Exception as e:
+        logger.error(f"Ingest failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Ingest failed: {str(e)}")
+
+
+def duplicate_upload_response(video_id: str) -> JSONResponse:
+    """Upload response pointing at the existing video with identical content"""
+    with open(settings.METADATA_DIR / f"{video_id}.json", "r") as f:
+        metadata = json.load(f)
+
+    chunks_metadata_path = settings.METADATA_DIR / f"{video_id}_chunks.json"
+    chunks = []
+    if chunks_metadata_path.exists():
+        with open(chunks_metadata_path, "r") as f:
+            chunks = json.load(f)
+
+    latest_job = JobStore().latest_for_video(video_id)
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "video_id": video_id,
+            "job_id": latest_job["job_id"] if latest_job else None,
+            "message": "Identical video already in library, reusing processed artifacts",
+            "duplicate": True,
+            "file_path": metadata["file_path"],
+            "file_size_mb": round(metadata.get("file_size_mb", 0.0), 2),
+            "metadata_path": str(settings.METADATA_DIR / f"{video_id}.json"),
+            "processing": {
+                "num_chunks": len(chunks),
+                "total_frames": sum(chunk.get("num_frames", 0) for chunk in chunks),
+                "status": metadata.get("processing_status", "processed"),
+                "indexing": None,
+            },
+        },
+    )
+
+
+def existing_ingest_response(video_id: str) -> IngestVideoResponse:
+    """Ingest response pointing at the existing video with identical content"""
+    with open(settings.METADATA_DIR / f"{video_id}.json", "r") as f:
+        metadata = json.load(f)
+
+    chunks_metadata_path = settings.METADATA_DIR / f"{video_id}_chunks.json"
+    chunks_count = None
+    if chunks_metadata_path.exists():
+        with open(chunks_metadata_path, "r") as f:
+            chunks_count = len(json.load(f))
+
+    latest_job = JobStore().latest_for_video(video_id)
+
+    return IngestVideoResponse(
+        video_id=video_id,
+        job_id=latest_job["job_id"] if latest_job else None,
+        storage=metadata.get("storage", "upload"),
+        duplicate=True,
+        chunks_count=chunks_count,
+        duration_seconds=metadata.get("duration_seconds") or None,
+    )
+
+
 @router.get("")
 async def list_videos():
     """
@@ -221,6 +360,98 @@ async def get_video_chunks(video_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to get chunks: {str(e)}")
 
 
+@router.get("/{video_id}/frames/{timestamp_ms}")
+async def get_video_frame(video_id: str, timestamp_ms: int):
+    """
+    Get the stored frame shown at a timestamp
+
+    Works for both frame stores; with FRAME_STORE=pack this is the only way
+    to fetch individual frames over HTTP.
+
+    Args:
+        video_id: Video identifier
+        timestamp_ms: Timestamp in milliseconds
+
+    Returns:
+        JPEG of the last stored frame at or before the timestamp
+    """
+    try:
+        image_data = await asyncio.to_thread(find_frame, video_id, timestamp_ms)
+    except OSError as e:
+        logger.error(f"Failed to read frame: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to read frame: {str(e)}")
+
+    if image_data is None:
+        raise HTTPException(
+            status_code=404, detail=f"No frame at {timestamp_ms}ms for video {video_id}"
+        )
+
+    return Response(
+        content=image_data,
+        media_type="image/jpeg",
+        headers={"Cache-Control": "max-age=3600"},
+    )
+
+
+@router.post("/{video_id}/resume")
+async def resume_video_processing(video_id: str):
+    """
+    Resume processing of a video that failed or was interrupted
+
+    Chunks keep per-stage checkpoints, so only unfinished work is repeated
+    (no Whisper, Gemini or embedding calls for completed chunks).
+
+    Args:
+        video_id: Video identifier
+
+    Returns:
+        Summary with the job_id of the queued resume job
+    """
+    try:
+        metadata_path = settings.METADATA_DIR / f"{video_id}.json"
+
+        if not metadata_path.exists():
+            raise HTTPException(status_code=404, detail=f"Video {video_id} not found")
+
+        with open(metadata_path, "r") as f:
+            metadata = json.load(f)
+
+        if metadata.get("processing_status") == "processed":
+            return {
+                "video_id": video_id,
+                "message": "Video is already processed",
+                "processing": {"status": "processed"},
+            }
+
+        job_store = JobStore()
+        latest_job = job_store.latest_for_video(video_id)
+        if latest_job and latest_job["status"] in (JOB_QUEUED, JOB_RUNNING):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Video {video_id} is already being processed "
+                f"(job {latest_job['job_id']})",
+            )
+
+        job = job_store.create(video_id, kind="resume")
+        logger.info(f"Queued resume of {video_id} as {job['job_id']}")
+
+        return JSONResponse(
+            status_code=202,
+            content={
+                "video_id": video_id,
+                "job_id": job["job_id"],
+                "message": "Video processing resume queued",
+                "processing": {"status": JOB_QUEUED, "job_id": job["job_id"]},
+            },
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Resume failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Resume failed: {str(e)}")
+
+
 @router.delete("/{video_id}")
 async def delete_video(video_id: str):
     """
@@ -230,7 +461,7 @@ async def delete_video(video_id: str):
     - Video file
     - Metadata files
     - Chunks metadata
-    - Frames
+    - Frames and processing checkpoints
     - Qdrant vectors
 
     Args:
@@ -251,9 +482,9 @@ async def delete_video(video_id: str):
         with open(metadata_path, "r") as f:
             metadata = json.load(f)
 
-        # Delete video file
+        # Delete video file (referenced files belong to the user and are kept)
         video_path = Path(metadata["file_path"])
-        if video_path.exists():
+        if metadata.get("managed_file", True) and video_path.exists():
             video_path.unlink()
             logger.debug(f"Deleted video file: {video_path}")
 
@@ -261,6 +492,9 @@ async def delete_video(video_id: str):
         metadata_path.unlink()
         logger.debug(f"Deleted metadata file: {metadata_path}")
 
+        # Forget its content hash so a re-upload is processed again
+        ContentIndex().remove_video(video_id)
+
         # Delete chunks metadata if exists
         chunks_metadata_path = settings.METADATA_DIR / f"{video_id}_chunks.json"
         if chunks_metadata_path.exists():
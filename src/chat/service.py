@@ -4,7 +4,6 @@ Handles chat with video clips using Gemini context caching
 """
 import logging
 import json
-from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
@@ -12,6 +11,7 @@ from google import genai
 from google.genai import types
 
 from src.core.config import settings
+from src.video_processing.frame_store import read_frame
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +37,8 @@ class ChatHandler:
 
     def load_chunk_data(self, chunk_id: str) -> Optional[dict]:
         """Load chunk data from metadata"""
-        # Extract video_id from chunk_id (format: vid_XXX_start_end)
-        video_id = "_".join(chunk_id.split("_")[:2])
+        # Extract video_id from chunk_id (format: {video_id}_start_end)
+        video_id = chunk_id.rsplit("_", 2)[0]
 
         chunks_file = self.metadata_dir / f"{video_id}_chunks.json"
         if not chunks_file.exists():
@@ -85,9 +85,8 @@ class ChatHandler:
 
             # Add representative frame
             frame_path = chunk_data.get("representative_frame")
-            if frame_path and Path(frame_path).exists():
-                with open(frame_path, "rb") as f:
-                    image_data = f.read()
+            image_data = read_frame(frame_path) if frame_path else None
+            if image_data is not None:
                 context_parts.append(
                     types.Part.from_bytes(data=image_data, mime_type="image/jpeg")
                 )
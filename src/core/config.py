@@ -28,6 +28,35 @@ class Settings(BaseSettings):
     CHUNK_DURATION_SECONDS: float = 30.0
     CHUNK_OVERLAP_SECONDS: float = 5.0
     FRAME_EXTRACTION_FPS: float = 1.0
+    FRAME_DEDUP_ENABLED: bool = True  # Drop sampled frames that look like the last kept one
+    FRAME_DEDUP_MAX_DISTANCE: int = 4  # dHash bits (of 64) that may differ for a duplicate
+    FRAME_STORE: str = "files"  # "files" (loose JPEGs) or "pack" (one mmap-read file per video)
+    CHUNK_SNAP_TO_KEYFRAMES: bool = True  # Move chunk boundaries onto nearby keyframes
+    CHUNK_KEYFRAME_TOLERANCE_SECONDS: float = 2.0  # Max shift of a snapped boundary
+    CHUNK_ENCODE_BATCH_SIZE: int = 4  # Chunks encoded per ffmpeg invocation
+    CHUNK_ENCODE_PRESET: str = "veryfast"  # x264 preset; bitrate is capped to the API size limit
+    CHUNK_STREAM_COPY: bool = True  # Skip video re-encode when source fits API limits
+    PROXY_ENABLED: bool = True  # Transcode >720p sources once to a shared 720p proxy
+    PROXY_KEYFRAME_INTERVAL_SECONDS: float = 2.0
+
+    # Ingest Pipeline
+    PIPELINE_QUEUE_SIZE: int = 8  # Max chunks waiting between two stages
+    CHUNK_ENCODE_WORKERS: int = 2  # Concurrent ffmpeg chunk encodes
+    UPSERT_BATCH_SIZE: int = 16  # Chunks per incremental Qdrant upsert
+
+    # AI Analysis
+    TRANSCRIPTION_MODE: str = "video"  # "video" (one Whisper pass) or "chunk"
+    WHISPER_MODEL_SIZE: str = "base"  # tiny, base, small, medium, large-v2, large-v3
+    WHISPER_DEVICE: str = "cpu"
+    WHISPER_COMPUTE_TYPE: str = "int8"
+    WHISPER_CPU_THREADS: int = 0  # 0 = CTranslate2 default
+    WHISPER_NUM_WORKERS: int = 1  # Concurrent transcriptions per shared model
+    WHISPER_BATCH_SIZE: int = 0  # >0 enables batched inference with this batch size
+    SPEECH_PREPASS_ENABLED: bool = True  # VAD over the whole track; silent chunks skip Whisper/Gemini
+    SPEECH_MIN_SECONDS: float = 0.5  # Minimum speech in a chunk to transcribe it
+    ANALYSIS_BATCH_SIZE: int = 1  # Chunks per Gemini analysis request (1 = per-chunk calls)
+    ANALYSIS_BATCH_FRAMES_PER_CHUNK: int = 5  # Frames sent per chunk in batched requests
+    ANALYSIS_MAX_CONCURRENCY: int = 4  # Gemini analysis requests in flight per video
 
     # Storage Paths (relative to project root)
     DATA_DIR: Path = Path("data")
@@ -35,16 +64,31 @@ class Settings(BaseSettings):
     FRAMES_DIR: Path = DATA_DIR / "frames"
     METADATA_DIR: Path = DATA_DIR / "metadata"
     QDRANT_STORAGE_DIR: Path = DATA_DIR / "qdrant_storage"
+    UPLOADS_DIR: Path = DATA_DIR / "uploads"  # In-progress resumable uploads
+    PROBE_CACHE_DIR: Path = DATA_DIR / "probe_cache"  # ffprobe results by content hash
+
+    # Ingest Jobs
+    JOBS_DB_PATH: Path = DATA_DIR / "jobs.db"  # SQLite job queue
+    JOB_WORKERS: int = 1  # Videos processed at once (each runs its own stage pools)
 
     # Prompts Directory
     PROMPTS_DIR: Path = Path("prompts")
 
     # Embeddings Configuration
     EMBEDDING_MAX_WORKERS: int = 5
+    TEXT_EMBEDDING_BATCH_SIZE: int = 50  # Chunk texts per embed_content request
+    TEXT_EMBEDDING_BATCH_TOKENS: int = 20000  # Estimated token budget per request
+    EMBEDDING_CACHE_ENABLED: bool = True  # Reuse vectors for unchanged content
+    EMBEDDING_CACHE_PATH: Path = DATA_DIR / "embedding_cache.db"
+    EMBEDDING_CACHE_MAX_MB: float = 1024.0  # Least recently used vectors evicted beyond this
+    QUERY_EMBEDDING_CACHE_SIZE: int = 1024  # Search query vectors kept in memory
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: float = 3600.0
+    QUERY_EMBEDDING_CACHE_PERSIST: bool = False  # Also keep query vectors in the embedding cache
     TEXT_EMBEDDING_MODEL: str = "gemini-embedding-001"
     TEXT_VECTOR_SIZE: int = 3072  # gemini-embedding-001 dimensions
     VISUAL_EMBEDDING_MODEL: str = "multimodalembedding@001"
     VISUAL_VECTOR_SIZE: int = 1408  # multimodalembedding@001 dimensions
+    SEARCH_MIN_MODALITY_WEIGHT: float = 0.15  # Modalities weighted below this are not searched
 
     # Cascaded Reranking Configuration
     RERANKING_ENABLED: bool = True
@@ -84,6 +128,8 @@ class Settings(BaseSettings):
             self.FRAMES_DIR,
             self.METADATA_DIR,
             self.QDRANT_STORAGE_DIR,
+            self.UPLOADS_DIR,
+            self.PROBE_CACHE_DIR,
             self.PROMPTS_DIR,
         ]
 
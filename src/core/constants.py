@@ -21,6 +21,12 @@ RETRY_EXPONENTIAL_BASE = 2.0
 SUPPORTED_VIDEO_FORMATS = [".mp4", ".avi", ".mov", ".mkv", ".webm"]
 MAX_VIDEO_SIZE_MB = 500.0
 
+# Chunk Videos (multimodal embedding API input)
+MAX_EMBEDDING_VIDEO_SIZE_MB = 20.0
+MAX_CHUNK_WIDTH = 1280
+MAX_CHUNK_HEIGHT = 720
+STREAM_COPY_VIDEO_CODECS = ["avc1", "h264"]
+
 # API Limits
 MAX_SEARCH_RESULTS = 50
 DEFAULT_SEARCH_RESULTS = 5
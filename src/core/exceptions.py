@@ -61,3 +61,9 @@ class ValidationError(VideoAnalyserException):
     """Error in data validation"""
 
     pass
+
+
+class UnsupportedVideoFormatError(ValidationError):
+    """Video file extension outside SUPPORTED_VIDEO_FORMATS"""
+
+    pass
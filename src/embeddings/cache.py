@@ -0,0 +1,180 @@
+"""
+Embedding Cache
+Content-addressed on-disk cache of embedding vectors backed by SQLite
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Keys per query (below SQLite's bound parameter limit) and rows per eviction pass
+QUERY_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    dimension INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used);
+"""
+
+
+def cache_key(model: str, dimension: int, content: str) -> str:
+    """Key of a vector: model, dimension and a hash of the embedded content"""
+    return hashlib.sha256(f"{model}\0{dimension}\0{content}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite cache of float32 embedding vectors keyed by (model, dimension, content)
+
+    Content is whatever determines the vector: the text for text embeddings,
+    or the chunk video hash plus contextual text for video embeddings. Lookups
+    refresh last_used; once the cache grows past max_bytes the least recently
+    used vectors are evicted. Like JobStore, every call opens its own
+    connection so the cache can be shared by embedding worker threads.
+
+    The cache size is tracked as a running total (read from the database
+    once, then updated by this instance's writes and evictions), so a put
+    doesn't scan the whole table. Writes by other instances are picked up
+    the next time this instance evicts.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.db_path = db_path or settings.EMBEDDING_CACHE_PATH
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(settings.EMBEDDING_CACHE_MAX_MB * 1024 * 1024)
+        )
+
+        self.size_lock = threading.Lock()
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+            self.total_bytes = self._stored_bytes(conn)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Connection that commits on success and is always closed"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _stored_bytes(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+
+    def get_many(
+        self, model: str, dimension: int, contents: list[str]
+    ) -> list[Optional[list[float]]]:
+        """Cached vectors for contents (None where missing), in input order"""
+        keys = [cache_key(model, dimension, content) for content in contents]
+        found = {}
+
+        try:
+            with self._connection() as conn:
+                for i in range(0, len(keys), QUERY_BATCH_SIZE):
+                    batch = keys[i : i + QUERY_BATCH_SIZE]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                    found.update(rows)
+
+                if found:
+                    now = time.time()
+                    conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(now, key) for key in found],
+                    )
+        except sqlite3.Error as e:
+            # The cache only saves API calls; never fail embedding over it
+            logger.warning(f"Embedding cache lookup failed: {e}")
+
+        return [
+            np.frombuffer(found[key], dtype=np.float32).tolist() if key in found else None
+            for key in keys
+        ]
+
+    def get(self, model: str, dimension: int, content: str) -> Optional[list[float]]:
+        """Cached vector for content, or None"""
+        return self.get_many(model, dimension, [content])[0]
+
+    def put_many(
+        self, model: str, dimension: int, items: list[tuple[str, list[float]]]
+    ):
+        """Store (content, vector) pairs, then evict down to max_bytes"""
+        if not items:
+            return
+
+        now = time.time()
+        rows = []
+        for content, vector in items:
+            blob = np.asarray(vector, dtype=np.float32).tobytes()
+            key = cache_key(model, dimension, content)
+            rows.append((key, model, dimension, blob, len(blob), now))
+
+        try:
+            with self._connection() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(key, model, dimension, vector, size, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                with self.size_lock:
+                    # Replaced rows are counted twice until the next eviction
+                    self.total_bytes += sum(row[4] for row in rows)
+                    if self.total_bytes > self.max_bytes:
+                        self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def put(self, model: str, dimension: int, content: str, vector: list[float]):
+        """Store one vector"""
+        self.put_many(model, dimension, [(content, vector)])
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used vectors until the cache fits max_bytes"""
+        total_bytes = self._stored_bytes(conn)
+
+        evicted = 0
+        while total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM embeddings ORDER BY last_used LIMIT ?",
+                (QUERY_BATCH_SIZE,),
+            ).fetchall()
+            if not rows:
+                break
+
+            victims = []
+            for key, size in rows:
+                if total_bytes <= self.max_bytes:
+                    break
+                victims.append((key,))
+                total_bytes -= size
+
+            conn.executemany("DELETE FROM embeddings WHERE key = ?", victims)
+            evicted += len(victims)
+
+        self.total_bytes = total_bytes
+
+        if evicted:
+            logger.info(f"Evicted {evicted} embeddings from cache")
@@ -0,0 +1,129 @@
+"""
+Query Embedding Cache
+In-process TTL + LRU cache for search query embeddings
+"""
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Optional
+
+from src.core.config import settings
+from src.embeddings.cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and collapse whitespace so trivially different queries share an entry"""
+    return " ".join(query.casefold().split())
+
+
+class QueryEmbeddingCache:
+    """
+    LRU cache of query vectors keyed by (model, dimension, normalized query)
+
+    Entries expire after ttl_seconds. With a persistent store (an
+    EmbeddingCache), in-memory misses fall through to disk and new vectors
+    are written back, so repeated queries survive restarts (the model is part
+    of the key, so persisted vectors don't need to expire). Hit and miss
+    counters cover the in-memory layer.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        persistent_store: Optional[EmbeddingCache] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.persistent_store = persistent_store
+        self.entries: OrderedDict[tuple, tuple[float, list[float]]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, dimension: int, query: str) -> Optional[list[float]]:
+        """Cached vector for a query, or None"""
+        key = (model, dimension, normalize_query(query))
+        now = time.monotonic()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl_seconds:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            self.entries.pop(key, None)
+            self.misses += 1
+
+        if self.persistent_store is None:
+            return None
+
+        embedding = self.persistent_store.get(f"query:{model}", dimension, key[2])
+        if embedding is not None:
+            self._remember(key, embedding)
+        return embedding
+
+    def put(self, model: str, dimension: int, query: str, embedding: list[float]):
+        """Store a query vector"""
+        key = (model, dimension, normalize_query(query))
+        self._remember(key, embedding)
+
+        if self.persistent_store is not None:
+            self.persistent_store.put(f"query:{model}", dimension, key[2], embedding)
+
+    def _remember(self, key: tuple, embedding: list[float]):
+        with self.lock:
+            self.entries[key] = (time.monotonic(), embedding)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Entry count and hit/miss counters"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def clear(self):
+        """Drop all in-memory entries and reset the counters"""
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_query_cache: Optional[QueryEmbeddingCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryEmbeddingCache:
+    """Process-wide query embedding cache (created on first use)"""
+    global _query_cache
+
+    with _query_cache_lock:
+        if _query_cache is None:
+            persistent_store = None
+            if settings.QUERY_EMBEDDING_CACHE_PERSIST:
+                persistent_store = EmbeddingCache()
+
+            _query_cache = QueryEmbeddingCache(
+                max_entries=settings.QUERY_EMBEDDING_CACHE_SIZE,
+                ttl_seconds=settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+                persistent_store=persistent_store,
+            )
+            logger.info(
+                f"Query embedding cache: {settings.QUERY_EMBEDDING_CACHE_SIZE} entries, "
+                f"TTL {settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS:.0f}s"
+                f"{', persistent' if persistent_store else ''}"
+            )
+        return _query_cache
@@ -11,16 +11,33 @@ import json
 
 import numpy as np
 from google import genai
+from google.genai import errors as genai_errors
 import vertexai
 from vertexai.vision_models import Video, VideoSegmentConfig, MultiModalEmbeddingModel
 from google.api_core import exceptions as google_exceptions
 
 from src.core.config import settings
+from src.core.constants import MAX_EMBEDDING_VIDEO_SIZE_MB
 from src.core.exceptions import EmbeddingGenerationError
+from src.embeddings.cache import EmbeddingCache
+from src.embeddings.query_cache import get_query_cache
+from src.utils.hashing import hash_file
 from src.utils.retry import retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+# Rough token estimate for batching (gemini tokenizers average ~4 chars/token)
+CHARS_PER_TOKEN = 4
+
+# HTTP status codes of errors caused by the request contents (bad or oversized input)
+ITEM_ERROR_CODES = (400, 413)
+
+# Shared by all searches: text and visual query embeddings run side by side
+QUERY_EMBEDDING_WORKERS = 8
+_query_executor = ThreadPoolExecutor(
+    max_workers=QUERY_EMBEDDING_WORKERS, thread_name_prefix="query-embedding"
+)
+
 
 class EmbeddingGenerator:
     """Generates multimodal embeddings using Vertex AI"""
@@ -51,6 +68,9 @@ class EmbeddingGenerator:
             location=self.gcp_location,
         )
 
+        # Vectors for content embedded before (re-indexing, identical chunks)
+        self.cache = EmbeddingCache() if settings.EMBEDDING_CACHE_ENABLED else None
+
         # Initialize vector DB (lazy import to avoid circular dependencies)
         # Import here instead of top-level
         from src.search.vector_db import VideoVectorDB
@@ -58,10 +78,14 @@ class EmbeddingGenerator:
         self.vector_db = VideoVectorDB()
 
     def generate_dual_embeddings(
-        self, chunk_data: dict, chunk_video_path: Optional[str] = None
+        self,
+        chunk_data: dict,
+        chunk_video_path: Optional[str] = None,
+        text_embedding: Optional[list[float]] = None,
     ) -> tuple[list[float], list[float]]:
         """
         Generate BOTH text and visual embeddings for a video chunk
+        A text_embedding computed by a batched request is used as-is
 
         Returns:
             (text_embedding, visual_embedding) tuple
@@ -69,7 +93,8 @@ class EmbeddingGenerator:
             - visual_embedding: 1408-dim visual embedding from video (multimodalembedding@001)
         """
         # Generate text embedding for semantic understanding
-        text_embedding = self._generate_text_embedding(chunk_data)
+        if text_embedding is None:
+            text_embedding = self._generate_text_embedding(chunk_data)
 
         # Generate visual embedding from video
         visual_embedding = self._generate_visual_embedding(
@@ -78,6 +103,16 @@ class EmbeddingGenerator:
 
         return text_embedding, visual_embedding
 
+    def _chunk_text(self, chunk_data: dict) -> str:
+        """Combine visual description + audio transcript for the text embedding"""
+        text_parts = []
+        if chunk_data.get("visual_description"):
+            text_parts.append(chunk_data["visual_description"])
+        if chunk_data.get("audio_transcript"):
+            text_parts.append(chunk_data["audio_transcript"])
+
+        return " ".join(text_parts) if text_parts else "video content"
+
     def _generate_text_embedding(self, chunk_data: dict) -> list[float]:
         """
         Generate text-only embedding for semantic understanding
@@ -85,39 +120,169 @@ class EmbeddingGenerator:
 
         Returns 3072-dimensional embedding (gemini-embedding-001)
         """
-        try:
-            # Combine all text information
-            text_parts = []
-            if chunk_data.get("visual_description"):
-                text_parts.append(chunk_data["visual_description"])
-            if chunk_data.get("audio_transcript"):
-                text_parts.append(chunk_data["audio_transcript"])
+        return self.generate_text_embeddings([chunk_data])[0]
+
+    def generate_text_embeddings(self, chunks_data: list[dict]) -> list[list[float]]:
+        """
+        Generate text embeddings for many chunks with batched requests
+
+        Texts are grouped into embed_content requests of at most
+        TEXT_EMBEDDING_BATCH_SIZE items and TEXT_EMBEDDING_BATCH_TOKENS
+        (estimated) tokens. A request rejected for its input is split in half
+        and retried, so a bad item only costs its own vector (zero vector
+        fallback); quota, auth and other service errors are raised. Texts
+        found in the embedding cache are not sent at all.
+
+        Returns embeddings in the order of chunks_data
+        """
+        model = settings.TEXT_EMBEDDING_MODEL
+        texts = [self._chunk_text(chunk_data) for chunk_data in chunks_data]
+
+        cached = (
+            self.cache.get_many(model, self.text_dimensions, texts)
+            if self.cache is not None
+            else [None] * len(texts)
+        )
+
+        # Each distinct uncached text is embedded once
+        missing = list(
+            dict.fromkeys(
+                text for text, embedding in zip(texts, cached) if embedding is None
+            )
+        )
+        computed = {}
+        for batch in self._text_batches(missing):
+            computed.update(zip(batch, self._embed_text_batch(batch)))
+
+        if self.cache is not None:
+            # Zero vectors are failures, not results
+            self.cache.put_many(
+                model,
+                self.text_dimensions,
+                [
+                    (text, embedding)
+                    for text, embedding in computed.items()
+                    if any(embedding)
+                ],
+            )
 
-            combined_text = " ".join(text_parts) if text_parts else "video content"
+        logger.debug(
+            f"Generated {len(texts)} text embeddings "
+            f"({len(texts) - len(missing)} from cache)"
+        )
+        return [
+            embedding if embedding is not None else computed[text]
+            for text, embedding in zip(texts, cached)
+        ]
 
-            # Generate text embedding using Gemini with retry
+    def _text_batches(self, texts: list[str]) -> list[list[str]]:
+        """Group texts into request batches by item count and token budget"""
+        max_items = max(1, settings.TEXT_EMBEDDING_BATCH_SIZE)
+        max_tokens = settings.TEXT_EMBEDDING_BATCH_TOKENS
+
+        batches = []
+        batch, batch_tokens = [], 0
+        for text in texts:
+            tokens = len(text) // CHARS_PER_TOKEN + 1
+            # An item over the budget on its own still gets a batch of one
+            if batch and (len(batch) >= max_items or batch_tokens + tokens > max_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _is_item_error(self, error: Exception) -> bool:
+        """Whether an embedding error is caused by the input rather than the service"""
+        if isinstance(error, (google_exceptions.InvalidArgument, EmbeddingGenerationError)):
+            return True
+        return isinstance(error, genai_errors.ClientError) and error.code in ITEM_ERROR_CODES
+
+    def _embed_text_batch(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed one batch, bisecting on input errors
+        Quota, auth and transient errors are raised: splitting would only
+        multiply the failing requests
+        """
+        try:
+            # Generate text embeddings using Gemini with retry
             result = retry_with_backoff(
                 lambda: self.client.models.embed_content(
-                    model="gemini-embedding-001", contents=combined_text
+                    model=settings.TEXT_EMBEDDING_MODEL, contents=texts
                 ),
                 max_retries=3,
                 initial_delay=1.0,
             )
-
-            return result.embeddings[0].values
+            if len(result.embeddings) != len(texts):
+                raise EmbeddingGenerationError(
+                    f"Expected {len(texts)} text embeddings, got {len(result.embeddings)}"
+                )
+            return [embedding.values for embedding in result.embeddings]
 
         except Exception as e:
-            logger.error(f"Text embedding error: {e}")
-            return [0.0] * self.text_dimensions
+            if not self._is_item_error(e):
+                raise
+            if len(texts) == 1:
+                logger.error(f"Text embedding error: {e}")
+                return [[0.0] * self.text_dimensions]
+
+            logger.warning(f"Text embedding batch of {len(texts)} failed, splitting: {e}")
+            middle = len(texts) // 2
+            return self._embed_text_batch(texts[:middle]) + self._embed_text_batch(
+                texts[middle:]
+            )
 
     def _generate_visual_embedding(
         self, chunk_data: dict, chunk_video_path: Optional[str] = None
     ) -> list[float]:
         """
         Generate visual embedding from video frames/video file
+        Served from the embedding cache when the same chunk video and text
+        were embedded before
 
         Returns 1408-dimensional embedding (multimodalembedding@001)
         """
+        if self.cache is None:
+            return self._embed_visual(chunk_data, chunk_video_path)
+
+        model = settings.VISUAL_EMBEDDING_MODEL
+        cache_content = self._visual_cache_content(chunk_data, chunk_video_path)
+
+        embedding = self.cache.get(model, self.embedding_dimensions, cache_content)
+        if embedding is not None:
+            return embedding
+
+        embedding = self._embed_visual(chunk_data, chunk_video_path)
+        if any(embedding):
+            self.cache.put(model, self.embedding_dimensions, cache_content, embedding)
+        return embedding
+
+    def _visual_cache_content(
+        self, chunk_data: dict, chunk_video_path: Optional[str] = None
+    ) -> str:
+        """Everything the visual embedding depends on: chunk video content and text"""
+        video_hash = (
+            hash_file(chunk_video_path)
+            if chunk_video_path and Path(chunk_video_path).exists()
+            else ""
+        )
+        duration = chunk_data.get("end_time", 60) - chunk_data.get("start_time", 0)
+        return "\0".join(
+            [
+                video_hash,
+                f"{duration:.2f}",
+                chunk_data.get("visual_description", ""),
+                chunk_data.get("audio_transcript", ""),
+            ]
+        )
+
+    def _embed_visual(
+        self, chunk_data: dict, chunk_video_path: Optional[str] = None
+    ) -> list[float]:
+        """Call the multimodal embedding API for a chunk (text-only fallback)"""
         try:
             # Prepare audio transcription as contextual text
             # This provides audio context that video embeddings don't capture
@@ -134,12 +299,21 @@ class EmbeddingGenerator:
                 end_time = chunk_data.get("end_time", 60)
                 duration = end_time - start_time
 
+                # Validate size before uploading anything the API would reject
+                size_mb = Path(chunk_video_path).stat().st_size / (1024 * 1024)
+
                 # Validate duration - must be at least 1 second for the API
                 if duration < 1.0:
                     logger.debug(
                         f"Chunk too short ({duration:.2f}s), using text-only embedding"
                     )
                     use_text_fallback = True
+                elif size_mb > MAX_EMBEDDING_VIDEO_SIZE_MB:
+                    logger.warning(
+                        f"Video chunk is {size_mb:.1f} MB (limit "
+                        f"{MAX_EMBEDDING_VIDEO_SIZE_MB:.0f} MB), using text-only embedding"
+                    )
+                    use_text_fallback = True
                 else:
                     # Load video segment
                     video = Video.load_from_file(chunk_video_path)
@@ -232,11 +406,17 @@ class EmbeddingGenerator:
             # Return zero vector as fallback
             return [0.0] * self.embedding_dimensions
 
-    def _process_single_chunk(
-        self, chunk_data: dict, chunk_index: int, total_chunks: int
+    def embed_chunk(
+        self,
+        chunk_data: dict,
+        chunk_index: int,
+        total_chunks: int,
+        text_embedding: Optional[list[float]] = None,
     ) -> dict:
         """
-        Process a single chunk (generate embeddings) - used for parallel processing
+        Generate both embeddings for a single chunk - used for parallel processing
+        Pass text_embedding when it was already generated in a batch
+        (see generate_text_embeddings); failures fall back to zero vectors
 
         Returns:
             Chunk data with embeddings added
@@ -250,7 +430,9 @@ class EmbeddingGenerator:
             # Generate BOTH text and visual embeddings
             chunk_video_path = chunk_data.get("chunk_video_path")
             text_embedding, visual_embedding = self.generate_dual_embeddings(
-                chunk_data, chunk_video_path=chunk_video_path
+                chunk_data,
+                chunk_video_path=chunk_video_path,
+                text_embedding=text_embedding,
             )
 
             # Create chunk with both embeddings
@@ -293,14 +475,19 @@ class EmbeddingGenerator:
         with open(chunks_metadata_path, "r") as f:
             chunks = json.load(f)
 
-        # Process chunks in parallel using ThreadPoolExecutor
+        # Text embeddings in a few batched requests; visual ones per chunk in parallel
+        text_embeddings = self.generate_text_embeddings(chunks)
         chunks_with_embeddings = [None] * len(chunks)  # Pre-allocate to preserve order
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all chunks for processing
             future_to_index = {
                 executor.submit(
-                    self._process_single_chunk, chunk_data, i, len(chunks)
+                    self.embed_chunk,
+                    chunk_data,
+                    i,
+                    len(chunks),
+                    text_embeddings[i],
                 ): i
                 for i, chunk_data in enumerate(chunks)
             }
@@ -419,43 +606,86 @@ class EmbeddingGenerator:
         return (text_weight, visual_weight)
 
     def generate_dual_query_embeddings(
-        self, query: str
-    ) -> tuple[list[float], list[float]]:
+        self, query: str, text: bool = True, visual: bool = True
+    ) -> tuple[Optional[list[float]], Optional[list[float]]]:
         """
         Generate BOTH text and visual embeddings for a search query
 
+        The two embedding calls run concurrently and fail independently: a
+        modality whose embedding could not be generated is returned as None
+        (search then gives it zero weight). Repeated queries are served from
+        the query embedding cache.
+
+        Args:
+            query: Search query
+            text: Generate the text embedding (None is returned otherwise)
+            visual: Generate the visual embedding (None is returned otherwise)
+
         Returns:
             (text_embedding, visual_embedding) tuple
         """
+        text_future = (
+            _query_executor.submit(self._generate_text_query_embedding, query)
+            if text
+            else None
+        )
+        visual_future = (
+            _query_executor.submit(self._generate_visual_query_embedding, query)
+            if visual
+            else None
+        )
+        return (
+            text_future.result() if text_future else None,
+            visual_future.result() if visual_future else None,
+        )
+
+    def _generate_text_query_embedding(self, query: str) -> Optional[list[float]]:
+        """Text embedding of a search query (None on failure)"""
+        query_cache = get_query_cache()
+        model = settings.TEXT_EMBEDDING_MODEL
+
+        embedding = query_cache.get(model, self.text_dimensions, query)
+        if embedding is not None:
+            return embedding
+
         try:
-            # Text embedding using Gemini
-            text_result = retry_with_backoff(
-                lambda: self.client.models.embed_content(
-                    model="gemini-embedding-001", contents=query
-                ),
+            result = retry_with_backoff(
+                lambda: self.client.models.embed_content(model=model, contents=query),
                 max_retries=3,
                 initial_delay=1.0,
             )
-            text_embedding = text_result.embeddings[0].values
+            embedding = result.embeddings[0].values
+        except Exception as e:
+            logger.error(f"Text query embedding error: {e}")
+            return None
+
+        query_cache.put(model, self.text_dimensions, query, embedding)
+        return embedding
+
+    def _generate_visual_query_embedding(self, query: str) -> Optional[list[float]]:
+        """Visual embedding of a search query, from text-only input (None on failure)"""
+        query_cache = get_query_cache()
+        model = settings.VISUAL_EMBEDDING_MODEL
+
+        embedding = query_cache.get(model, self.embedding_dimensions, query)
+        if embedding is not None:
+            return embedding
 
-            # Visual embedding using multimodal model (text-only input for query)
-            visual_result = retry_with_backoff(
+        try:
+            result = retry_with_backoff(
                 lambda: self.visual_model.get_embeddings(
                     contextual_text=query, dimension=self.embedding_dimensions
                 ),
                 max_retries=3,
                 initial_delay=1.0,
             )
-            visual_embedding = visual_result.text_embedding
-
-            return (text_embedding, visual_embedding)
-
+            embedding = result.text_embedding
         except Exception as e:
-            logger.error(f"Query embedding error: {e}")
-            return (
-                [0.0] * self.text_dimensions,
-                [0.0] * self.embedding_dimensions,
-            )
+            logger.error(f"Visual query embedding error: {e}")
+            return None
+
+        query_cache.put(model, self.embedding_dimensions, query, embedding)
+        return embedding
 
 
 # Standalone function for easy import
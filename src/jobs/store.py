@@ -0,0 +1,181 @@
+"""
+Job Store
+Durable ingest job queue backed by a local SQLite database
+"""
+import json
+import sqlite3
+import threading
+import uuid
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Job statuses
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+TERMINAL_STATUSES = (JOB_COMPLETED, JOB_FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress TEXT NOT NULL DEFAULT '{}',
+    result TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS jobs_video ON jobs (video_id, created_at);
+"""
+
+# Databases whose schema was created by this process (stores are built per request)
+_initialized_paths: set[Path] = set()
+_schema_lock = threading.Lock()
+
+
+class JobStore:
+    """
+    SQLite-backed job queue
+
+    Every call opens its own connection, so the store can be shared between
+    the API event loop and worker threads. Jobs survive restarts; jobs that
+    were running when the process stopped are put back in the queue.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or settings.JOBS_DB_PATH
+
+        with _schema_lock:
+            if self.db_path not in _initialized_paths:
+                with self._connection() as conn:
+                    conn.executescript(_SCHEMA)
+                _initialized_paths.add(self.db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Connection that commits on success and is always closed"""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _row_to_job(self, row: Optional[sqlite3.Row]) -> Optional[dict]:
+        if row is None:
+            return None
+
+        job = dict(row)
+        job["progress"] = json.loads(job["progress"] or "{}")
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def create(self, video_id: str, kind: str = "process") -> dict:
+        """Queue a job for a video; returns the job"""
+        now = datetime.utcnow().isoformat()
+        job_id = f"job_{uuid.uuid4().hex[:12]}"
+
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, video_id, kind, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, video_id, kind, JOB_QUEUED, now, now),
+            )
+
+        logger.info(f"Queued {kind} job {job_id} for {video_id}")
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Get a job by ID"""
+        with self._connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row)
+
+    def latest_for_video(self, video_id: str) -> Optional[dict]:
+        """Most recently created job for a video"""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE video_id = ? ORDER BY created_at DESC LIMIT 1",
+                (video_id,),
+            ).fetchone()
+        return self._row_to_job(row)
+
+    def claim_next(self) -> Optional[dict]:
+        """
+        Atomically take the oldest queued job and mark it running
+        Returns the job, or None when the queue is empty
+        """
+        conn = self._connect()
+        try:
+            # Write lock up front so two workers cannot claim the same job
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                (JOB_QUEUED,),
+            ).fetchone()
+
+            if row is None:
+                conn.rollback()
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                (JOB_RUNNING, datetime.utcnow().isoformat(), row["job_id"]),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        return self.get(row["job_id"])
+
+    def update_progress(self, job_id: str, progress: dict):
+        """Replace the progress snapshot of a job"""
+        with self._connection() as conn:
+            conn.execute(
+                "UPDATE jobs SET progress = ?, updated_at = ? WHERE job_id = ?",
+                (json.dumps(progress), datetime.utcnow().isoformat(), job_id),
+            )
+
+    def complete(self, job_id: str, result: dict):
+        """Mark a job completed with its processing summary"""
+        with self._connection() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, updated_at = ? WHERE job_id = ?",
+                (JOB_COMPLETED, json.dumps(result), datetime.utcnow().isoformat(), job_id),
+            )
+
+    def fail(self, job_id: str, error: str):
+        """Mark a job failed"""
+        with self._connection() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE job_id = ?",
+                (JOB_FAILED, error, datetime.utcnow().isoformat(), job_id),
+            )
+
+    def requeue_running(self) -> int:
+        """
+        Put jobs interrupted by a shutdown or crash back in the queue
+        Returns number of jobs requeued
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ?",
+                (JOB_QUEUED, datetime.utcnow().isoformat(), JOB_RUNNING),
+            )
+            return cursor.rowcount
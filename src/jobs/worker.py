@@ -0,0 +1,147 @@
+"""
+Job Worker Pool
+Background threads that run queued ingest jobs
+"""
+import threading
+import time
+import logging
+from typing import Optional
+
+from src.core.config import settings
+from src.jobs.store import JobStore
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages that report per-chunk progress, in processing order
+PIPELINE_STAGES = ["frames", "encode", "transcribe", "describe", "embed", "upsert"]
+
+# Minimum seconds between progress writes within the same stage
+PROGRESS_WRITE_INTERVAL = 0.5
+
+
+class JobProgress:
+    """
+    Folds processing events into a job progress snapshot
+
+    Snapshot format:
+        {
+            "stage": "describe",           # latest stage that reported
+            "chunk_id": "vid_..._30_60",   # latest chunk that finished a stage
+            "stages": {"encode": {"completed": 3, "total": 12}, ...},
+            "percent": 41.7,
+        }
+    """
+
+    def __init__(self, store: JobStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+        self.snapshot = {"stage": "queued", "chunk_id": None, "stages": {}, "percent": 0.0}
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+
+    def __call__(self, event: dict):
+        # Events arrive from the pipeline loop and its decode thread
+        with self._lock:
+            stage = event["stage"]
+            stage_changed = stage != self.snapshot["stage"]
+            self.snapshot["stage"] = stage
+
+            if "total" in event and stage in PIPELINE_STAGES:
+                self.snapshot["stages"][stage] = {
+                    "completed": event.get("completed", 0),
+                    "total": event["total"],
+                }
+                self.snapshot["chunk_id"] = event.get("chunk_id")
+
+            stages = self.snapshot["stages"].values()
+            if stages:
+                done = sum(s["completed"] / s["total"] for s in stages if s["total"])
+                self.snapshot["percent"] = round(100 * done / len(stages), 1)
+
+            stage_done = event.get("completed") == event.get("total")
+            now = time.monotonic()
+            throttled = now - self._last_write < PROGRESS_WRITE_INTERVAL
+            if stage_changed or stage_done or not throttled:
+                self.store.update_progress(self.job_id, self.snapshot)
+                self._last_write = now
+
+
+class JobWorkerPool:
+    """
+    Runs ingest jobs from the JobStore on JOB_WORKERS background threads
+
+    Processing is synchronous and long-running, so it happens here instead of
+    in request handlers, which only queue jobs and return immediately.
+    """
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        num_workers: Optional[int] = None,
+        poll_interval: float = 1.0,
+    ):
+        self.store = store or JobStore()
+        self.num_workers = max(1, num_workers or settings.JOB_WORKERS)
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self):
+        """Requeue interrupted jobs and start the worker threads"""
+        requeued = self.store.requeue_running()
+        if requeued:
+            logger.info(f"Requeued {requeued} interrupted jobs; they resume from checkpoints")
+
+        self._stop.clear()
+        for i in range(self.num_workers):
+            thread = threading.Thread(
+                target=self._run, name=f"job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        logger.info(f"Started {self.num_workers} job workers")
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop taking new jobs
+        A job still running is requeued on the next start and resumed from its checkpoints
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                job = self.store.claim_next()
+            except Exception as e:
+                logger.error(f"Failed to claim job: {e}")
+                job = None
+
+            if job is None:
+                self._stop.wait(self.poll_interval)
+                continue
+
+            self._execute(job)
+
+    def _execute(self, job: dict):
+        """Process the job's video, resuming from any checkpoints it has"""
+        # Lazy import to avoid circular dependencies
+        from src.video_processing.service import resume_video, set_processing_status
+
+        job_id = job["job_id"]
+        video_id = job["video_id"]
+        logger.info(f"Running {job['kind']} job {job_id} for {video_id}...")
+
+        try:
+            result = resume_video(
+                video_id, progress_callback=JobProgress(self.store, job_id)
+            )
+            self.store.complete(job_id, result)
+            logger.info(f"✅ Job {job_id} completed")
+        except Exception as e:
+            logger.error(f"❌ Job {job_id} failed: {e}")
+            self.store.fail(job_id, str(e))
+            set_processing_status(video_id, "failed")
@@ -11,7 +11,8 @@ from fastapi.staticfiles import StaticFiles
 
 from src.core.config import settings
 from src.core.logging import setup_logging
-from src.api.routes import health, videos, search, chat, settings as settings_router
+from src.api.routes import health, videos, search, chat, jobs, uploads, settings as settings_router
+from src.jobs.worker import JobWorkerPool
 
 # Setup logging
 setup_logging(log_level="INFO", log_file="api.log")
@@ -27,8 +28,10 @@ async def lifespan(app: FastAPI):
     - Initialize directories
     - Log configuration
     - Check Qdrant connection
+    - Start ingest job workers (requeueing interrupted jobs)
 
     Shutdown:
+    - Stop ingest job workers
     - Cleanup resources
     """
     # Startup
@@ -41,6 +44,7 @@ async def lifespan(app: FastAPI):
     logger.info(f"  - Qdrant: {settings.QDRANT_HOST}:{settings.QDRANT_PORT}")
     logger.info(f"  - Cascaded reranking: {settings.RERANKING_ENABLED}")
     logger.info(f"  - Embedding workers: {settings.EMBEDDING_MAX_WORKERS}")
+    logger.info(f"  - Ingest job workers: {settings.JOB_WORKERS}")
 
     # Check Qdrant connection
     try:
@@ -55,12 +59,17 @@ async def lifespan(app: FastAPI):
         logger.warning(f"⚠️  Qdrant connection failed: {e}")
         logger.warning("Some features may not work properly")
 
+    # Process queued ingest jobs in the background
+    job_workers = JobWorkerPool()
+    job_workers.start()
+
     logger.info("✅ API startup complete")
 
     yield
 
     # Shutdown
     logger.info("👋 Shutting down Video Library Search Engine API...")
+    job_workers.stop()
 
 
 # Create FastAPI app
@@ -89,7 +98,9 @@ app.include_router(health.router)
 app.include_router(videos.router)
 app.include_router(search.router)
 app.include_router(chat.router)
+app.include_router(jobs.router)
+app.include_router(uploads.router)
 app.include_router(settings_router.router)
 
-logger.info("📋 Registered routes: health, videos, search, chat, settings")
+logger.info("📋 Registered routes: health, videos, search, chat, jobs, uploads, settings")
 logger.info("📁 Serving static files: /frames, /data")
@@ -1,6 +1,7 @@
 """
 Search-related Pydantic Models
 """
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -103,14 +104,28 @@ class IngestVideoResponse(BaseModel):
     """Response from video ingestion"""
 
     video_id: str = Field(..., description="Generated video ID")
-    chunks_count: int = Field(..., description="Number of chunks created")
-    duration_seconds: float = Field(..., description="Video duration")
+    job_id: Optional[str] = Field(None, description="Ingest job processing the video")
+    storage: str = Field(
+        ..., description="How the file was placed: hardlink, reflink or reference"
+    )
+    duplicate: bool = Field(
+        default=False, description="Identical content was already in the library"
+    )
+    chunks_count: Optional[int] = Field(
+        None, description="Number of chunks created (None until processed)"
+    )
+    duration_seconds: Optional[float] = Field(
+        None, description="Video duration (None until processed)"
+    )
 
     class Config:
         json_schema_extra = {
             "example": {
                 "video_id": "abc123",
-                "chunks_count": 15,
-                "duration_seconds": 900.0,
+                "job_id": "job_1a2b3c4d5e6f",
+                "storage": "hardlink",
+                "duplicate": False,
+                "chunks_count": None,
+                "duration_seconds": None,
             }
         }
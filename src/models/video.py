@@ -42,6 +42,10 @@ class VideoChunk(BaseModel):
         default_factory=list, description="Paths to extracted frames (1 FPS)"
     )
     representative_frame: str = Field(default="", description="Middle frame for thumbnails")
+    frame_aliases: dict[str, str] = Field(
+        default_factory=dict,
+        description="Timestamp (ms) of each dropped near-duplicate frame -> kept frame path",
+    )
 
     class Config:
         json_schema_extra = {
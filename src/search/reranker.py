@@ -5,9 +5,9 @@ Tier 2: Text-Only Reranking (Top 50 → Top 5)
 Tier 3: Multimodal Reranking (Top 5 → Final ranked)
 """
 
+import io
 import logging
 import json
-from pathlib import Path
 from typing import Optional
 
 import PIL.Image
@@ -15,6 +15,7 @@ from google import genai
 
 from src.core.config import settings
 from src.models.search import SearchResult
+from src.video_processing.frame_store import read_frame
 from src.utils.prompts import get_text_rerank_prompt, get_multimodal_rerank_prompt
 
 logger = logging.getLogger(__name__)
@@ -341,11 +342,11 @@ Clip {i} (ID: {clip.chunk_id}):
             prompt_parts.append(f"\n--- Clip {i} Frames ---")
 
             for frame_path in item["frame_paths"]:
-                frame_file = Path(frame_path)
-                if frame_file.exists():
+                image_data = read_frame(frame_path)
+                if image_data is not None:
                     # Add image to prompt
                     try:
-                        img = PIL.Image.open(frame_file)
+                        img = PIL.Image.open(io.BytesIO(image_data))
                         prompt_parts.append(img)
                     except Exception as e:
                         logger.warning(f"Could not load frame {frame_path}: {e}")
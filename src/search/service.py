@@ -6,6 +6,7 @@ import logging
 from typing import Optional
 
 from src.core.config import settings
+from src.core.exceptions import EmbeddingGenerationError
 from src.models.search import SearchResult
 from src.embeddings.service import EmbeddingGenerator
 from src.search.vector_db import VideoVectorDB
@@ -14,6 +15,29 @@ from src.search.reranker import TextReranker, MultimodalReranker
 logger = logging.getLogger(__name__)
 
 
+def apply_modality_cutoff(
+    text_weight: float,
+    visual_weight: float,
+    min_weight: Optional[float] = None,
+) -> tuple[float, float]:
+    """
+    Zero the weight of a modality below min_weight (default SEARCH_MIN_MODALITY_WEIGHT)
+
+    The remaining modality gets all the weight. If both fall below the
+    cutoff, the weights are returned unchanged.
+    """
+    if min_weight is None:
+        min_weight = settings.SEARCH_MIN_MODALITY_WEIGHT
+
+    if text_weight < min_weight <= visual_weight:
+        logger.info(f"Text weight {text_weight:.1%} below cutoff - visual search only")
+        return (0.0, 1.0)
+    if visual_weight < min_weight <= text_weight:
+        logger.info(f"Visual weight {visual_weight:.1%} below cutoff - text search only")
+        return (1.0, 0.0)
+    return (text_weight, visual_weight)
+
+
 def search_videos(
     query: str,
     top_k: int = 5,
@@ -64,11 +88,42 @@ def search_videos(
     text_weight, visual_weight = embedding_generator.analyze_query_weights(query)
     logger.info(f"Query weights: text={text_weight:.1%}, visual={visual_weight:.1%}")
 
-    # Generate BOTH text and visual query embeddings
+    # Drop a modality that would barely move the ranking: no embedding call, no search
+    text_weight, visual_weight = apply_modality_cutoff(text_weight, visual_weight)
+
+    # Generate the text and visual query embeddings (concurrently)
     (
         text_embedding,
         visual_embedding,
-    ) = embedding_generator.generate_dual_query_embeddings(query)
+    ) = embedding_generator.generate_dual_query_embeddings(
+        query, text=text_weight > 0, visual=visual_weight > 0
+    )
+
+    # If the only requested embedding failed, fall back to the modality the
+    # cutoff dropped before giving up
+    if text_embedding is None and visual_embedding is None:
+        if text_weight == 0:
+            logger.warning("Visual query embedding failed - falling back to text")
+            text_embedding, _ = embedding_generator.generate_dual_query_embeddings(
+                query, visual=False
+            )
+            text_weight, visual_weight = 1.0, 0.0
+        elif visual_weight == 0:
+            logger.warning("Text query embedding failed - falling back to visual")
+            _, visual_embedding = embedding_generator.generate_dual_query_embeddings(
+                query, text=False
+            )
+            text_weight, visual_weight = 0.0, 1.0
+
+    # A modality whose embedding failed drops out of the ranking
+    if text_embedding is None and visual_embedding is None:
+        raise EmbeddingGenerationError(f"Could not embed query '{query}'")
+    if text_embedding is None and text_weight > 0:
+        logger.warning("Text query embedding failed - searching visual only")
+        text_weight = 0.0
+    if visual_embedding is None and visual_weight > 0:
+        logger.warning("Visual query embedding failed - searching text only")
+        visual_weight = 0.0
 
     # Search using dual embeddings with RRF and intelligent weights
     tier1_results = embedding_generator.vector_db.search_dual(
@@ -293,8 +293,8 @@ class VideoVectorDB:
 
     def search_dual(
         self,
-        text_query_embedding: list[float],
-        visual_query_embedding: list[float],
+        text_query_embedding: Optional[list[float]],
+        visual_query_embedding: Optional[list[float]],
         text_weight: float = 0.5,
         visual_weight: float = 0.5,
         top_k: int = 5,
@@ -311,9 +311,12 @@ class VideoVectorDB:
         Formula: RRF_score = text_weight * (1 / (k + text_rank)) + visual_weight * (1 / (k + visual_rank))
         where k = 60 (standard RRF constant)
 
+        A modality whose query vector is None or whose weight is 0 is not
+        searched at all; RRF is then computed over the remaining ranking.
+
         Args:
-            text_query_embedding: Query vector for text (3072-dim)
-            visual_query_embedding: Query vector for visual (1408-dim)
+            text_query_embedding: Query vector for text (3072-dim), or None to skip
+            visual_query_embedding: Query vector for visual (1408-dim), or None to skip
             text_weight: Weight for text similarity (0.0-1.0)
             visual_weight: Weight for visual similarity (0.0-1.0)
             top_k: Number of results to return
@@ -336,63 +339,49 @@ class VideoVectorDB:
                 ]
             )
 
-        # Search text embeddings - fetch Top N candidates
-        text_results = self.client.query_points(
-            collection_name=self.collection_name,
-            query=text_query_embedding,
-            using="text",  # Use named vector "text"
-            limit=tier1_candidates,  # Fetch more candidates for RRF
-            query_filter=query_filter,
-            with_payload=True,
-        ).points
+        # Search each active modality - fetch Top N candidates
+        rankings = []
+        for using, query_embedding, weight in (
+            ("text", text_query_embedding, text_weight),
+            ("visual", visual_query_embedding, visual_weight),
+        ):
+            if query_embedding is None or weight <= 0:
+                logger.info(f"Skipping {using} search (weight {weight:.2f})")
+                continue
 
-        # Search visual embeddings - fetch Top N candidates
-        visual_results = self.client.query_points(
-            collection_name=self.collection_name,
-            query=visual_query_embedding,
-            using="visual",  # Use named vector "visual"
-            limit=tier1_candidates,  # Fetch more candidates for RRF
-            query_filter=query_filter,
-            with_payload=True,
-        ).points
+            hits = self.client.query_points(
+                collection_name=self.collection_name,
+                query=query_embedding,
+                using=using,  # Named vector "text" / "visual"
+                limit=tier1_candidates,  # Fetch more candidates for RRF
+                query_filter=query_filter,
+                with_payload=True,
+            ).points
+
+            # Rank map: chunk_id -> rank (0-indexed)
+            ranks = {hit.payload["chunk_id"]: idx for idx, hit in enumerate(hits)}
+            rankings.append((weight, ranks, hits))
 
         # RECIPROCAL RANK FUSION (RRF)
-        # RRF_score = Σ (1 / (k + rank_i)) where k = 60
+        # RRF_score = Σ (weight_i / (k + rank_i)) where k = 60
         k = RRF_K_CONSTANT
 
-        # Build rank maps: chunk_id -> rank (0-indexed)
-        text_ranks = {
-            hit.payload["chunk_id"]: idx for idx, hit in enumerate(text_results)
-        }
-        visual_ranks = {
-            hit.payload["chunk_id"]: idx for idx, hit in enumerate(visual_results)
-        }
-
-        # Collect all unique chunk IDs from both searches
-        all_chunk_ids = set(text_ranks.keys()) | set(visual_ranks.keys())
-
-        # Calculate RRF scores for all chunks
+        # Calculate RRF scores for all chunks found by any search
         rrf_scores = {}
         chunk_payloads = {}
 
-        for chunk_id in all_chunk_ids:
-            # Get ranks (use tier1_candidates as max rank if chunk not found in a search)
-            text_rank = text_ranks.get(chunk_id, tier1_candidates)
-            visual_rank = visual_ranks.get(chunk_id, tier1_candidates)
+        for _, ranks, hits in rankings:
+            for chunk_id, rank in ranks.items():
+                # Store payload from whichever search found this chunk first
+                chunk_payloads.setdefault(chunk_id, hits[rank].payload)
 
-            # Apply RRF formula with weights
-            rrf_score = text_weight * (1.0 / (k + text_rank)) + visual_weight * (
-                1.0 / (k + visual_rank)
+        for chunk_id in chunk_payloads:
+            # Use tier1_candidates as max rank if chunk not found in a search
+            rrf_scores[chunk_id] = sum(
+                weight * (1.0 / (k + ranks.get(chunk_id, tier1_candidates)))
+                for weight, ranks, _ in rankings
             )
 
-            rrf_scores[chunk_id] = rrf_score
-
-            # Store payload from whichever search has this chunk
-            if chunk_id in text_ranks:
-                chunk_payloads[chunk_id] = text_results[text_ranks[chunk_id]].payload
-            else:
-                chunk_payloads[chunk_id] = visual_results[visual_ranks[chunk_id]].payload
-
         # Convert to SearchResult objects
         results = []
         for chunk_id, rrf_score in rrf_scores.items():
@@ -0,0 +1,247 @@
+"""
+Resumable Uploads Service
+tus-style chunked uploads: a client creates an upload, then appends bytes at
+the current offset until the declared length is reached
+"""
+import asyncio
+import json
+import os
+import uuid
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from src.core.config import settings
+from src.core.constants import MAX_VIDEO_SIZE_MB
+from src.core.exceptions import ValidationError
+from src.utils.hashing import HASH_BLOCK_SIZE, hash_file_prefix
+from src.video_processing.content_index import ContentIndex
+from src.video_processing.library import (
+    check_video_format,
+    new_video_id,
+    register_video,
+)
+
+logger = logging.getLogger(__name__)
+
+# Running hashes (upload_id -> (offset, sha256)) and per-upload locks
+_running_hashes: dict = {}
+_upload_locks: dict[str, asyncio.Lock] = {}
+
+
+class UploadOffsetMismatch(ValidationError):
+    """PATCH offset does not match the bytes already received"""
+
+    def __init__(self, offset: int):
+        super().__init__(f"Upload offset is {offset}")
+        self.offset = offset
+
+
+class UploadStore:
+    """
+    Resumable uploads stored under UPLOADS_DIR
+
+    Each upload has {upload_id}.part (bytes received so far) and
+    {upload_id}.json (declared length, filename, title, result). The size of
+    the .part file is the upload offset, so an upload interrupted at any
+    point, including a server restart, continues from what reached disk.
+
+    The SHA-256 of the content is computed while bytes are appended. The
+    running hash lives in memory; after a restart it is rebuilt from the
+    partial file once.
+    """
+
+    def __init__(self, uploads_dir: Optional[Path] = None):
+        self.uploads_dir = uploads_dir or settings.UPLOADS_DIR
+        self.uploads_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(MAX_VIDEO_SIZE_MB * 1024 * 1024)
+
+    def _part_path(self, upload_id: str) -> Path:
+        return self.uploads_dir / f"{upload_id}.part"
+
+    def _state_path(self, upload_id: str) -> Path:
+        return self.uploads_dir / f"{upload_id}.json"
+
+    def _save_state(self, state: dict):
+        path = self._state_path(state["upload_id"])
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def create(self, length: int, filename: str, title: str) -> dict:
+        """
+        Start an upload after validating its declared size and format
+        Raises UnsupportedVideoFormatError for unsupported formats and
+        ValidationError for oversize files
+        """
+        check_video_format(Path(filename).suffix.lower())
+        if length <= 0 or length > self.max_bytes:
+            raise ValidationError(
+                f"Upload length must be between 1 byte and {MAX_VIDEO_SIZE_MB:.0f} MB"
+            )
+
+        upload_id = uuid.uuid4().hex
+        state = {
+            "upload_id": upload_id,
+            "filename": filename,
+            "title": title,
+            "length": length,
+            "created_at": datetime.utcnow().isoformat(),
+            "video_id": None,
+            "job_id": None,
+            "duplicate": False,
+        }
+        self._part_path(upload_id).touch()
+        self._save_state(state)
+
+        logger.info(f"Created upload {upload_id}: {filename} ({length} bytes)")
+        return {**state, "offset": 0}
+
+    def get(self, upload_id: str) -> Optional[dict]:
+        """Upload state with its current offset, or None if unknown"""
+        state_path = self._state_path(upload_id)
+        if not state_path.exists():
+            return None
+
+        with open(state_path, "r") as f:
+            state = json.load(f)
+
+        part_path = self._part_path(upload_id)
+        state["offset"] = part_path.stat().st_size if part_path.exists() else state["length"]
+        return state
+
+    async def append(
+        self,
+        upload_id: str,
+        offset: int,
+        stream: AsyncIterator[bytes],
+        content_length: Optional[int] = None,
+    ) -> dict:
+        """
+        Append bytes from stream at offset
+        Bytes that reach disk are kept even if the stream breaks off; the
+        upload is finalized once the declared length has been received.
+        Raises UploadOffsetMismatch when offset is not the current offset, and
+        ValidationError (before writing anything) when content_length would
+        run past the declared length. A stream of unknown size that runs past
+        it is cut at the declared length.
+        Returns the updated upload state
+        """
+        lock = _upload_locks.setdefault(upload_id, asyncio.Lock())
+
+        async with lock:
+            state = await asyncio.to_thread(self.get, upload_id)
+            if state is None:
+                raise FileNotFoundError(upload_id)
+            if state["video_id"] is not None or offset != state["offset"]:
+                raise UploadOffsetMismatch(state["offset"])
+            if content_length is not None and offset + content_length > state["length"]:
+                raise ValidationError(
+                    f"Upload exceeds its declared length of {state['length']} bytes"
+                )
+
+            part_path = self._part_path(upload_id)
+            digest = await self._running_hash(upload_id, part_path, offset)
+            length = state["length"]
+            written = offset
+            overflow = False
+
+            with open(part_path, "ab") as part:
+                buffer = bytearray()
+
+                async def flush():
+                    nonlocal written
+                    data = bytes(buffer)
+                    buffer.clear()
+                    await asyncio.to_thread(part.write, data)
+                    digest.update(data)
+                    written += len(data)
+                    _running_hashes[upload_id] = (written, digest)
+
+                try:
+                    async for block in stream:
+                        if written + len(buffer) + len(block) > length:
+                            block = block[: length - written - len(buffer)]
+                            overflow = True
+                        buffer.extend(block)
+                        if len(buffer) >= HASH_BLOCK_SIZE or overflow:
+                            await flush()
+                        if overflow:
+                            break
+                finally:
+                    # Keep whatever arrived, even if the client disconnected
+                    if buffer:
+                        await flush()
+                    await asyncio.to_thread(part.flush)
+
+            if overflow:
+                logger.warning(
+                    f"Upload {upload_id} sent more than its declared length of "
+                    f"{length} bytes; extra bytes discarded"
+                )
+
+            state["offset"] = written
+            if written == length:
+                state = await asyncio.to_thread(self._finalize, state, digest.hexdigest())
+
+            return state
+
+    async def _running_hash(self, upload_id: str, part_path: Path, offset: int):
+        """Running SHA-256 of the first offset bytes of an upload"""
+        cached = _running_hashes.get(upload_id)
+        if cached is not None and cached[0] == offset:
+            return cached[1]
+
+        # Server restarted (or another worker took the previous PATCH)
+        digest = await asyncio.to_thread(hash_file_prefix, part_path, offset)
+        _running_hashes[upload_id] = (offset, digest)
+        return digest
+
+    def _finalize(self, state: dict, content_sha256: str) -> dict:
+        """Move a completed upload into the library and queue its processing"""
+        upload_id = state["upload_id"]
+        part_path = self._part_path(upload_id)
+
+        existing_video_id = ContentIndex().lookup(content_sha256)
+        if existing_video_id:
+            logger.info(
+                f"Upload {upload_id} matches existing video {existing_video_id}, "
+                f"skipping processing"
+            )
+            part_path.unlink()
+            state.update({"video_id": existing_video_id, "duplicate": True})
+            self._save_state(state)
+            self._release(upload_id)
+            return state
+
+        video_id = new_video_id()
+        video_path = settings.VIDEOS_DIR / f"{video_id}{Path(state['filename']).suffix.lower()}"
+        os.replace(part_path, video_path)
+
+        _, job = register_video(
+            video_id, state["title"], video_path, state["filename"], content_sha256
+        )
+        logger.info(f"✅ Upload {upload_id} complete: {video_id}, job {job['job_id']}")
+
+        state.update({"video_id": video_id, "job_id": job["job_id"]})
+        self._save_state(state)
+        self._release(upload_id)
+        return state
+
+    def _release(self, upload_id: str):
+        """Drop the in-memory state of an upload that is finished or deleted"""
+        _running_hashes.pop(upload_id, None)
+        _upload_locks.pop(upload_id, None)
+
+    def delete(self, upload_id: str) -> bool:
+        """Discard an upload; returns False if it does not exist"""
+        state_path = self._state_path(upload_id)
+        if not state_path.exists():
+            return False
+
+        self._part_path(upload_id).unlink(missing_ok=True)
+        state_path.unlink()
+        self._release(upload_id)
+        return True
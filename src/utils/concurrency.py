@@ -0,0 +1,30 @@
+"""
+Concurrency Utilities
+Helpers for running async code from synchronous call sites
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code
+
+    Uses asyncio.run when no event loop is running in this thread. When called
+    from inside a running loop (e.g. a sync helper invoked by an async route
+    handler), the coroutine runs on its own loop in a separate thread instead,
+    since asyncio.run cannot nest.
+
+    Example:
+        analysis = run_sync(analyzer.adescribe_chunk(...))
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,56 @@
+"""
+File Utilities
+Placing local files into the library without copying their contents
+"""
+import os
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# ioctl request that clones a file's extents (Linux: Btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+
+def reflink(source: Path, destination: Path):
+    """
+    Create destination as a copy-on-write clone of source
+    Raises OSError when the platform or filesystem does not support it
+    """
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("Reflinks are not supported on this platform")
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            destination.unlink(missing_ok=True)
+            raise
+
+
+def link_or_reference(source: Path, destination: Path) -> tuple[Path, str]:
+    """
+    Make source available at destination without copying its data
+
+    Tries, in order: a hardlink, a reflink (copy-on-write clone), and finally
+    referencing source in place.
+
+    Returns (path the library should use, storage mode: "hardlink", "reflink"
+    or "reference")
+    """
+    try:
+        os.link(source, destination)
+        return destination, "hardlink"
+    except OSError as e:
+        logger.debug(f"Hardlink unavailable for {source}: {e}")
+
+    try:
+        reflink(source, destination)
+        return destination, "reflink"
+    except OSError as e:
+        logger.debug(f"Reflink unavailable for {source}: {e}")
+
+    return source, "reference"
@@ -0,0 +1,73 @@
+"""
+Hashing Utilities
+Content hashes computed while files are streamed, so no second read is needed
+"""
+import hashlib
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from src.core.exceptions import ValidationError
+
+HASH_BLOCK_SIZE = 1024 * 1024  # 1MB
+
+
+def copy_and_hash(
+    source: BinaryIO, destination: Path, max_bytes: Optional[int] = None
+) -> str:
+    """
+    Copy a file object to destination, hashing the bytes as they are written
+    Stops and removes destination as soon as more than max_bytes arrive
+    Returns hex SHA-256 of the copied content
+    """
+    digest = hashlib.sha256()
+    written = 0
+
+    with open(destination, "wb") as buffer:
+        while True:
+            block = source.read(HASH_BLOCK_SIZE)
+            if not block:
+                break
+
+            written += len(block)
+            if max_bytes is not None and written > max_bytes:
+                buffer.close()
+                destination.unlink(missing_ok=True)
+                raise ValidationError(f"File exceeds the maximum size of {max_bytes} bytes")
+
+            digest.update(block)
+            buffer.write(block)
+
+    return digest.hexdigest()
+
+
+def hash_file_prefix(path: Path, num_bytes: int):
+    """
+    Hash the first num_bytes of a file
+    Returns the running hash object so more data can be added to it
+    """
+    digest = hashlib.sha256()
+    remaining = num_bytes
+
+    with open(path, "rb") as f:
+        while remaining > 0:
+            block = f.read(min(HASH_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+
+    return digest
+
+
+def hash_file(path: Path) -> str:
+    """Hex SHA-256 of a file on disk"""
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(HASH_BLOCK_SIZE)
+            if not block:
+                break
+            digest.update(block)
+
+    return digest.hexdigest()
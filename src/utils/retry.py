@@ -4,6 +4,7 @@ Retry Utilities with Exponential Backoff
 import time
 import logging
 from google.api_core import exceptions as google_exceptions
+from google.genai import errors as genai_errors
 
 from src.core.constants import MAX_RETRIES, INITIAL_RETRY_DELAY, RETRY_EXPONENTIAL_BASE
 
@@ -18,6 +19,7 @@ def retry_with_backoff(
 ):
     """
     Retry a function with exponential backoff for quota/rate limit errors
+    Covers Vertex AI ResourceExhausted and google-genai 429 / 5xx API errors
 
     Args:
         func: Function to retry (should be a lambda/callable)
@@ -30,6 +32,8 @@ def retry_with_backoff(
 
     Raises:
         google_exceptions.ResourceExhausted: If max retries exceeded
+        genai_errors.APIError: For 429 / 5xx errors once max retries are exceeded,
+            and immediately for other client errors
         google_exceptions.InvalidArgument: For non-retryable errors
         Exception: For other errors
 
@@ -57,6 +61,22 @@ def retry_with_backoff(
                 logger.error(f"Max retries reached. Quota error: {e}")
                 raise
 
+        except genai_errors.APIError as e:
+            # google-genai reports rate limits and server errors by status code
+            if e.code != 429 and not (isinstance(e.code, int) and e.code >= 500):
+                logger.error(f"Gemini API error: {e}")
+                raise
+            if attempt < max_retries:
+                logger.warning(
+                    f"Gemini API error {e.code}, retrying in {delay}s... "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                time.sleep(delay)
+                delay *= exponential_base  # Exponential backoff
+            else:
+                logger.error(f"Max retries reached. Gemini API error: {e}")
+                raise
+
         except google_exceptions.InvalidArgument as e:
             # Invalid argument errors - check if retryable
             error_msg = str(e)
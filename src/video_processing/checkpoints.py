@@ -0,0 +1,99 @@
+"""
+Chunk Checkpoints
+Per-chunk processing state persisted as each pipeline stage finishes
+"""
+import json
+import os
+import shutil
+import logging
+from pathlib import Path
+from typing import Optional
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkCheckpointStore:
+    """
+    One JSON file per chunk under FRAMES_DIR/{video_id}/checkpoints
+
+    A checkpoint records everything a finished stage produced for a chunk
+    (frame paths, chunk video, raw transcript, analysis, embeddings, and
+    whether it was upserted), so a failed or interrupted run can be resumed
+    without repeating completed work. Files are replaced atomically, so a
+    crash mid-write leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, video_id: str, frames_dir: Optional[Path] = None):
+        self.video_id = video_id
+        self.checkpoints_dir = (frames_dir or settings.FRAMES_DIR) / video_id / "checkpoints"
+
+    def _path(self, chunk_id: str) -> Path:
+        return self.checkpoints_dir / f"{chunk_id}.json"
+
+    def load(self, chunk_info: dict) -> dict:
+        """
+        Load the checkpoint for a chunk
+        Returns {} when there is none or it belongs to a different chunk layout
+        """
+        path = self._path(chunk_info["chunk_id"])
+        if not path.exists():
+            return {}
+
+        try:
+            with open(path, "r") as f:
+                checkpoint = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path.name}: {e}")
+            return {}
+
+        if (
+            checkpoint.get("start_time") != chunk_info["start_time"]
+            or checkpoint.get("end_time") != chunk_info["end_time"]
+        ):
+            return {}
+
+        return checkpoint
+
+    def load_all(self, chunks: list[dict]) -> dict[str, dict]:
+        """Load checkpoints for chunks; returns chunk_id -> checkpoint (completed ones only)"""
+        checkpoints = {}
+        for chunk_info in chunks:
+            checkpoint = self.load(chunk_info)
+            if checkpoint:
+                checkpoints[chunk_info["chunk_id"]] = checkpoint
+
+        if checkpoints:
+            logger.info(
+                f"Resuming {self.video_id}: {len(checkpoints)}/{len(chunks)} chunks "
+                f"have checkpoints"
+            )
+        return checkpoints
+
+    def save(self, chunk_info: dict, state: dict):
+        """Write the checkpoint for a chunk"""
+        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+
+        path = self._path(chunk_info["chunk_id"])
+        tmp_path = path.with_suffix(".json.tmp")
+
+        checkpoint = {
+            "chunk_id": chunk_info["chunk_id"],
+            "start_time": chunk_info["start_time"],
+            "end_time": chunk_info["end_time"],
+            **state,
+        }
+
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, path)
+
+    def exists(self) -> bool:
+        """Check whether any checkpoint was written for this video"""
+        return self.checkpoints_dir.exists() and any(self.checkpoints_dir.glob("*.json"))
+
+    def clear(self):
+        """Remove all checkpoints once processing has completed"""
+        if self.checkpoints_dir.exists():
+            shutil.rmtree(self.checkpoints_dir)
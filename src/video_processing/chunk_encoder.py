@@ -0,0 +1,289 @@
+"""
+Chunk Encoder
+Materializes chunk video files for the multimodal embedding API
+"""
+import subprocess
+import logging
+from pathlib import Path
+from typing import Optional
+
+from src.core.config import settings
+from src.core.constants import (
+    MAX_EMBEDDING_VIDEO_SIZE_MB,
+    MAX_CHUNK_WIDTH,
+    MAX_CHUNK_HEIGHT,
+    STREAM_COPY_VIDEO_CODECS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Max 720p, keeping the aspect ratio
+SCALE_FILTER = (
+    f"scale='min({MAX_CHUNK_WIDTH},iw)':'min({MAX_CHUNK_HEIGHT},ih)'"
+    ":force_original_aspect_ratio=decrease"
+)
+
+AUDIO_BITRATE_KBPS = 96
+# Share of the embedding size limit the encode aims for (container overhead, VBV slack)
+TARGET_SIZE_RATIO = 0.9
+# Lowest video bitrate cap worth encoding at
+MIN_VIDEO_BITRATE_KBPS = 150
+
+
+class ChunkEncoder:
+    """
+    Extracts chunk videos with as few source decodes as possible
+
+    - Re-encode mode: chunks are grouped into batches and every batch is produced
+      by a single ffmpeg invocation that seeks on the input side to the batch
+      start, decodes the span once and fans it out to one encoder per chunk
+    - Stream-copy mode: when the source codec, resolution and bitrate already fit
+      the embedding API limits, chunks are cut without re-encoding the video
+
+    Re-encoded chunks are capped at a video bitrate derived from the chunk
+    duration and the embedding API size limit, and every output is size-checked;
+    an oversize chunk is re-encoded once at a proportionally lower cap.
+    """
+
+    def __init__(
+        self,
+        frames_dir: Optional[Path] = None,
+        batch_size: Optional[int] = None,
+        stream_copy: Optional[bool] = None,
+    ):
+        self.frames_dir = frames_dir or settings.FRAMES_DIR
+        self.batch_size = max(1, batch_size or settings.CHUNK_ENCODE_BATCH_SIZE)
+        self.stream_copy = (
+            settings.CHUNK_STREAM_COPY if stream_copy is None else stream_copy
+        )
+        self.max_size_bytes = int(MAX_EMBEDDING_VIDEO_SIZE_MB * 1024 * 1024)
+        self.preset = settings.CHUNK_ENCODE_PRESET
+
+    def chunk_output_path(self, chunk_info: dict) -> Path:
+        """Path of the chunk video file for a chunk"""
+        chunks_dir = self.frames_dir / chunk_info["video_id"] / "chunks"
+        chunks_dir.mkdir(parents=True, exist_ok=True)
+        return chunks_dir / f"{chunk_info['chunk_id']}.mp4"
+
+    def can_stream_copy(self, video_metadata: dict, chunks: list[dict]) -> bool:
+        """
+        Check whether chunks can be cut from the source without re-encoding
+
+        Requires an H.264 source no larger than 720p whose average bitrate keeps
+        the longest chunk under the embedding API size limit.
+        """
+        if not self.stream_copy:
+            return False
+
+        codec = (video_metadata.get("codec") or "").lower()
+        if codec not in STREAM_COPY_VIDEO_CODECS:
+            return False
+
+        width, height = video_metadata.get("resolution", [0, 0])
+        if width > MAX_CHUNK_WIDTH or height > MAX_CHUNK_HEIGHT:
+            return False
+
+        duration = video_metadata.get("duration_seconds", 0)
+        if duration <= 0 or not chunks:
+            return False
+
+        bytes_per_second = video_metadata["file_size_mb"] * 1024 * 1024 / duration
+        longest_chunk = max(chunk["duration"] for chunk in chunks)
+
+        # Leave headroom for bitrate peaks within a chunk
+        return bytes_per_second * longest_chunk <= self.max_size_bytes * 0.8
+
+    def encode_chunks(
+        self, video_path: str, chunks: list[dict], video_metadata: dict
+    ) -> dict[str, str]:
+        """
+        Materialize all chunk videos of a source
+        Returns dict mapping chunk_id -> chunk video path ("" if extraction failed)
+        """
+        chunk_paths = {}
+
+        if self.can_stream_copy(video_metadata, chunks):
+            logger.info(f"Stream-copying {len(chunks)} chunks (no video re-encode)")
+            for chunk_info in chunks:
+                chunk_paths[chunk_info["chunk_id"]] = self.copy_chunk(
+                    video_path, chunk_info
+                )
+            return chunk_paths
+
+        logger.info(
+            f"Encoding {len(chunks)} chunks in batches of {self.batch_size}"
+        )
+        for i in range(0, len(chunks), self.batch_size):
+            batch = chunks[i : i + self.batch_size]
+            chunk_paths.update(self._encode_batch(video_path, batch))
+
+        return chunk_paths
+
+    def video_bitrate_kbps(self, duration: float, size_ratio: float = 1.0) -> int:
+        """Video bitrate cap that keeps a chunk of duration under the size limit"""
+        target_bits = self.max_size_bytes * TARGET_SIZE_RATIO * size_ratio * 8
+        total_kbps = target_bits / max(duration, 1.0) / 1000
+        return max(MIN_VIDEO_BITRATE_KBPS, int(total_kbps - AUDIO_BITRATE_KBPS))
+
+    def encode_chunk(
+        self, video_path: str, chunk_info: dict, size_ratio: float = 1.0
+    ) -> str:
+        """
+        Re-encode a single chunk using input-side seeking
+        Returns path to the chunk video file ("" if extraction failed)
+        """
+        output_path = self.chunk_output_path(chunk_info)
+
+        cmd = [
+            "ffmpeg",
+            "-ss",
+            str(chunk_info["start_time"]),  # Input-side seek: no decode before start
+            "-i",
+            video_path,
+            "-t",
+            str(chunk_info["duration"]),
+            *self._encode_options(chunk_info["duration"], size_ratio),
+            "-y",  # Overwrite output file
+            str(output_path),
+        ]
+
+        if not self._run_ffmpeg(cmd, chunk_info["chunk_id"]):
+            return ""
+        if size_ratio < 1.0:
+            # Already the retry; the embedding step checks the size again
+            return str(output_path)
+        return self._check_size(video_path, chunk_info, str(output_path))
+
+    def _check_size(self, video_path: str, chunk_info: dict, output_path: str) -> str:
+        """
+        Verify a re-encoded chunk fits the embedding API limit
+        Oversize chunks are re-encoded once with the cap scaled by the overshoot
+        """
+        size_bytes = Path(output_path).stat().st_size
+        if size_bytes <= self.max_size_bytes:
+            return output_path
+
+        logger.warning(
+            f"Chunk {chunk_info['chunk_id']} is {size_bytes / (1024 * 1024):.1f} MB, "
+            f"re-encoding at a lower bitrate"
+        )
+        return self.encode_chunk(
+            video_path, chunk_info, size_ratio=self.max_size_bytes / size_bytes
+        )
+
+    def copy_chunk(self, video_path: str, chunk_info: dict) -> str:
+        """
+        Cut a single chunk with video stream copy
+
+        The cut starts at the keyframe at or before start_time, so the file may
+        begin slightly early unless chunk boundaries were snapped to keyframes.
+        Falls back to re-encoding if the result is over the embedding size
+        limit.
+        """
+        output_path = self.chunk_output_path(chunk_info)
+
+        cmd = [
+            "ffmpeg",
+            "-ss",
+            str(chunk_info["start_time"]),
+            "-i",
+            video_path,
+            "-t",
+            str(chunk_info["duration"]),
+            "-c:v",
+            "copy",  # No video re-encode
+            "-c:a",
+            "aac",  # Audio is cheap to re-encode and keeps the container valid
+            "-b:a",
+            "96k",
+            "-movflags",
+            "+faststart",
+            "-y",
+            str(output_path),
+        ]
+
+        if (
+            self._run_ffmpeg(cmd, chunk_info["chunk_id"])
+            and output_path.stat().st_size <= self.max_size_bytes
+        ):
+            return str(output_path)
+
+        logger.warning(
+            f"Stream copy unusable for {chunk_info['chunk_id']}, re-encoding"
+        )
+        return self.encode_chunk(video_path, chunk_info)
+
+    def _encode_batch(self, video_path: str, batch: list[dict]) -> dict[str, str]:
+        """
+        Encode a batch of chunks with one ffmpeg invocation
+
+        The input is seeked to the batch start and decoded once; each output
+        trims its own window relative to that point.
+        """
+        batch_start = batch[0]["start_time"]
+
+        cmd = ["ffmpeg", "-ss", str(batch_start), "-i", video_path]
+        output_paths = {}
+
+        for chunk_info in batch:
+            output_path = self.chunk_output_path(chunk_info)
+            output_paths[chunk_info["chunk_id"]] = str(output_path)
+            cmd += [
+                "-ss",
+                str(round(chunk_info["start_time"] - batch_start, 3)),
+                "-t",
+                str(chunk_info["duration"]),
+                *self._encode_options(chunk_info["duration"]),
+                "-y",
+                str(output_path),
+            ]
+
+        batch_label = f"{batch[0]['chunk_id']}..{batch[-1]['chunk_id']}"
+        if self._run_ffmpeg(cmd, batch_label):
+            logger.debug(f"Encoded {len(batch)} chunks in one pass: {batch_label}")
+            return {
+                chunk_info["chunk_id"]: self._check_size(
+                    video_path, chunk_info, output_paths[chunk_info["chunk_id"]]
+                )
+                for chunk_info in batch
+            }
+
+        # Fall back to encoding each chunk on its own
+        return {
+            chunk_info["chunk_id"]: self.encode_chunk(video_path, chunk_info)
+            for chunk_info in batch
+        }
+
+    def _encode_options(self, duration: float, size_ratio: float = 1.0) -> list[str]:
+        """Per-output encoding options for re-encoded chunks"""
+        # Target: Keep chunks under the multimodal embedding API size limit
+        maxrate_kbps = self.video_bitrate_kbps(duration, size_ratio)
+        return [
+            "-c:v",
+            "libx264",  # Re-encode video
+            "-preset",
+            self.preset,  # Chunks are throwaway inputs for the embedding API
+            "-crf",
+            "28",  # Higher CRF = more compression (18-28 range, 28 is good)
+            "-maxrate",
+            f"{maxrate_kbps}k",  # Capped CRF: bitrate can't exceed the size budget
+            "-bufsize",
+            f"{maxrate_kbps}k",
+            "-vf",
+            SCALE_FILTER,
+            "-c:a",
+            "aac",  # Re-encode audio
+            "-b:a",
+            f"{AUDIO_BITRATE_KBPS}k",  # Lower audio bitrate (96kbps is sufficient)
+            "-movflags",
+            "+faststart",  # Optimize for streaming
+        ]
+
+    def _run_ffmpeg(self, cmd: list[str], label: str) -> bool:
+        """Run an ffmpeg command, logging stderr on failure"""
+        try:
+            subprocess.run(cmd, check=True, capture_output=True)
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.error(f"ffmpeg error extracting {label}: {e.stderr.decode()}")
+            return False
@@ -0,0 +1,73 @@
+"""
+Content Index
+Maps the SHA-256 of uploaded video content to the video_id that holds it
+"""
+import json
+import os
+import threading
+import logging
+from pathlib import Path
+from typing import Optional
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+
+
+class ContentIndex:
+    """
+    JSON index of content_sha256 -> video_id
+
+    Stored at DATA_DIR/content_index.json (outside METADATA_DIR, which only
+    holds per-video files). Identical uploads resolve to the first video that
+    was stored with that content.
+    """
+
+    def __init__(self, index_path: Optional[Path] = None):
+        self.index_path = index_path or settings.DATA_DIR / "content_index.json"
+
+    def _load(self) -> dict[str, str]:
+        if not self.index_path.exists():
+            return {}
+
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Content index unreadable, starting empty: {e}")
+            return {}
+
+    def _save(self, index: dict[str, str]):
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def lookup(self, content_sha256: str) -> Optional[str]:
+        """
+        Find the video holding this content
+        Returns video_id, or None if unknown or its metadata no longer exists
+        """
+        with _lock:
+            video_id = self._load().get(content_sha256)
+
+        if video_id and (settings.METADATA_DIR / f"{video_id}.json").exists():
+            return video_id
+        return None
+
+    def add(self, content_sha256: str, video_id: str):
+        """Record the video holding this content"""
+        with _lock:
+            index = self._load()
+            index[content_sha256] = video_id
+            self._save(index)
+
+    def remove_video(self, video_id: str):
+        """Drop every entry pointing at a video"""
+        with _lock:
+            index = self._load()
+            remaining = {sha: vid for sha, vid in index.items() if vid != video_id}
+            if len(remaining) != len(index):
+                self._save(remaining)
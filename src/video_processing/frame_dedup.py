@@ -0,0 +1,56 @@
+"""
+Frame Deduplication
+Perceptual hashing to drop near-identical sampled frames
+"""
+from typing import Optional
+
+import cv2
+import numpy as np
+
+# dHash compares hash_size x hash_size adjacent pixel pairs (64 bits)
+DHASH_SIZE = 8
+
+
+def dhash(frame: np.ndarray, hash_size: int = DHASH_SIZE) -> int:
+    """
+    Difference hash of a BGR frame
+
+    The frame is reduced to a (hash_size + 1) x hash_size grayscale thumbnail
+    and each bit records whether a pixel is brighter than its right neighbour,
+    so the hash is stable under compression noise and small exposure changes.
+    """
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    thumbnail = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    bits = thumbnail[:, 1:] > thumbnail[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes"""
+    return (a ^ b).bit_count()
+
+
+class FrameDeduplicator:
+    """
+    Tracks the last kept frame of a decode and flags near-duplicates of it
+
+    Frames are compared in decode order against the most recently kept frame,
+    so a slowly drifting scene still keeps a frame whenever it has moved more
+    than max_distance bits away from the last one stored.
+    """
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        self.last_hash: Optional[int] = None
+
+    def is_duplicate(self, frame: np.ndarray) -> bool:
+        """Check a frame; frames that are not duplicates become the new reference"""
+        frame_hash = dhash(frame)
+        if (
+            self.last_hash is not None
+            and hamming_distance(frame_hash, self.last_hash) <= self.max_distance
+        ):
+            return True
+
+        self.last_hash = frame_hash
+        return False
@@ -0,0 +1,349 @@
+"""
+Frame Store
+Sampled frames stored as loose JPEG files or packed into one file per video
+"""
+import bisect
+import mmap
+import os
+import re
+import struct
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from src.core.config import settings
+from src.core.exceptions import VideoProcessingError
+
+logger = logging.getLogger(__name__)
+
+JPEG_QUALITY = 90
+PACK_FILENAME = "frames.pack"
+PACK_MAGIC = b"VFPACK01"
+
+# Record: marker, timestamp_ms, JPEG length, followed by the JPEG bytes
+RECORD_MARKER = b"FRM0"
+RECORD_HEADER = struct.Struct("<4sQI")
+# Index entry: timestamp_ms, JPEG offset, JPEG length
+INDEX_ENTRY = struct.Struct("<QQI")
+# Footer: index offset, number of index entries, magic
+FOOTER = struct.Struct("<QI8s")
+
+# Open pack readers kept mapped at once
+MAX_OPEN_PACKS = 32
+# Loose frame directory listings kept for timestamp lookups
+MAX_CACHED_LISTINGS = 32
+
+FRAME_FILENAME_PATTERN = re.compile(r"frame_(\d+)\.jpg$")
+
+
+def pack_path_for(video_id: str, frames_dir: Optional[Path] = None) -> Path:
+    """Path of the frame pack of a video"""
+    return (frames_dir or settings.FRAMES_DIR) / video_id / PACK_FILENAME
+
+
+def parse_frame_ref(frame_ref: str) -> tuple[Path, Optional[int]]:
+    """
+    Split a frame reference into (path, timestamp_ms)
+    Packed frames are referenced as "{pack_path}#{timestamp_ms}"; loose
+    frames by their file path (timestamp_ms is None)
+    """
+    path, sep, timestamp_ms = frame_ref.rpartition("#")
+    if not sep or not timestamp_ms.isdigit():
+        return Path(frame_ref), None
+    return Path(path), int(timestamp_ms)
+
+
+class LooseFrameWriter:
+    """Writes each frame as FRAMES_DIR/{video_id}/frames/frame_{ms}.jpg"""
+
+    def __init__(self, video_id: str, frames_dir: Optional[Path] = None):
+        self.frames_dir = (frames_dir or settings.FRAMES_DIR) / video_id / "frames"
+        self.frames_dir.mkdir(parents=True, exist_ok=True)
+
+    def add(self, timestamp_ms: int, frame: np.ndarray) -> str:
+        """Store a frame; returns its reference"""
+        frame_path = str(self.frames_dir / f"frame_{timestamp_ms:08d}.jpg")
+        cv2.imwrite(frame_path, frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        return frame_path
+
+    def close(self):
+        pass
+
+
+class FramePackWriter:
+    """
+    Appends frames to FRAMES_DIR/{video_id}/frames.pack
+
+    Records are flushed as they are added, so readers in other threads can
+    serve a frame while the decode is still running. close() appends an
+    offset index and a footer so later readers don't have to scan the pack.
+    A previous pack is unlinked rather than truncated; readers that still
+    map it keep a valid view until they notice the new file.
+    """
+
+    def __init__(self, video_id: str, frames_dir: Optional[Path] = None):
+        self.pack_path = pack_path_for(video_id, frames_dir)
+        self.pack_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pack_path.unlink(missing_ok=True)
+
+        self.file = open(self.pack_path, "wb")
+        self.index: list[tuple[int, int, int]] = []
+
+    def add(self, timestamp_ms: int, frame: np.ndarray) -> str:
+        """Store a frame; returns its reference"""
+        ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        if not ok:
+            raise VideoProcessingError(f"Could not encode frame at {timestamp_ms}ms")
+
+        data = encoded.tobytes()
+        offset = self.file.tell() + RECORD_HEADER.size
+        self.file.write(RECORD_HEADER.pack(RECORD_MARKER, timestamp_ms, len(data)) + data)
+        self.file.flush()
+
+        self.index.append((timestamp_ms, offset, len(data)))
+        return f"{self.pack_path}#{timestamp_ms}"
+
+    def close(self):
+        """Write the index and footer (one write, so readers never see half of it)"""
+        if self.file.closed:
+            return
+
+        index_offset = self.file.tell()
+        trailer = b"".join(INDEX_ENTRY.pack(*entry) for entry in self.index)
+        trailer += FOOTER.pack(index_offset, len(self.index), PACK_MAGIC)
+        self.file.write(trailer)
+        self.file.close()
+
+        logger.debug(f"Packed {len(self.index)} frames into {self.pack_path}")
+
+
+class FramePackReader:
+    """
+    Memory-mapped reader for a frame pack
+
+    Finished packs are indexed from their footer. Packs still being written
+    (or left behind by an interrupted decode) are indexed by scanning the
+    records, continuing from where the previous scan stopped as the file grows.
+    Every read stats the pack (far cheaper than opening a file per frame) so
+    a pack rewritten by a new decode is picked up.
+    """
+
+    def __init__(self, pack_path: Path):
+        self.pack_path = pack_path
+        self.lock = threading.Lock()
+        self.file = None
+        self.mmap = None
+        self._reset()
+
+    def _reset(self):
+        self.close()
+        self.file = open(self.pack_path, "rb")
+        self.inode = os.fstat(self.file.fileno()).st_ino
+        self.size = 0
+        self.scanned = 0
+        self.index: dict[int, tuple[int, int]] = {}
+        self.timestamps: list[int] = []
+
+    def _refresh(self):
+        stat = os.stat(self.pack_path)
+        if self.file is None or stat.st_ino != self.inode or stat.st_size < self.size:
+            # Closed after eviction, or the pack was rewritten by a new decode
+            self._reset()
+        if stat.st_size == self.size or stat.st_size == 0:
+            return
+
+        if self.mmap is not None:
+            self.mmap.close()
+        self.size = stat.st_size
+        self.mmap = mmap.mmap(self.file.fileno(), self.size, access=mmap.ACCESS_READ)
+
+        if self.size >= FOOTER.size:
+            index_offset, count, magic = FOOTER.unpack_from(self.mmap, self.size - FOOTER.size)
+            if magic == PACK_MAGIC:
+                self.index = {
+                    timestamp_ms: (offset, length)
+                    for timestamp_ms, offset, length in INDEX_ENTRY.iter_unpack(
+                        self.mmap[index_offset : index_offset + count * INDEX_ENTRY.size]
+                    )
+                }
+                self.timestamps = sorted(self.index)
+                return
+
+        position = self.scanned
+        while position + RECORD_HEADER.size <= self.size:
+            marker, timestamp_ms, length = RECORD_HEADER.unpack_from(self.mmap, position)
+            start = position + RECORD_HEADER.size
+            if marker != RECORD_MARKER or start + length > self.size:
+                break
+            self.index[timestamp_ms] = (start, length)
+            position = start + length
+        self.scanned = position
+        self.timestamps = sorted(self.index)
+
+    def read(self, timestamp_ms: int) -> Optional[bytes]:
+        """JPEG bytes of the frame at exactly timestamp_ms, or None"""
+        with self.lock:
+            self._refresh()
+            entry = self.index.get(timestamp_ms)
+            if entry is None:
+                return None
+            offset, length = entry
+            return self.mmap[offset : offset + length]
+
+    def nearest(self, timestamp_ms: int) -> Optional[int]:
+        """Timestamp of the last stored frame at or before timestamp_ms"""
+        with self.lock:
+            self._refresh()
+            i = bisect.bisect_right(self.timestamps, timestamp_ms)
+            return self.timestamps[i - 1] if i else None
+
+    def close(self):
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+_readers: OrderedDict[Path, FramePackReader] = OrderedDict()
+_readers_lock = threading.Lock()
+
+
+def _pack_reader(pack_path: Path) -> Optional[FramePackReader]:
+    """Shared reader for a pack (least recently used packs are unmapped)"""
+    with _readers_lock:
+        reader = _readers.get(pack_path)
+        if reader is not None:
+            _readers.move_to_end(pack_path)
+            return reader
+
+        if not pack_path.exists():
+            return None
+
+        reader = FramePackReader(pack_path)
+        _readers[pack_path] = reader
+        while len(_readers) > MAX_OPEN_PACKS:
+            _, evicted = _readers.popitem(last=False)
+            with evicted.lock:
+                evicted.close()
+        return reader
+
+
+def _drop_pack_reader(pack_path: Path):
+    """Forget the reader of a pack that was deleted (e.g. with its video)"""
+    with _readers_lock:
+        reader = _readers.pop(pack_path, None)
+    if reader is not None:
+        with reader.lock:
+            reader.close()
+
+
+_listings: OrderedDict[Path, tuple[int, list[int]]] = OrderedDict()
+_listings_lock = threading.Lock()
+
+
+def _loose_timestamps(frames_dir: Path) -> list[int]:
+    """
+    Sorted timestamps of the loose frames in a directory
+    Listings are cached and only re-read when the directory's mtime changes,
+    so a lookup costs one stat instead of a full directory scan
+    """
+    mtime_ns = os.stat(frames_dir).st_mtime_ns
+
+    with _listings_lock:
+        cached = _listings.get(frames_dir)
+        if cached is not None and cached[0] == mtime_ns:
+            _listings.move_to_end(frames_dir)
+            return cached[1]
+
+    timestamps = sorted(
+        int(match.group(1))
+        for name in os.listdir(frames_dir)
+        if (match := FRAME_FILENAME_PATTERN.match(name))
+    )
+
+    with _listings_lock:
+        _listings[frames_dir] = (mtime_ns, timestamps)
+        _listings.move_to_end(frames_dir)
+        while len(_listings) > MAX_CACHED_LISTINGS:
+            _listings.popitem(last=False)
+    return timestamps
+
+
+def open_frame_writer(video_id: str, frames_dir: Optional[Path] = None):
+    """Frame writer for the configured FRAME_STORE ("files" or "pack")"""
+    if settings.FRAME_STORE == "pack":
+        return FramePackWriter(video_id, frames_dir)
+    return LooseFrameWriter(video_id, frames_dir)
+
+
+def read_frame(frame_ref: str) -> Optional[bytes]:
+    """JPEG bytes of a stored frame (loose file or packed), or None if missing"""
+    path, timestamp_ms = parse_frame_ref(frame_ref)
+
+    if timestamp_ms is None:
+        if not path.exists():
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    try:
+        reader = _pack_reader(path)
+        return reader.read(timestamp_ms) if reader is not None else None
+    except FileNotFoundError:
+        _drop_pack_reader(path)
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read frame {frame_ref}: {e}")
+        return None
+
+
+def frame_exists(frame_ref: str) -> bool:
+    """Check whether a stored frame can be read"""
+    path, timestamp_ms = parse_frame_ref(frame_ref)
+    if timestamp_ms is None:
+        return path.exists()
+    return read_frame(frame_ref) is not None
+
+
+def find_frame(
+    video_id: str, timestamp_ms: int, frames_dir: Optional[Path] = None
+) -> Optional[bytes]:
+    """
+    JPEG bytes of the frame shown at timestamp_ms
+
+    Returns the last stored frame at or before the timestamp, which is also
+    the kept frame for timestamps dropped as near-duplicates.
+    """
+    pack_path = pack_path_for(video_id, frames_dir)
+    reader = _pack_reader(pack_path)
+    if reader is not None:
+        try:
+            stored_ms = reader.nearest(timestamp_ms)
+            return reader.read(stored_ms) if stored_ms is not None else None
+        except FileNotFoundError:
+            # Pack deleted since the reader was opened
+            _drop_pack_reader(pack_path)
+            return None
+
+    loose_dir = pack_path.parent / "frames"
+    try:
+        # Exact timestamps (thumbnails, frame refs) need no listing
+        return (loose_dir / f"frame_{timestamp_ms:08d}.jpg").read_bytes()
+    except FileNotFoundError:
+        pass
+
+    try:
+        timestamps = _loose_timestamps(loose_dir)
+        i = bisect.bisect_right(timestamps, timestamp_ms)
+        if not i:
+            return None
+        return (loose_dir / f"frame_{timestamps[i - 1]:08d}.jpg").read_bytes()
+    except FileNotFoundError:
+        return None
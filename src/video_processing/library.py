@@ -0,0 +1,77 @@
+"""
+Video Library
+Registering stored video files as library entries
+"""
+import json
+import uuid
+from pathlib import Path
+from datetime import datetime
+
+from src.core.config import settings
+from src.core.constants import SUPPORTED_VIDEO_FORMATS
+from src.core.exceptions import UnsupportedVideoFormatError
+from src.jobs.store import JobStore, JOB_QUEUED
+from src.video_processing.content_index import ContentIndex
+
+
+def new_video_id() -> str:
+    """
+    Generate video ID from timestamp plus a random suffix
+    Videos registered within the same second (uploads, ingest, resumable
+    uploads) must not share an ID
+    """
+    return f"vid_{int(datetime.utcnow().timestamp())}_{uuid.uuid4().hex[:8]}"
+
+
+def check_video_format(file_extension: str):
+    """Raise UnsupportedVideoFormatError for extensions outside SUPPORTED_VIDEO_FORMATS"""
+    if file_extension not in SUPPORTED_VIDEO_FORMATS:
+        raise UnsupportedVideoFormatError(
+            f"Unsupported video format '{file_extension}' "
+            f"(supported: {', '.join(SUPPORTED_VIDEO_FORMATS)})"
+        )
+
+
+def register_video(
+    video_id: str,
+    title: str,
+    video_path: Path,
+    original_filename: str,
+    content_sha256: str,
+    storage: str = "upload",
+) -> tuple[Path, dict]:
+    """
+    Write the initial metadata for a stored video, index its content hash and
+    queue its processing job
+    Returns (metadata path, job)
+    """
+    file_size_mb = video_path.stat().st_size / (1024 * 1024)
+
+    # Create basic metadata
+    metadata = {
+        "video_id": video_id,
+        "title": title,
+        "file_path": str(video_path),
+        "duration_seconds": 0.0,  # Will be populated by processor
+        "fps": 0.0,  # Will be populated by processor
+        "resolution": [0, 0],  # Will be populated by processor
+        "file_size_mb": file_size_mb,
+        "uploaded_at": datetime.utcnow().isoformat(),
+        "indexed_at": None,  # Will be set when full processing completes
+        "original_filename": original_filename,
+        "content_sha256": content_sha256,
+        "processing_status": JOB_QUEUED,
+        "storage": storage,
+        # Referenced files belong to the user and are never deleted
+        "managed_file": storage != "reference",
+    }
+
+    # Save initial metadata
+    metadata_path = settings.METADATA_DIR / f"{video_id}.json"
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f, indent=2)
+    ContentIndex().add(content_sha256, video_id)
+
+    # Queue processing (chunk + extract frames + AI analysis + indexing)
+    job = JobStore().create(video_id, kind="process")
+    return metadata_path, job
@@ -0,0 +1,123 @@
+"""
+Ingest Pipeline
+Runs per-chunk work as a graph of stages connected by bounded queues
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input; passed from worker to worker
+_DONE = object()
+
+StageHandler = Callable[[list[dict]], Awaitable[None]]
+Source = Callable[[Callable[[dict], Awaitable[None]]], Awaitable[None]]
+
+
+class Stage:
+    """
+    A pipeline stage: a handler applied to every item by a pool of workers
+
+    Handlers receive a batch of work items (dicts) and update them in place.
+    Blocking work (ffmpeg, Whisper, embedding SDK calls) should be offloaded
+    with asyncio.to_thread inside the handler; the number of workers bounds how
+    much of it runs at once. API-bound stages can await async clients directly.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: StageHandler,
+        workers: int = 1,
+        batch_size: int = 1,
+    ):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+
+
+class IngestPipeline:
+    """
+    Streams work items through a sequence of stages
+
+    Every stage has its own worker pool and reads from a bounded queue fed by
+    the previous stage, so a slow stage applies backpressure upstream instead
+    of letting finished-but-unconsumed items pile up in memory. All stages run
+    at the same time on different items.
+    """
+
+    def __init__(self, stages: list[Stage], queue_size: int = 8):
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+
+    async def run(self, source: Source) -> list[dict]:
+        """
+        Run the pipeline to completion
+
+        Args:
+            source: Async function that receives an emit(item) coroutine and
+                    emits every work item; it returns when input is exhausted
+
+        Returns:
+            All items that passed the last stage, in completion order
+        """
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        completed = []
+
+        async def feed():
+            await source(queues[0].put)
+            await queues[0].put(_DONE)
+
+        async def worker(stage: Stage, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue]):
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    # Leave the marker for sibling workers
+                    await inbox.put(_DONE)
+                    return
+
+                batch = [item]
+                while len(batch) < stage.batch_size:
+                    item = await inbox.get()
+                    if item is _DONE:
+                        await inbox.put(_DONE)
+                        break
+                    batch.append(item)
+
+                await stage.handler(batch)
+
+                for item in batch:
+                    if outbox is not None:
+                        await outbox.put(item)
+                    else:
+                        completed.append(item)
+
+        async def run_stage(index: int, stage: Stage):
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+
+            await asyncio.gather(
+                *(worker(stage, inbox, outbox) for _ in range(stage.workers))
+            )
+            logger.debug(f"Pipeline stage '{stage.name}' finished")
+
+            if outbox is not None:
+                await outbox.put(_DONE)
+
+        tasks = [asyncio.create_task(feed())] + [
+            asyncio.create_task(run_stage(i, stage))
+            for i, stage in enumerate(self.stages)
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # One failing stage would otherwise leave the others blocked on queues
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return completed
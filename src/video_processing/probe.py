@@ -0,0 +1,228 @@
+"""
+Video Probe
+Container/stream metadata and keyframe index from ffprobe
+"""
+import bisect
+import json
+import os
+import subprocess
+import logging
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.core.config import settings
+from src.core.exceptions import VideoProcessingError
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached probe layout changes
+PROBE_CACHE_VERSION = 1
+
+
+def _parse_rate(rate: Optional[str]) -> float:
+    """Parse an ffprobe frame rate ("30000/1001") to fps"""
+    if not rate:
+        return 0.0
+    num, _, den = rate.partition("/")
+    try:
+        return float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _rotation(stream: dict) -> int:
+    """Display rotation of a video stream in degrees (0, 90, 180 or 270)"""
+    rotation = stream.get("tags", {}).get("rotate")
+    for side_data in stream.get("side_data_list", []):
+        if "rotation" in side_data:
+            rotation = side_data["rotation"]
+    try:
+        return int(float(rotation or 0)) % 360
+    except ValueError:
+        return 0
+
+
+def parse_probe_output(
+    probe: dict, file_size_bytes: int, keyframes: Optional[list[float]] = None
+) -> dict:
+    """
+    Build video metadata from ffprobe JSON output and the keyframe index
+    Returns dict with duration, fps, resolution, codecs, rotation and keyframes
+    """
+    streams = probe.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if video is None:
+        raise VideoProcessingError("No video stream found")
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+
+    fps = _parse_rate(video.get("avg_frame_rate")) or _parse_rate(video.get("r_frame_rate"))
+    duration_seconds = float(
+        probe.get("format", {}).get("duration") or video.get("duration") or 0
+    )
+
+    # nb_frames is missing for many containers (mkv, webm)
+    frame_count = int(video.get("nb_frames") or round(duration_seconds * fps))
+
+    # Report the displayed resolution; decoded frames are auto-rotated
+    rotation = _rotation(video)
+    width, height = int(video.get("width", 0)), int(video.get("height", 0))
+    if rotation in (90, 270):
+        width, height = height, width
+
+    return {
+        "duration_seconds": round(duration_seconds, 2),
+        "fps": round(fps, 2),
+        "resolution": [width, height],
+        "frame_count": frame_count,
+        "file_size_mb": round(file_size_bytes / (1024 * 1024), 2),
+        "codec": (video.get("codec_name") or "").lower(),
+        "audio_codec": (audio.get("codec_name") or "").lower() if audio else None,
+        "rotation": rotation,
+        "keyframes": keyframes or [],
+    }
+
+
+def parse_keyframe_lines(lines: Iterable[str]) -> list[float]:
+    """
+    Keyframe timestamps from ffprobe packet lines ("pts_time,flags" CSV)
+    Lines are consumed one at a time, so only keyframes are kept in memory
+    """
+    keyframes = []
+    for line in lines:
+        pts_time, _, flags = line.strip().partition(",")
+        if "K" not in flags or pts_time in ("", "N/A"):
+            continue
+        keyframes.append(round(float(pts_time), 3))
+    return sorted(keyframes)
+
+
+def nearest_keyframe(
+    keyframes: list[float], t: float, tolerance: float
+) -> Optional[float]:
+    """Keyframe closest to t within tolerance seconds, or None"""
+    i = bisect.bisect_left(keyframes, t)
+    candidates = keyframes[max(0, i - 1) : i + 1]
+    if not candidates:
+        return None
+
+    closest = min(candidates, key=lambda k: abs(k - t))
+    return closest if abs(closest - t) <= tolerance else None
+
+
+def run_ffprobe(video_path: str) -> dict:
+    """Run ffprobe for format and stream metadata"""
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration:"
+        "stream=index,codec_type,codec_name,width,height,avg_frame_rate,"
+        "r_frame_rate,nb_frames,duration:stream_tags=rotate:stream_side_data=rotation",
+        "-of",
+        "json",
+        video_path,
+    ]
+
+    try:
+        result = subprocess.run(cmd, check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        raise VideoProcessingError(f"ffprobe failed: {e.stderr.decode()}")
+
+    return json.loads(result.stdout)
+
+
+def probe_keyframes(video_path: str) -> list[float]:
+    """
+    Keyframe timestamps of the first video stream
+
+    Packets are read from the container without decoding, and their CSV
+    lines are streamed and filtered as ffprobe writes them, so memory only
+    grows with the number of keyframes even for long videos.
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "packet=pts_time,flags",
+        "-of",
+        "csv=p=0",
+        video_path,
+    ]
+
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    ) as process:
+        keyframes = parse_keyframe_lines(process.stdout)
+        stderr = process.stderr.read()
+
+    if process.returncode != 0:
+        raise VideoProcessingError(f"ffprobe keyframe scan failed: {stderr}")
+    return keyframes
+
+
+class VideoProbe:
+    """
+    ffprobe metadata cached by content hash under DATA_DIR/probe_cache
+
+    The probe for a given file content never changes, so re-processing or
+    resuming a video reads the cached result instead of probing again.
+    Files without a known content hash (e.g. proxies) are probed uncached.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir or settings.PROBE_CACHE_DIR
+
+    def _cache_path(self, content_sha256: str) -> Path:
+        return self.cache_dir / f"{content_sha256}.json"
+
+    def probe(self, video_path: str, content_sha256: Optional[str] = None) -> dict:
+        """
+        Probe a video, using the cache when content_sha256 is given
+        Raises VideoProcessingError if ffprobe is unavailable or fails
+        """
+        if content_sha256:
+            cached = self._load(content_sha256)
+            if cached is not None:
+                logger.debug(f"Probe cache hit for {content_sha256[:12]}")
+                return cached
+
+        try:
+            probe = run_ffprobe(video_path)
+            keyframes = probe_keyframes(video_path)
+        except FileNotFoundError:
+            raise VideoProcessingError("ffprobe is not installed")
+
+        metadata = parse_probe_output(probe, Path(video_path).stat().st_size, keyframes)
+        logger.debug(
+            f"Probed {video_path}: {metadata['duration_seconds']}s, "
+            f"{len(metadata['keyframes'])} keyframes"
+        )
+
+        if content_sha256:
+            self._save(content_sha256, metadata)
+        return metadata
+
+    def _load(self, content_sha256: str) -> Optional[dict]:
+        path = self._cache_path(content_sha256)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r") as f:
+                cached = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if cached.get("version") != PROBE_CACHE_VERSION:
+            return None
+        return cached["metadata"]
+
+    def _save(self, content_sha256: str, metadata: dict):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._cache_path(content_sha256)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": PROBE_CACHE_VERSION, "metadata": metadata}, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,78 @@
+"""
+Proxy Transcode
+Creates a low-resolution working copy of an upload that every ingest stage reads
+"""
+import subprocess
+import logging
+from pathlib import Path
+
+from src.core.config import settings
+from src.core.constants import MAX_CHUNK_WIDTH, MAX_CHUNK_HEIGHT
+from src.core.exceptions import VideoProcessingError
+
+logger = logging.getLogger(__name__)
+
+
+def needs_proxy(video_metadata: dict) -> bool:
+    """
+    Check whether a source is worth proxying
+
+    Sources already within the chunk resolution are read directly.
+    """
+    if not settings.PROXY_ENABLED:
+        return False
+
+    width, height = video_metadata.get("resolution", [0, 0])
+    return width > MAX_CHUNK_WIDTH or height > MAX_CHUNK_HEIGHT
+
+
+def create_proxy(video_path: str, output_path: Path) -> str:
+    """
+    Transcode the source once to a 720p H.264 video with 16kHz mono audio
+
+    Downstream stages (frame sampling, chunk encoding, audio extraction) decode
+    this proxy instead of the full-resolution source. Keyframes are forced at a
+    fixed interval so chunks can be cut from the proxy cheaply.
+
+    Returns path to the proxy file
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    keyframe_interval = settings.PROXY_KEYFRAME_INTERVAL_SECONDS
+
+    cmd = [
+        "ffmpeg",
+        "-i",
+        video_path,
+        "-vf",
+        f"scale='min({MAX_CHUNK_WIDTH},iw)':'min({MAX_CHUNK_HEIGHT},ih)'"
+        ":force_original_aspect_ratio=decrease:force_divisible_by=2",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",  # Proxy is a working copy; speed matters more than size
+        "-crf",
+        "23",
+        "-force_key_frames",
+        f"expr:gte(t,n_forced*{keyframe_interval})",
+        "-c:a",
+        "aac",
+        "-ar",
+        "16000",  # 16kHz sample rate (Whisper requirement)
+        "-ac",
+        "1",  # Mono
+        "-b:a",
+        "64k",
+        "-movflags",
+        "+faststart",
+        "-y",  # Overwrite output file
+        str(output_path),
+    ]
+
+    try:
+        subprocess.run(cmd, check=True, capture_output=True)
+        logger.debug(f"Created proxy: {output_path}")
+        return str(output_path)
+    except subprocess.CalledProcessError as e:
+        logger.error(f"ffmpeg error creating proxy: {e.stderr.decode()}")
+        raise VideoProcessingError(f"Proxy transcode failed: {e}")
@@ -2,21 +2,39 @@
 Video Processing Service
 Handles video chunking, frame extraction, and metadata extraction
 """
+import asyncio
 import cv2
-import subprocess
 import json
+import math
 import shutil
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 from datetime import datetime
 
 from src.models.video import VideoMetadata, VideoChunk
 from src.core.config import settings
 from src.core.exceptions import VideoProcessingError
+from src.video_processing.chunk_encoder import ChunkEncoder
+from src.video_processing.proxy import needs_proxy, create_proxy
+from src.video_processing.probe import VideoProbe, nearest_keyframe
+from src.video_processing.frame_dedup import FrameDeduplicator
+from src.video_processing.frame_store import open_frame_writer, frame_exists
+from src.video_processing.pipeline import IngestPipeline, Stage
+from src.video_processing.checkpoints import ChunkCheckpointStore
+from src.utils.concurrency import run_sync
 
 logger = logging.getLogger(__name__)
 
+# Stages whose output is built from a stage's output; rerunning the stage
+# (resume after a failure) invalidates them
+DEPENDENT_STAGES = {
+    "encode": ("embed", "upsert"),
+    "transcribe": ("describe", "embed", "upsert"),
+    "describe": ("embed", "upsert"),
+    "embed": ("upsert",),
+}
+
 
 class VideoProcessor:
     """Handles video chunking and frame extraction"""
@@ -25,8 +43,12 @@ class VideoProcessor:
         self.chunk_duration = settings.CHUNK_DURATION_SECONDS
         self.chunk_overlap = settings.CHUNK_OVERLAP_SECONDS
         self.frame_fps = settings.FRAME_EXTRACTION_FPS
+        self.snap_to_keyframes = settings.CHUNK_SNAP_TO_KEYFRAMES
+        self.keyframe_tolerance = settings.CHUNK_KEYFRAME_TOLERANCE_SECONDS
         self.frames_dir = settings.FRAMES_DIR
         self.metadata_dir = settings.METADATA_DIR
+        self.chunk_encoder = ChunkEncoder(frames_dir=self.frames_dir)
+        self.probe = VideoProbe()
 
         # Initialize flags
         self.enable_ai_analysis = enable_ai_analysis
@@ -41,10 +63,25 @@ class VideoProcessor:
             self.ai_analyzer = AIAnalyzer()
             logger.info("AI analyzer ready!")
 
-    def extract_video_metadata(self, video_path: str) -> dict:
+    def extract_video_metadata(
+        self, video_path: str, content_sha256: Optional[str] = None
+    ) -> dict:
+        """
+        Extract metadata from video file using ffprobe
+        Returns dict with duration, fps, resolution, codecs, rotation and the
+        keyframe index; cached by content hash when one is given
+        """
+        try:
+            return self.probe.probe(video_path, content_sha256)
+        except VideoProcessingError as e:
+            logger.warning(f"ffprobe unavailable, falling back to OpenCV: {e}")
+            return self._extract_video_metadata_opencv(video_path)
+
+    def _extract_video_metadata_opencv(self, video_path: str) -> dict:
         """
         Extract metadata from video file using OpenCV
-        Returns dict with duration, fps, resolution, etc.
+        Frame counts are approximate for VFR sources and no keyframe index is
+        available
         """
         cap = cv2.VideoCapture(video_path)
 
@@ -58,6 +95,10 @@ class VideoProcessor:
             width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
             height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
+            # Decode FOURCC (e.g. "avc1") to decide whether chunks can be stream-copied
+            fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+            codec = "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4))
+
             # Calculate duration
             duration_seconds = frame_count / fps if fps > 0 else 0
 
@@ -71,6 +112,10 @@ class VideoProcessor:
                 "resolution": [width, height],
                 "frame_count": frame_count,
                 "file_size_mb": round(file_size_mb, 2),
+                "codec": codec.strip("\x00 ").lower(),
+                "audio_codec": None,
+                "rotation": 0,
+                "keyframes": [],
             }
 
             logger.debug(f"Extracted metadata: {metadata}")
@@ -79,17 +124,37 @@ class VideoProcessor:
         finally:
             cap.release()
 
-    def generate_chunks(self, video_id: str, duration_seconds: float) -> list[dict]:
+    def generate_chunks(
+        self,
+        video_id: str,
+        duration_seconds: float,
+        keyframes: Optional[list[float]] = None,
+    ) -> list[dict]:
         """
         Generate chunk definitions based on video duration
+        With a keyframe index (and CHUNK_SNAP_TO_KEYFRAMES), boundaries move
+        onto the nearest keyframe within CHUNK_KEYFRAME_TOLERANCE_SECONDS so
+        chunks can be stream-copied and seeked without decoding a partial GOP
         Returns list of chunk info dicts with start/end times
         """
         chunks = []
         current_start = 0.0
 
+        def snap(t: float, lower: float) -> float:
+            # Keep the boundary where it is when no keyframe is close enough
+            if not keyframes or not self.snap_to_keyframes:
+                return t
+            keyframe = nearest_keyframe(keyframes, t, self.keyframe_tolerance)
+            if keyframe is None or keyframe <= lower:
+                return t
+            # Round up so a seek to the rounded time still lands on this keyframe
+            return math.ceil(keyframe * 100) / 100
+
         while current_start < duration_seconds:
-            # Calculate end time for this chunk
+            # Calculate end time for this chunk (the video end is never snapped)
             end_time = min(current_start + self.chunk_duration, duration_seconds)
+            if end_time < duration_seconds:
+                end_time = min(snap(end_time, current_start + 1.0), duration_seconds)
 
             # Calculate chunk duration
             chunk_duration_actual = end_time - current_start
@@ -113,228 +178,663 @@ class VideoProcessor:
 
             chunks.append(chunk_info)
 
-            # Move to next chunk with overlap
-            current_start += self.chunk_duration - self.chunk_overlap
-
             # Prevent infinite loop if chunk_duration <= chunk_overlap
             if self.chunk_duration <= self.chunk_overlap:
                 break
 
+            # Move to next chunk with overlap; a snapped start never moves past
+            # this chunk's end, which would leave a stretch of video unindexed
+            current_start = min(
+                snap(
+                    current_start + self.chunk_duration - self.chunk_overlap,
+                    current_start,
+                ),
+                end_time,
+            )
+
         logger.info(f"Generated {len(chunks)} chunks for video {video_id}")
         return chunks
 
-    def extract_video_chunk(self, video_path: str, chunk_info: dict) -> str:
+    def iter_frames_for_chunks(
+        self, video_path: str, chunks: list[dict], video_fps: float
+    ) -> Iterator[tuple[dict, list[str], dict[str, str]]]:
         """
-        Extract video chunk as a separate video file
-        Returns path to the chunk video file
+        Decode the video once, yielding each chunk as soon as the decode passes its end
+        Each sampled frame is decoded and written once, then shared by every
+        chunk whose time range covers it (chunk overlaps reuse the same file)
+        With FRAME_DEDUP_ENABLED, frames within FRAME_DEDUP_MAX_DISTANCE of the
+        last kept frame are not written; their timestamps alias the kept frame
+        Yields (chunk_info, frame_paths, frame_aliases) in chunk order
         """
-        chunk_id = chunk_info["chunk_id"]
-        video_id = chunk_info["video_id"]
-        start_time = chunk_info["start_time"]
-        end_time = chunk_info["end_time"]
-
-        # Create directory for video chunks
-        chunks_dir = self.frames_dir / video_id / "chunks"
-        chunks_dir.mkdir(parents=True, exist_ok=True)
-
-        # Output path for chunk video
-        chunk_video_path = chunks_dir / f"{chunk_id}.mp4"
-
-        # Extract video chunk using ffmpeg with optimized compression
-        # Target: Keep chunks under 20MB for multimodal embedding API
-        cmd = [
-            "ffmpeg",
-            "-i",
-            video_path,
-            "-ss",
-            str(start_time),
-            "-to",
-            str(end_time),
-            "-c:v",
-            "libx264",  # Re-encode video
-            "-preset",
-            "medium",  # Balanced encoding speed/quality
-            "-crf",
-            "28",  # Higher CRF = more compression (18-28 range, 28 is good)
-            "-vf",
-            "scale='min(1280,iw)':'min(720,ih)':force_original_aspect_ratio=decrease",  # Max 720p
-            "-c:a",
-            "aac",  # Re-encode audio
-            "-b:a",
-            "96k",  # Lower audio bitrate (96kbps is sufficient)
-            "-movflags",
-            "+faststart",  # Optimize for streaming
-            "-y",  # Overwrite output file
-            str(chunk_video_path),
-        ]
+        if not chunks:
+            return
 
-        try:
-            subprocess.run(cmd, check=True, capture_output=True)
-            logger.debug(f"Extracted chunk video: {chunk_video_path}")
-            return str(chunk_video_path)
-        except subprocess.CalledProcessError as e:
-            logger.error(f"ffmpeg error extracting chunk: {e.stderr.decode()}")
-            return ""
-
-    def extract_frames_from_chunk(
-        self, video_path: str, chunk_info: dict, video_fps: float
-    ) -> list[str]:
-        """
-        Extract frames from a specific chunk at specified FPS
-        Returns list of saved frame paths
-        """
         cap = cv2.VideoCapture(video_path)
 
         if not cap.isOpened():
             raise VideoProcessingError(f"Could not open video file: {video_path}")
 
-        try:
-            chunk_id = chunk_info["chunk_id"]
-            video_id = chunk_info["video_id"]
-            start_time = chunk_info["start_time"]
-            end_time = chunk_info["end_time"]
+        # Frames are shared between overlapping chunks, so store them per video
+        frame_writer = open_frame_writer(chunks[0]["video_id"], self.frames_dir)
 
-            # Create directory for this video's frames
-            video_frames_dir = self.frames_dir / video_id / chunk_id
-            video_frames_dir.mkdir(parents=True, exist_ok=True)
+        try:
 
             # Calculate frame interval based on desired FPS
             # If video is 30fps and we want 1fps, extract every 30th frame
-            frame_interval = int(video_fps / self.frame_fps) if self.frame_fps > 0 else 1
-
-            # Set video position to chunk start
-            start_frame = int(start_time * video_fps)
-            end_frame = int(end_time * video_fps)
-
-            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+            frame_interval = (
+                max(1, int(video_fps / self.frame_fps)) if self.frame_fps > 0 else 1
+            )
 
-            frame_paths = []
-            frame_number = start_frame
+            # Chunks are generated in start order, and their end times are monotonic too
+            ordered_chunks = sorted(chunks, key=lambda c: c["start_time"])
+            frame_paths_by_chunk = {chunk["chunk_id"]: [] for chunk in chunks}
+            frame_aliases_by_chunk = {chunk["chunk_id"]: {} for chunk in chunks}
+            end_frame = int(ordered_chunks[-1]["end_time"] * video_fps)
+
+            first_open = 0  # First chunk that can still cover upcoming frames
+            frame_number = 0
+            frames_written = 0
+            frames_dropped = 0
+
+            deduplicator = (
+                FrameDeduplicator(settings.FRAME_DEDUP_MAX_DISTANCE)
+                if settings.FRAME_DEDUP_ENABLED
+                else None
+            )
+            last_kept_path = None
+
+            def finish(chunk: dict):
+                chunk_id = chunk["chunk_id"]
+                return (
+                    chunk,
+                    frame_paths_by_chunk.pop(chunk_id),
+                    frame_aliases_by_chunk.pop(chunk_id),
+                )
 
             while frame_number < end_frame:
-                ret, frame = cap.read()
-
-                if not ret:
+                # grab() advances the decoder without the BGR conversion;
+                # only sampled frames are retrieved
+                if not cap.grab():
                     break
 
-                # Check if this frame should be extracted
-                relative_frame = frame_number - start_frame
-                if relative_frame % frame_interval == 0:
-                    # Calculate timestamp for this frame
+                if frame_number % frame_interval == 0:
                     timestamp = frame_number / video_fps
 
-                    # Save frame
-                    frame_filename = f"frame_{int(timestamp * 1000):08d}.jpg"
-                    frame_path = video_frames_dir / frame_filename
-
-                    cv2.imwrite(str(frame_path), frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
-                    frame_paths.append(str(frame_path))
+                    # Chunks that have already ended are complete
+                    while (
+                        first_open < len(ordered_chunks)
+                        and ordered_chunks[first_open]["end_time"] <= timestamp
+                    ):
+                        yield finish(ordered_chunks[first_open])
+                        first_open += 1
+
+                    covering_chunks = []
+                    for chunk in ordered_chunks[first_open:]:
+                        if chunk["start_time"] > timestamp:
+                            break
+                        if timestamp < chunk["end_time"]:
+                            covering_chunks.append(chunk)
+
+                    if covering_chunks:
+                        ret, frame = cap.retrieve()
+                        if not ret:
+                            break
+
+                        timestamp_ms = int(timestamp * 1000)
+
+                        if deduplicator is not None and deduplicator.is_duplicate(frame):
+                            # Point the timestamp at the kept frame; every chunk
+                            # still gets at least that one frame
+                            frames_dropped += 1
+                            for chunk in covering_chunks:
+                                chunk_frames = frame_paths_by_chunk[chunk["chunk_id"]]
+                                if last_kept_path not in chunk_frames:
+                                    chunk_frames.append(last_kept_path)
+                                frame_aliases_by_chunk[chunk["chunk_id"]][
+                                    str(timestamp_ms)
+                                ] = last_kept_path
+                        else:
+                            # Save frame once for all covering chunks
+                            frame_path = frame_writer.add(timestamp_ms, frame)
+                            frames_written += 1
+                            last_kept_path = frame_path
+
+                            for chunk in covering_chunks:
+                                frame_paths_by_chunk[chunk["chunk_id"]].append(frame_path)
 
                 frame_number += 1
 
-            logger.debug(f"Extracted {len(frame_paths)} frames for chunk {chunk_id}")
-            return frame_paths
+            # The decode ended inside (or at the end of) the remaining chunks
+            for chunk in ordered_chunks[first_open:]:
+                yield finish(chunk)
+
+            logger.debug(
+                f"Extracted {frames_written} frames in one pass for {len(chunks)} chunks "
+                f"({frames_dropped} near-duplicates dropped)"
+            )
 
         finally:
+            frame_writer.close()
             cap.release()
 
-    def process_video(self, video_id: str, video_path: str, title: str) -> dict:
+    def build_chunk_data(
+        self,
+        chunk_info: dict,
+        chunk_video_path: str,
+        frame_paths: list[str],
+        analysis: dict,
+        frame_aliases: Optional[dict[str, str]] = None,
+    ) -> dict:
+        """Create the chunk metadata record saved to {video_id}_chunks.json"""
+        return {
+            "chunk_id": chunk_info["chunk_id"],
+            "video_id": chunk_info["video_id"],
+            "start_time": chunk_info["start_time"],
+            "end_time": chunk_info["end_time"],
+            "duration": chunk_info["duration"],
+            "chunk_video_path": chunk_video_path,
+            "frame_paths": frame_paths,
+            "representative_frame": (
+                frame_paths[len(frame_paths) // 2] if frame_paths else ""
+            ),
+            "visual_description": analysis["visual_description"],
+            "audio_transcript": analysis["audio_transcript"],
+            "num_frames": len(frame_paths),
+            "frame_aliases": frame_aliases or {},
+        }
+
+    def prepare_working_copy(
+        self, video_path: str, video_metadata: dict, temp_dir: Path
+    ) -> tuple[str, dict]:
+        """
+        Create the proxy that downstream stages decode instead of the source
+        Returns (working_path, working_metadata); the source itself when no
+        proxy is needed or the transcode fails
+        """
+        if not needs_proxy(video_metadata):
+            return video_path, video_metadata
+
+        logger.info(
+            f"Creating proxy for {video_metadata['resolution'][0]}x"
+            f"{video_metadata['resolution'][1]} source..."
+        )
+        try:
+            proxy_path = create_proxy(video_path, temp_dir / "proxy.mp4")
+            return proxy_path, self.extract_video_metadata(proxy_path)
+        except VideoProcessingError as e:
+            logger.warning(f"Proxy unavailable, decoding source directly: {e}")
+            return video_path, video_metadata
+
+    async def _run_pipeline(
+        self,
+        working_path: str,
+        working_metadata: dict,
+        chunks: list[dict],
+        temp_dir: Path,
+        checkpoint_store: ChunkCheckpointStore,
+        checkpoints: dict[str, dict],
+        audio_track=None,
+        embedding_generator=None,
+        report: Optional[Callable[[dict], None]] = None,
+    ) -> tuple[list[dict], dict]:
+        """
+        Stream chunks through the ingest stages as the decode produces them
+
+        decode+frames -> encode -> transcribe -> describe -> embed -> upsert
+
+        Stages run concurrently on different chunks with bounded queues in
+        between (see IngestPipeline). ffmpeg, Whisper and the embedding SDK are
+        driven from worker threads (the heavy lifting happens in subprocesses or
+        native code that releases the GIL); Gemini calls use the async client.
+        Transcription/description are skipped without an AI analyzer, and
+        embed/upsert without an embedding generator.
+
+        Every chunk is checkpointed after each stage; work recorded in
+        checkpoints (from an earlier, interrupted run) is not repeated.
+        report, if given, receives an event each time a chunk finishes a stage.
+
+        Returns (chunk data records in chunk order, stats with the number of
+        chunks indexed and of chunks with a stage left to retry)
+        """
+        analyze = self.enable_ai_analysis and self.ai_analyzer is not None
+        indexing = {"num_chunks_indexed": 0, "errors": []}
+
+        # Whole-video transcription overlaps with decoding and encoding;
+        # the transcribe stage waits for it
+        segments_task = None
+        if audio_track is not None and settings.TRANSCRIPTION_MODE == "video":
+            logger.info("Transcribing full audio track...")
+            segments_task = asyncio.create_task(
+                asyncio.to_thread(self.ai_analyzer.transcribe_video, audio_track)
+            )
+
+        stage_counts = {}
+
+        def report_chunk(stage: str, item: dict):
+            if report is None:
+                return
+            stage_counts[stage] = stage_counts.get(stage, 0) + 1
+            report(
+                {
+                    "stage": stage,
+                    "chunk_id": item["chunk_info"]["chunk_id"],
+                    "completed": stage_counts[stage],
+                    "total": len(chunks),
+                }
+            )
+
+        def checkpointed_frames(
+            chunk_info: dict,
+        ) -> Optional[tuple[list[str], dict[str, str]]]:
+            checkpoint = checkpoints.get(chunk_info["chunk_id"], {})
+            frame_paths = checkpoint.get("frame_paths", [])
+            if "frames" in checkpoint.get("stages", []) and all(
+                frame_exists(frame_path) for frame_path in frame_paths
+            ):
+                return frame_paths, checkpoint.get("frame_aliases", {})
+            return None
+
+        def new_item(
+            index: int,
+            chunk_info: dict,
+            frame_paths: list[str],
+            frame_aliases: dict[str, str],
+        ) -> dict:
+            checkpoint = checkpoints.get(chunk_info["chunk_id"], {})
+            item = {
+                "index": index,
+                "chunk_info": chunk_info,
+                "frame_paths": frame_paths,
+                "frame_aliases": frame_aliases,
+                "chunk_video_path": checkpoint.get("chunk_video_path", ""),
+                "raw_transcript": checkpoint.get("raw_transcript", ""),
+                "analysis": checkpoint.get(
+                    "analysis", {"visual_description": "", "audio_transcript": ""}
+                ),
+                "embeddings": checkpoint.get("embeddings"),
+                "stages": ["frames"]
+                + [stage for stage in checkpoint.get("stages", []) if stage != "frames"],
+            }
+
+            # Chunk videos live outside the checkpoint; re-encode if one went missing
+            if "encode" in item["stages"] and not (
+                item["chunk_video_path"] and Path(item["chunk_video_path"]).exists()
+            ):
+                item["stages"].remove("encode")
+
+            return item
+
+        def save_checkpoint(item: dict):
+            checkpoint_store.save(
+                item["chunk_info"],
+                {
+                    "stages": item["stages"],
+                    "frame_paths": item["frame_paths"],
+                    "frame_aliases": item["frame_aliases"],
+                    "chunk_video_path": item["chunk_video_path"],
+                    "raw_transcript": item["raw_transcript"],
+                    "analysis": item["analysis"],
+                    "embeddings": item["embeddings"],
+                },
+            )
+
+        async def decode(emit):
+            loop = asyncio.get_running_loop()
+
+            def produce():
+                cached_frames = [checkpointed_frames(chunk_info) for chunk_info in chunks]
+                if all(frame_paths is not None for frame_paths in cached_frames):
+                    logger.info("Reusing checkpointed frames, skipping decode")
+                    frames = (
+                        (chunk_info, *cached)
+                        for chunk_info, cached in zip(chunks, cached_frames)
+                    )
+                else:
+                    frames = self.iter_frames_for_chunks(
+                        working_path, chunks, working_metadata["fps"]
+                    )
+
+                for index, (chunk_info, frame_paths, frame_aliases) in enumerate(frames):
+                    item = new_item(index, chunk_info, frame_paths, frame_aliases)
+                    save_checkpoint(item)
+                    report_chunk("frames", item)
+                    # Blocks the decoder while the first queue is full
+                    asyncio.run_coroutine_threadsafe(emit(item), loop).result()
+
+            await asyncio.to_thread(produce)
+
+        def checkpointed(name: str, handler):
+            """Run handler on the items that have not finished stage `name` yet"""
+
+            async def run(items: list[dict]):
+                pending = [item for item in items if name not in item["stages"]]
+                for item in pending:
+                    # New output here means stale vectors downstream; redo them
+                    item["stages"] = [
+                        stage
+                        for stage in item["stages"]
+                        if stage not in DEPENDENT_STAGES.get(name, ())
+                    ]
+                if pending:
+                    await handler(pending)
+                    await asyncio.to_thread(
+                        lambda: [save_checkpoint(item) for item in pending]
+                    )
+
+                for item in items:
+                    report_chunk(name, item)
+
+            return run
+
+        async def encode(items: list[dict]):
+            chunk_video_paths = await asyncio.to_thread(
+                self.chunk_encoder.encode_chunks,
+                working_path,
+                [item["chunk_info"] for item in items],
+                working_metadata,
+            )
+            for item in items:
+                item["chunk_video_path"] = chunk_video_paths.get(
+                    item["chunk_info"]["chunk_id"], ""
+                )
+                if item["chunk_video_path"]:
+                    item["stages"].append("encode")
+
+        async def transcribe(items: list[dict]):
+            transcript_segments = await segments_task if segments_task else None
+            for item in items:
+                item["raw_transcript"] = await asyncio.to_thread(
+                    self.ai_analyzer.get_raw_transcript,
+                    working_path,
+                    item["chunk_info"],
+                    temp_dir,
+                    audio_track,
+                    transcript_segments,
+                )
+                item["stages"].append("transcribe")
+
+        async def describe(items: list[dict]):
+            logger.info(
+                f"Analyzing chunks {items[0]['index']+1}-{items[-1]['index']+1}"
+                f"/{len(chunks)}: {items[0]['chunk_info']['chunk_id']}"
+            )
+            if len(items) > 1:
+                analyses = await self.ai_analyzer.adescribe_chunks_batch(
+                    [(item["chunk_info"], item["frame_paths"]) for item in items],
+                    [item["raw_transcript"] for item in items],
+                )
+            else:
+                item = items[0]
+                analyses = [
+                    await self.ai_analyzer.adescribe_chunk(
+                        item["chunk_info"], item["frame_paths"], item["raw_transcript"]
+                    )
+                ]
+
+            for item, analysis in zip(items, analyses):
+                item["analysis"] = analysis
+                # An empty description for a chunk with frames means the Gemini
+                # call failed; leave the stage open so a resume retries it
+                if analysis["visual_description"] or not item["frame_paths"]:
+                    item["stages"].append("describe")
+
+        # Visual embeddings run one API call per chunk; bound them across batches
+        visual_slots = asyncio.Semaphore(max(1, settings.EMBEDDING_MAX_WORKERS))
+
+        async def embed(items: list[dict]):
+            chunks_data = [self._chunk_data_for(item) for item in items]
+
+            # One batched request covers the text embeddings of the whole batch
+            text_embeddings = await asyncio.to_thread(
+                embedding_generator.generate_text_embeddings, chunks_data
+            )
+
+            async def embed_chunk(
+                item: dict, chunk_data: dict, text_embedding: list[float]
+            ):
+                async with visual_slots:
+                    embedded_chunk = await asyncio.to_thread(
+                        embedding_generator.embed_chunk,
+                        chunk_data,
+                        item["index"],
+                        len(chunks),
+                        text_embedding,
+                    )
+                item["embeddings"] = {
+                    "text_embedding": embedded_chunk["text_embedding"],
+                    "visual_embedding": embedded_chunk["visual_embedding"],
+                }
+                item["stages"].append("embed")
+
+            await asyncio.gather(
+                *(
+                    embed_chunk(item, chunk_data, text_embedding)
+                    for item, chunk_data, text_embedding in zip(
+                        items, chunks_data, text_embeddings
+                    )
+                )
+            )
+
+        async def upsert(items: list[dict]):
+            batch = [{**self._chunk_data_for(item), **item["embeddings"]} for item in items]
+            try:
+                await asyncio.to_thread(
+                    embedding_generator.vector_db.upsert_chunks_dual, batch
+                )
+            except Exception as e:
+                logger.error(f"⚠️ Upsert failed for {len(batch)} chunks: {e}")
+                indexing["errors"].append(str(e))
+                return
+
+            indexing["num_chunks_indexed"] += len(batch)
+            for item in items:
+                # Vectors live in Qdrant now; drop them from memory and checkpoints
+                item["embeddings"] = None
+                item["stages"].append("upsert")
+
+        stages = [
+            Stage(
+                "encode",
+                checkpointed("encode", encode),
+                workers=settings.CHUNK_ENCODE_WORKERS,
+                batch_size=self.chunk_encoder.batch_size,
+            )
+        ]
+        if analyze:
+            stages += [
+                Stage(
+                    "transcribe",
+                    checkpointed("transcribe", transcribe),
+                    workers=settings.WHISPER_NUM_WORKERS,
+                ),
+                Stage(
+                    "describe",
+                    checkpointed("describe", describe),
+                    workers=settings.ANALYSIS_MAX_CONCURRENCY,
+                    batch_size=settings.ANALYSIS_BATCH_SIZE,
+                ),
+            ]
+        if embedding_generator is not None:
+            stages += [
+                Stage(
+                    "embed",
+                    checkpointed("embed", embed),
+                    # One batch fills while the other is embedded; visual calls
+                    # inside a batch are bounded by EMBEDDING_MAX_WORKERS
+                    workers=2,
+                    batch_size=min(
+                        settings.TEXT_EMBEDDING_BATCH_SIZE, settings.UPSERT_BATCH_SIZE
+                    ),
+                ),
+                Stage(
+                    "upsert",
+                    checkpointed("upsert", upsert),
+                    batch_size=settings.UPSERT_BATCH_SIZE,
+                ),
+            ]
+
+        pipeline = IngestPipeline(stages, queue_size=settings.PIPELINE_QUEUE_SIZE)
+        items = await pipeline.run(decode)
+        items.sort(key=lambda item: item["index"])
+
+        # Chunks upserted by an earlier run count towards this one
+        indexing["num_chunks_indexed"] = sum(
+            "upsert" in item["stages"] for item in items
+        )
+        indexing["incomplete_chunks"] = sum(
+            any(stage.name not in item["stages"] for stage in stages) for item in items
+        )
+
+        return [self._chunk_data_for(item) for item in items], indexing
+
+    def _chunk_data_for(self, item: dict) -> dict:
+        """Chunk data record for a pipeline work item"""
+        return self.build_chunk_data(
+            item["chunk_info"],
+            item["chunk_video_path"],
+            item["frame_paths"],
+            item["analysis"],
+            item["frame_aliases"],
+        )
+
+    def process_video(
+        self,
+        video_id: str,
+        video_path: str,
+        title: str,
+        progress_callback: Optional[Callable[[dict], None]] = None,
+    ) -> dict:
         """
         Main processing pipeline for a video
         1. Extract metadata
-        2. Generate chunks
-        3. Extract frames for each chunk
-        4. AI Analysis (optional)
-        5. Index in Qdrant (optional)
+        2. Create low-resolution proxy (large sources only)
+        3. Generate chunks
+        4. Stream chunks through the ingest stages: frames, chunk video, AI
+           analysis (optional), embeddings + Qdrant upsert (optional)
+        5. Save chunk metadata
+
+        Chunks are checkpointed as they pass each stage. Calling this again for
+        a video whose processing was interrupted resumes from the checkpoints.
+
+        progress_callback receives {"stage": ...} at each step and
+        {"stage", "chunk_id", "completed", "total"} whenever a chunk finishes a
+        pipeline stage.
 
         Returns processing summary
         """
         logger.info(f"Processing video: {video_id}")
 
-        # Step 1: Extract video metadata
-        logger.info("Extracting video metadata...")
-        video_metadata = self.extract_video_metadata(video_path)
+        def report(event: dict):
+            if progress_callback is None:
+                return
+            try:
+                progress_callback(event)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
 
-        # Update the main video metadata file
+        # Step 1: Extract video metadata (probe is cached by content hash)
+        report({"stage": "metadata"})
         metadata_path = self.metadata_dir / f"{video_id}.json"
 
         with open(metadata_path, "r") as f:
             existing_metadata = json.load(f)
 
+        logger.info("Extracting video metadata...")
+        video_metadata = self.extract_video_metadata(
+            video_path, existing_metadata.get("content_sha256")
+        )
+
+        # Update the main video metadata file
         existing_metadata.update(
             {
                 "duration_seconds": video_metadata["duration_seconds"],
                 "fps": video_metadata["fps"],
                 "resolution": video_metadata["resolution"],
+                "processing_status": "processing",
             }
         )
 
         with open(metadata_path, "w") as f:
             json.dump(existing_metadata, f, indent=2)
 
-        # Step 2: Generate chunk definitions
-        logger.info("Generating chunks...")
-        chunks = self.generate_chunks(video_id, video_metadata["duration_seconds"])
-
-        # Step 3: Extract frames and analyze each chunk
-        logger.info(f"Extracting frames and analyzing content for {len(chunks)} chunks...")
-        processed_chunks = []
-
-        # Create temp directory for audio extraction
+        # Create temp directory for the proxy and audio extraction
         temp_dir = self.frames_dir / video_id / "_temp"
         temp_dir.mkdir(parents=True, exist_ok=True)
 
-        for i, chunk_info in enumerate(chunks):
-            logger.info(
-                f"Processing chunk {i+1}/{len(chunks)}: {chunk_info['chunk_id']}"
-            )
+        # Step 2: Transcode a low-resolution proxy that every later stage decodes
+        report({"stage": "proxy"})
+        working_path, working_metadata = self.prepare_working_copy(
+            video_path, video_metadata, temp_dir
+        )
+
+        # Step 3: Generate chunk definitions
+        report({"stage": "chunks"})
+        logger.info("Generating chunks...")
+        # Boundaries snap to the keyframes of the file chunks are cut from
+        chunks = self.generate_chunks(
+            video_id,
+            video_metadata["duration_seconds"],
+            working_metadata.get("keyframes"),
+        )
 
-            # Extract video chunk as separate file
-            logger.debug("Extracting video chunk...")
-            chunk_video_path = self.extract_video_chunk(video_path, chunk_info)
+        # Step 4: Run the ingest pipeline, skipping work checkpointed by a previous run
+        checkpoint_store = ChunkCheckpointStore(video_id, frames_dir=self.frames_dir)
+        checkpoints = checkpoint_store.load_all(chunks)
 
-            # Extract frames
-            logger.debug("Extracting frames...")
-            frame_paths = self.extract_frames_from_chunk(
-                video_path, chunk_info, video_metadata["fps"]
+        # Extract the whole audio track once; chunks slice it in memory
+        audio_track = None
+        needs_transcription = any(
+            "transcribe" not in checkpoints.get(chunk["chunk_id"], {}).get("stages", [])
+            for chunk in chunks
+        )
+        if self.enable_ai_analysis and self.ai_analyzer and needs_transcription:
+            logger.info("Extracting audio track...")
+            audio_track = self.ai_analyzer.extract_audio_track(
+                working_path, temp_dir / "audio.f32"
             )
 
-            # AI Analysis (transcription + visual description)
-            if self.enable_ai_analysis and self.ai_analyzer:
-                logger.debug("Analyzing content (AI)...")
-                analysis = self.ai_analyzer.analyze_chunk(
-                    video_path, chunk_info, frame_paths, temp_dir
-                )
-                visual_description = analysis["visual_description"]
-                audio_transcript = analysis["audio_transcript"]
-            else:
-                visual_description = ""
-                audio_transcript = ""
-
-            # Create chunk metadata
-            chunk_data = {
-                "chunk_id": chunk_info["chunk_id"],
-                "video_id": video_id,
-                "start_time": chunk_info["start_time"],
-                "end_time": chunk_info["end_time"],
-                "duration": chunk_info["duration"],
-                "chunk_video_path": chunk_video_path,
-                "frame_paths": frame_paths,
-                "representative_frame": (
-                    frame_paths[len(frame_paths) // 2] if frame_paths else ""
-                ),
-                "visual_description": visual_description,
-                "audio_transcript": audio_transcript,
-                "num_frames": len(frame_paths),
-            }
+        indexing_result = None
+        embedding_generator = None
+        if self.enable_indexing:
+            try:
+                # Lazy import to avoid circular dependencies
+                from src.embeddings.service import EmbeddingGenerator
 
-            processed_chunks.append(chunk_data)
+                embedding_generator = EmbeddingGenerator()
+            except Exception as e:
+                logger.error(f"⚠️ Indexing failed: {e}")
+                indexing_result = {"status": "indexing_failed", "error": str(e)}
 
-        # Clean up temp directory
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+        async def run_pipeline():
+            try:
+                return await self._run_pipeline(
+                    working_path,
+                    working_metadata,
+                    chunks,
+                    temp_dir,
+                    checkpoint_store,
+                    checkpoints,
+                    audio_track,
+                    embedding_generator,
+                    report,
+                )
+            finally:
+                # The Gemini client used by the stages is bound to this loop
+                if self.ai_analyzer is not None:
+                    await self.ai_analyzer.aclose()
 
-        # Step 4: Save chunk metadata
+        logger.info(f"Running ingest pipeline for {len(chunks)} chunks...")
+        try:
+            processed_chunks, indexing = run_sync(run_pipeline())
+        finally:
+            # Clean up temp directory
+            if audio_track is not None:
+                audio_track.close()
+            if temp_dir.exists():
+                shutil.rmtree(temp_dir)
+
+        # Step 5: Save chunk metadata
+        report({"stage": "saving"})
         logger.info("Saving chunk metadata...")
         chunks_metadata_path = self.metadata_dir / f"{video_id}_chunks.json"
 
@@ -348,30 +848,52 @@ class VideoProcessor:
             f"Processing complete: {len(chunks)} chunks, {total_frames} frames extracted"
         )
 
-        # Step 5: Generate embeddings and index in Qdrant
-        indexing_result = None
-        if self.enable_indexing:
-            logger.info("Generating embeddings and indexing in Qdrant...")
-            try:
-                # Lazy import to avoid circular dependencies
-                from src.embeddings.service import index_video_in_qdrant
-
-                indexing_result = index_video_in_qdrant(video_id, str(chunks_metadata_path))
-                logger.info(f"✅ Indexed {indexing_result['num_chunks_indexed']} chunks in Qdrant")
+        if embedding_generator is not None:
+            if indexing["errors"]:
+                logger.error(
+                    f"⚠️ Indexing failed: {len(indexing['errors'])} upsert batches failed"
+                )
+                indexing_result = {
+                    "status": "indexing_failed",
+                    "error": "; ".join(indexing["errors"]),
+                    "num_chunks_indexed": indexing["num_chunks_indexed"],
+                }
+            else:
+                logger.info(
+                    f"✅ Indexed {indexing['num_chunks_indexed']} chunks in Qdrant"
+                )
+                indexing_result = {
+                    "video_id": video_id,
+                    "num_chunks_indexed": indexing["num_chunks_indexed"],
+                    "status": "indexed",
+                }
+
+        # Keep checkpoints while any chunk has a stage left so a resume only retries that
+        processing_complete = indexing["incomplete_chunks"] == 0 and (
+            not self.enable_indexing
+            or (indexing_result is not None and indexing_result["status"] == "indexed")
+        )
+        if processing_complete:
+            checkpoint_store.clear()
+        else:
+            logger.warning(
+                f"⚠️ {video_id} is incomplete ({indexing['incomplete_chunks']} chunks "
+                f"pending); resume to retry"
+            )
 
-                # Update video metadata with indexed_at timestamp
-                if metadata_path.exists():
-                    with open(metadata_path, "r") as f:
-                        metadata = json.load(f)
+        # Update video metadata with processing status and indexed_at timestamp
+        if metadata_path.exists():
+            with open(metadata_path, "r") as f:
+                metadata = json.load(f)
 
-                    metadata["indexed_at"] = datetime.utcnow().isoformat()
+            metadata["processing_status"] = (
+                "processed" if processing_complete else "incomplete"
+            )
+            if indexing_result is not None and indexing_result["status"] == "indexed":
+                metadata["indexed_at"] = datetime.utcnow().isoformat()
 
-                    with open(metadata_path, "w") as f:
-                        json.dump(metadata, f, indent=2)
-
-            except Exception as e:
-                logger.error(f"⚠️ Indexing failed: {e}")
-                indexing_result = {"status": "indexing_failed", "error": str(e)}
+            with open(metadata_path, "w") as f:
+                json.dump(metadata, f, indent=2)
 
         return {
             "video_id": video_id,
@@ -390,3 +912,45 @@ def process_video_file(video_id: str, video_path: str, title: str) -> dict:
     """
     processor = VideoProcessor()
     return processor.process_video(video_id, video_path, title)
+
+
+def resume_video(
+    video_id: str, progress_callback: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """
+    Resume processing of a video from its chunk checkpoints
+    """
+    metadata_path = settings.METADATA_DIR / f"{video_id}.json"
+
+    if not metadata_path.exists():
+        raise VideoProcessingError(f"Video {video_id} not found")
+
+    with open(metadata_path, "r") as f:
+        metadata = json.load(f)
+
+    processor = VideoProcessor()
+    return processor.process_video(
+        video_id,
+        metadata["file_path"],
+        metadata["title"],
+        progress_callback=progress_callback,
+    )
+
+
+def set_processing_status(video_id: str, status: str):
+    """
+    Record the processing status (queued, processing, processed, incomplete,
+    failed) in a video's metadata
+    """
+    metadata_path = settings.METADATA_DIR / f"{video_id}.json"
+
+    if not metadata_path.exists():
+        return
+
+    with open(metadata_path, "r") as f:
+        metadata = json.load(f)
+
+    metadata["processing_status"] = status
+
+    with open(metadata_path, "w") as f:
+        json.dump(metadata, f, indent=2)
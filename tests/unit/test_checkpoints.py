@@ -0,0 +1,44 @@
+"""
+Unit tests for per-chunk processing checkpoints
+"""
+from src.video_processing.checkpoints import ChunkCheckpointStore
+
+
+def _chunk(start, end):
+    return {
+        "chunk_id": f"vid_1_{start}_{end}",
+        "video_id": "vid_1",
+        "start_time": float(start),
+        "end_time": float(end),
+        "duration": float(end - start),
+    }
+
+
+def test_checkpoint_round_trip(tmp_path):
+    store = ChunkCheckpointStore("vid_1", frames_dir=tmp_path)
+    chunk = _chunk(0, 30)
+
+    store.save(chunk, {"stages": ["frames", "encode"], "raw_transcript": "hello"})
+
+    checkpoint = store.load(chunk)
+    assert checkpoint["stages"] == ["frames", "encode"]
+    assert checkpoint["raw_transcript"] == "hello"
+    assert store.load_all([chunk, _chunk(25, 55)]) == {chunk["chunk_id"]: checkpoint}
+
+
+def test_checkpoint_ignored_when_chunk_layout_changes(tmp_path):
+    store = ChunkCheckpointStore("vid_1", frames_dir=tmp_path)
+    store.save(_chunk(0, 30), {"stages": ["frames"]})
+
+    # Same chunk_id (int seconds) but different boundaries
+    moved = {**_chunk(0, 30), "end_time": 30.4}
+    assert store.load(moved) == {}
+
+
+def test_clear_removes_checkpoints(tmp_path):
+    store = ChunkCheckpointStore("vid_1", frames_dir=tmp_path)
+    store.save(_chunk(0, 30), {"stages": ["frames"]})
+    assert store.exists()
+
+    store.clear()
+    assert not store.exists()
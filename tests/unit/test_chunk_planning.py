@@ -0,0 +1,53 @@
+"""
+Unit tests for keyframe-aligned chunk planning
+"""
+from src.video_processing.service import VideoProcessor
+
+
+def _processor(snap=True, tolerance=2.0):
+    # generate_chunks is pure; skip loading the AI analyzer
+    processor = VideoProcessor.__new__(VideoProcessor)
+    processor.chunk_duration = 30.0
+    processor.chunk_overlap = 5.0
+    processor.snap_to_keyframes = snap
+    processor.keyframe_tolerance = tolerance
+    return processor
+
+
+def test_boundaries_snap_to_nearby_keyframes():
+    keyframes = [0.0, 4.171, 24.024, 29.196, 50.217, 54.388, 70.0]
+    chunks = _processor().generate_chunks("vid_1", 70.0, keyframes)
+
+    assert [(c["start_time"], c["end_time"]) for c in chunks] == [
+        (0.0, 29.2),
+        (24.03, 54.39),
+        (50.22, 70.0),
+    ]
+    # IDs and durations follow the snapped boundaries
+    assert chunks[1]["chunk_id"] == "vid_1_24_54"
+    assert chunks[1]["duration"] == 30.36
+
+
+def test_boundaries_unchanged_without_close_keyframe():
+    keyframes = [0.0, 10.0, 40.0, 60.0]
+    snapped = _processor().generate_chunks("vid_1", 60.0, keyframes)
+    fixed = _processor(snap=False).generate_chunks("vid_1", 60.0, keyframes)
+
+    assert snapped == fixed
+    assert [c["start_time"] for c in fixed] == [0.0, 25.0, 50.0]
+
+
+def test_snapped_start_never_passes_previous_end():
+    # Tolerance larger than the overlap lets a start move a long way
+    keyframes = [0.0, 22.0, 33.0, 47.5, 61.0]
+    chunks = _processor(tolerance=10.0).generate_chunks("vid_1", 80.0, keyframes)
+
+    assert [(c["start_time"], c["end_time"]) for c in chunks] == [
+        (0.0, 33.0),
+        (22.0, 47.5),
+        (47.5, 77.5),
+        (72.5, 80.0),
+    ]
+    # Consecutive chunks overlap or touch, so no stretch goes unindexed
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk["start_time"] <= previous["end_time"]
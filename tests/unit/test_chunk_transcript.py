@@ -0,0 +1,51 @@
+"""
+Unit tests for assembling chunk transcripts from video-level Whisper segments
+"""
+from src.ai_analysis.service import AIAnalyzer
+
+
+def _segment(start, end, words):
+    return {
+        "start": start,
+        "end": end,
+        "text": "".join(w for _, _, w in words),
+        "words": [{"start": s, "end": e, "word": w} for s, e, w in words],
+    }
+
+
+def _analyzer():
+    # build_chunk_transcript is pure; skip loading Whisper/Gemini clients
+    return AIAnalyzer.__new__(AIAnalyzer)
+
+
+def test_words_are_assigned_by_midpoint():
+    segments = [
+        _segment(0.0, 4.0, [(0.0, 1.0, " Hello"), (1.0, 2.0, " there"), (28.0, 31.0, " friend")]),
+    ]
+
+    transcript = _analyzer().build_chunk_transcript(segments, 0.0, 30.0)
+
+    # "friend" has midpoint 29.5 and belongs to the first chunk only
+    assert transcript == "Hello there friend"
+    assert _analyzer().build_chunk_transcript(segments, 30.0, 60.0) == ""
+
+
+def test_overlapping_chunks_share_words():
+    segments = [_segment(26.0, 29.0, [(26.0, 27.0, " Shared"), (27.0, 29.0, " words")])]
+
+    analyzer = _analyzer()
+
+    # Speech starts 26s into the first chunk but only 1s into the second
+    assert analyzer.build_chunk_transcript(segments, 0.0, 30.0) == "[pause] Shared words"
+    assert analyzer.build_chunk_transcript(segments, 25.0, 55.0) == "Shared words"
+
+
+def test_pause_marker_is_relative_to_chunk_start():
+    segments = [
+        _segment(30.5, 31.0, [(30.5, 31.0, " Quick")]),
+        _segment(40.0, 41.0, [(40.0, 41.0, " Later")]),
+    ]
+
+    transcript = _analyzer().build_chunk_transcript(segments, 30.0, 60.0)
+
+    assert transcript == "Quick [pause] Later"
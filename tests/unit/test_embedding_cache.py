@@ -0,0 +1,31 @@
+"""
+Unit tests for the on-disk embedding cache
+"""
+from src.embeddings.cache import EmbeddingCache
+
+
+def test_round_trip_keyed_by_model_and_dimension(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.db", max_bytes=1024)
+    cache.put("text-model", 2, "hello", [0.5, 1.5])
+
+    assert cache.get("text-model", 2, "hello") == [0.5, 1.5]
+    assert cache.get("text-model", 3, "hello") is None
+    assert cache.get("other-model", 2, "hello") is None
+
+
+def test_least_recently_used_vectors_are_evicted(tmp_path):
+    # Room for three 2-dim float32 vectors
+    cache = EmbeddingCache(tmp_path / "cache.db", max_bytes=24)
+    cache.put("m", 2, "a", [1.0, 1.0])
+    cache.put("m", 2, "b", [2.0, 2.0])
+    cache.put("m", 2, "c", [3.0, 3.0])
+    cache.get("m", 2, "a")
+
+    cache.put("m", 2, "d", [4.0, 4.0])
+
+    assert cache.get_many("m", 2, ["a", "b", "c", "d"]) == [
+        [1.0, 1.0],
+        None,
+        [3.0, 3.0],
+        [4.0, 4.0],
+    ]
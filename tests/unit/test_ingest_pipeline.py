@@ -0,0 +1,55 @@
+"""
+Unit tests for the stage-graph ingest pipeline
+"""
+import asyncio
+
+import pytest
+
+from src.video_processing.pipeline import IngestPipeline, Stage
+
+
+def _source(n):
+    async def source(emit):
+        for i in range(n):
+            await emit({"index": i, "seen": []})
+
+    return source
+
+
+def test_items_pass_every_stage_with_batching():
+    batch_sizes = []
+
+    async def first(items):
+        for item in items:
+            item["seen"].append("first")
+
+    async def second(items):
+        batch_sizes.append(len(items))
+        for item in items:
+            item["seen"].append("second")
+
+    pipeline = IngestPipeline(
+        [Stage("first", first, workers=3), Stage("second", second, batch_size=4)],
+        queue_size=2,
+    )
+    items = asyncio.run(pipeline.run(_source(10)))
+
+    assert sorted(item["index"] for item in items) == list(range(10))
+    assert all(item["seen"] == ["first", "second"] for item in items)
+    # Full batches until the input runs out
+    assert batch_sizes == [4, 4, 2]
+
+
+def test_stage_failure_cancels_pipeline():
+    async def broken(items):
+        raise RuntimeError("stage failed")
+
+    async def never_ends(items):
+        await asyncio.sleep(3600)
+
+    pipeline = IngestPipeline(
+        [Stage("broken", broken), Stage("slow", never_ends)], queue_size=1
+    )
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(pipeline.run(_source(5)))
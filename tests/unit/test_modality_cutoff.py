@@ -0,0 +1,14 @@
+"""
+Unit tests for skipping low-weight search modalities
+"""
+from src.search.service import apply_modality_cutoff
+
+
+def test_low_weight_modality_is_dropped():
+    assert apply_modality_cutoff(0.9, 0.1, min_weight=0.15) == (1.0, 0.0)
+    assert apply_modality_cutoff(0.1, 0.9, min_weight=0.15) == (0.0, 1.0)
+
+
+def test_weights_above_cutoff_are_kept():
+    assert apply_modality_cutoff(0.8, 0.2, min_weight=0.15) == (0.8, 0.2)
+    assert apply_modality_cutoff(0.9, 0.1, min_weight=0.0) == (0.9, 0.1)
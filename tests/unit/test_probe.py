@@ -0,0 +1,52 @@
+"""
+Unit tests for ffprobe output parsing
+"""
+from src.video_processing.probe import parse_keyframe_lines, parse_probe_output
+
+
+def _probe(**video_overrides):
+    video = {
+        "index": 0,
+        "codec_type": "video",
+        "codec_name": "h264",
+        "width": 1920,
+        "height": 1080,
+        "avg_frame_rate": "30000/1001",
+        "r_frame_rate": "30000/1001",
+        **video_overrides,
+    }
+    return {
+        "format": {"duration": "62.5"},
+        "streams": [video, {"index": 1, "codec_type": "audio", "codec_name": "aac"}],
+    }
+
+
+def test_parse_streams_and_keyframes():
+    metadata = parse_probe_output(
+        _probe(), file_size_bytes=10 * 1024 * 1024, keyframes=[0.0, 2.002]
+    )
+
+    assert metadata["duration_seconds"] == 62.5
+    assert metadata["fps"] == 29.97
+    assert metadata["resolution"] == [1920, 1080]
+    # nb_frames missing: derived from duration
+    assert metadata["frame_count"] == round(62.5 * 30000 / 1001)
+    assert metadata["codec"] == "h264"
+    assert metadata["audio_codec"] == "aac"
+    assert metadata["file_size_mb"] == 10.0
+    assert metadata["keyframes"] == [0.0, 2.002]
+
+
+def test_keyframe_lines_keep_only_keyframes():
+    lines = ["2.002000,K__\n", "0.000000,K__\n", "0.033367,___\n", "N/A,K__\n", "\n"]
+
+    assert parse_keyframe_lines(lines) == [0.0, 2.002]
+
+
+def test_rotation_swaps_displayed_resolution():
+    probe = _probe(side_data_list=[{"rotation": -90}], nb_frames="1873")
+    metadata = parse_probe_output(probe, file_size_bytes=0)
+
+    assert metadata["rotation"] == 270
+    assert metadata["resolution"] == [1080, 1920]
+    assert metadata["frame_count"] == 1873
@@ -0,0 +1,51 @@
+"""
+Unit tests for the in-process query embedding cache
+"""
+from src.embeddings.cache import EmbeddingCache
+from src.embeddings.query_cache import QueryEmbeddingCache
+
+
+def test_normalized_queries_share_an_entry():
+    cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=60)
+    cache.put("m", 2, "Red  Car", [1.0, 2.0])
+
+    assert cache.get("m", 2, " red car ") == [1.0, 2.0]
+    assert cache.get("other-model", 2, "red car") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=60)
+    cache.put("m", 1, "a", [1.0])
+    cache.put("m", 1, "b", [2.0])
+    cache.get("m", 1, "a")
+    cache.put("m", 1, "c", [3.0])
+
+    assert cache.get("m", 1, "b") is None
+    assert cache.get("m", 1, "a") == [1.0]
+    assert cache.get("m", 1, "c") == [3.0]
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("src.embeddings.query_cache.time.monotonic", lambda: now[0])
+    cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=10)
+    cache.put("m", 1, "a", [1.0])
+
+    now[0] += 9
+    assert cache.get("m", 1, "a") == [1.0]
+    now[0] += 2
+    assert cache.get("m", 1, "a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_misses_fall_through_to_persistent_store(tmp_path):
+    store = EmbeddingCache(tmp_path / "cache.db", max_bytes=1024)
+    QueryEmbeddingCache(max_entries=4, ttl_seconds=60, persistent_store=store).put(
+        "m", 2, "hello", [0.5, 1.5]
+    )
+
+    restarted = QueryEmbeddingCache(max_entries=4, ttl_seconds=60, persistent_store=store)
+    assert restarted.get("m", 2, "HELLO") == [0.5, 1.5]
+    assert restarted.stats()["entries"] == 1
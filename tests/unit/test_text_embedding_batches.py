@@ -0,0 +1,91 @@
+"""
+Unit tests for batched text embedding requests
+"""
+from types import SimpleNamespace
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+from google.genai import errors as genai_errors
+
+from src.embeddings.service import EmbeddingGenerator
+
+
+class FakeModels:
+    """
+    embed_content stand-in that rejects any request containing "bad"
+    The first `rate_limited` requests fail with a 429
+    """
+
+    def __init__(self, rate_limited: int = 0):
+        self.requests = []
+        self.rate_limited = rate_limited
+
+    def embed_content(self, model, contents):
+        self.requests.append(list(contents))
+        if self.rate_limited:
+            self.rate_limited -= 1
+            raise genai_errors.ClientError(
+                429, {"error": {"code": 429, "message": "quota exceeded"}}
+            )
+        if any("bad" in text for text in contents):
+            raise google_exceptions.InvalidArgument("invalid input")
+        if any("auth" in text for text in contents):
+            raise google_exceptions.PermissionDenied("no access")
+        return SimpleNamespace(
+            embeddings=[SimpleNamespace(values=[float(len(text))]) for text in contents]
+        )
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    monkeypatch.setattr(
+        "src.embeddings.service.settings",
+        SimpleNamespace(
+            TEXT_EMBEDDING_BATCH_SIZE=2,
+            TEXT_EMBEDDING_BATCH_TOKENS=1000,
+            TEXT_EMBEDDING_MODEL="gemini-embedding-001",
+        ),
+    )
+    # Skip Vertex AI / Qdrant initialization
+    generator = EmbeddingGenerator.__new__(EmbeddingGenerator)
+    generator.client = SimpleNamespace(models=FakeModels())
+    generator.text_dimensions = 1
+    generator.cache = None
+    return generator
+
+
+def _chunks(texts):
+    return [{"visual_description": text} for text in texts]
+
+
+def test_texts_are_batched_in_order(generator):
+    embeddings = generator.generate_text_embeddings(_chunks(["a", "bb", "ccc"]))
+
+    assert embeddings == [[1.0], [2.0], [3.0]]
+    assert generator.client.models.requests == [["a", "bb"], ["ccc"]]
+
+
+def test_failing_item_only_loses_its_own_vector(generator):
+    embeddings = generator.generate_text_embeddings(_chunks(["bad", "bb", "ccc"]))
+
+    # ["bad", "bb"] fails and is split; "bb" still gets its vector
+    assert embeddings == [[0.0], [2.0], [3.0]]
+    assert generator.client.models.requests == [["bad", "bb"], ["bad"], ["bb"], ["ccc"]]
+
+
+def test_service_errors_are_raised_without_splitting(generator):
+    with pytest.raises(google_exceptions.PermissionDenied):
+        generator.generate_text_embeddings(_chunks(["auth", "bb"]))
+
+    assert generator.client.models.requests == [["auth", "bb"]]
+
+
+def test_rate_limited_batch_is_retried(generator, monkeypatch):
+    monkeypatch.setattr("src.utils.retry.time.sleep", lambda seconds: None)
+    generator.client = SimpleNamespace(models=FakeModels(rate_limited=1))
+
+    embeddings = generator.generate_text_embeddings(_chunks(["a", "bb"]))
+
+    # Retried as a whole, not split, and no vector lost
+    assert embeddings == [[1.0], [2.0]]
+    assert generator.client.models.requests == [["a", "bb"], ["a", "bb"]]